@@ -5,8 +5,8 @@ on subsequent runs.
 """
 
 from pytest_gremlins.cache.hasher import ContentHasher
-from pytest_gremlins.cache.incremental import IncrementalCache
+from pytest_gremlins.cache.incremental import FrozenTestHashes, IncrementalCache
 from pytest_gremlins.cache.store import ResultStore
 
 
-__all__ = ['ContentHasher', 'IncrementalCache', 'ResultStore']
+__all__ = ['ContentHasher', 'FrozenTestHashes', 'IncrementalCache', 'ResultStore']
@@ -1,33 +1,137 @@
 """Content hashing for incremental analysis.
 
-Content hashing enables cache invalidation based on file content rather than
-timestamps. Files with identical content produce identical hashes, enabling
-instant cache lookups for unchanged code.
+Content hashing keys the cache on what files contain, so files with identical
+content produce identical hashes and unchanged code gets instant cache lookups.
+
+When a metadata file is configured, a file whose modification time and size
+both match the last hash is not read again; its remembered hash is returned.
+An edit that keeps both the size and the mtime (for example one restored with
+``touch -r``, or made within the filesystem's timestamp resolution) is
+therefore not detected until the file's stat changes or the metadata is cleared.
 """
 
 from __future__ import annotations
 
-import hashlib
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+import json
+import mmap
+import os
+from typing import TYPE_CHECKING, Protocol
+
 
+try:
+    import blake3
+except ImportError:  # pragma: no cover - blake3 is an optional speedup
+    _HAS_BLAKE3 = False
+else:
+    _HAS_BLAKE3 = True
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
     from pathlib import Path
 
 
+class _Hash(Protocol):
+    """The subset of the hashlib object interface ContentHasher relies on."""
+
+    def update(self, data: bytes, /) -> object: ...
+
+    def digest(self) -> bytes: ...
+
+    def hexdigest(self) -> str: ...
+
+
+# BLAKE3 when the optional blake3 package is installed, SHA-256 otherwise.
+# Both produce 32-byte digests, so key widths do not depend on the backend.
+_new_hash: Callable[..., _Hash] = blake3.blake3 if _HAS_BLAKE3 else sha256
+HASH_ALGORITHM = 'blake3' if _HAS_BLAKE3 else 'sha256'
+
+# Files at least this large are memory-mapped for hashing; a single read()
+# is cheaper than setting up a mapping for anything smaller.
+_MMAP_THRESHOLD = 64 * 1024
+
+# Below this many files, thread start-up costs more than hashing in sequence.
+_PARALLEL_HASH_THRESHOLD = 16
+
+# File metadata cache entries are stored as [mtime_ns, size, hash].
+_META_ENTRY_FIELDS = 3
+
+
+def _normalize_newlines(data: bytes) -> bytes:
+    """Translate CRLF and CR line endings to LF, as text-mode reads do.
+
+    Args:
+        data: Raw file content.
+
+    Returns:
+        The content with universal newlines applied. Returned unchanged
+        (without copying) when it contains no carriage returns.
+    """
+    if b'\r' not in data:
+        return data
+    return data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+
+def _load_meta(meta_path: Path) -> dict[str, tuple[int, int, str]]:
+    """Load a file metadata cache written by ContentHasher.save_meta().
+
+    A missing or unreadable file, or one written with a different hash
+    algorithm, yields an empty cache so every file is hashed afresh.
+
+    Args:
+        meta_path: Path to the JSON metadata file.
+
+    Returns:
+        Mapping of file path to (mtime_ns, size, hash).
+    """
+    try:
+        payload = json.loads(meta_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get('algorithm') != HASH_ALGORITHM:
+        return {}
+    files = payload.get('files')
+    if not isinstance(files, dict):
+        return {}
+    return {
+        path: (entry[0], entry[1], entry[2])
+        for path, entry in files.items()
+        if isinstance(entry, list) and len(entry) == _META_ENTRY_FIELDS
+    }
+
+
 class ContentHasher:
     """Produces content hashes for files and strings.
 
-    Uses SHA-256 to produce deterministic hashes that uniquely identify
-    content. These hashes form the cache keys for incremental analysis.
+    Uses BLAKE3 when the optional blake3 package is installed and SHA-256
+    otherwise (see HASH_ALGORITHM). Either way the hashes are deterministic
+    256-bit digests that uniquely identify content. These hashes form the
+    cache keys for incremental analysis.
 
     Example:
         >>> hasher = ContentHasher()
         >>> result = hasher.hash_string('def foo(): return 42')
-        >>> len(result) == 64  # SHA-256 produces 64 hex characters
+        >>> len(result) == 64  # 256-bit digest as 64 hex characters
         True
     """
 
+    __slots__ = ('_meta', '_meta_dirty', '_meta_path')
+
+    def __init__(self, meta_path: Path | None = None) -> None:
+        """Initialize the hasher.
+
+        Args:
+            meta_path: Optional JSON file remembering each hashed file's
+                       modification time, size and hash. When given,
+                       hash_file() returns the remembered hash for files
+                       whose stat() is unchanged instead of re-reading them.
+                       Call save_meta() to persist it.
+        """
+        self._meta_path = meta_path
+        self._meta: dict[str, tuple[int, int, str]] = _load_meta(meta_path) if meta_path is not None else {}
+        self._meta_dirty = False
+
     def hash_string(self, content: str) -> str:
         """Hash a string and return its hex digest.
 
@@ -35,47 +139,150 @@ class ContentHasher:
             content: The string content to hash.
 
         Returns:
-            A 64-character hexadecimal string (SHA-256 digest).
+            A 64-character hexadecimal string (256-bit digest).
         """
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+        return _new_hash(content.encode('utf-8')).hexdigest()
+
+    def digest_string(self, content: str) -> bytes:
+        """Hash a string and return its raw digest.
+
+        Cheaper to carry around and combine than the hex form; hexlify only
+        where a printable key is needed.
+
+        Args:
+            content: The string content to hash.
+
+        Returns:
+            The 32-byte digest.
+        """
+        return _new_hash(content.encode('utf-8')).digest()
 
     def hash_file(self, path: Path) -> str:
         """Hash a file's content and return its hex digest.
 
+        The file is hashed as raw bytes with universal newlines applied, so
+        the result matches hash_string() of its text without decoding it.
+
+        With a meta_path configured, a file whose st_mtime_ns and st_size
+        match the remembered entry is not read; the remembered hash is
+        returned. A same-size edit that leaves the mtime unchanged is
+        therefore not detected.
+
         Args:
             path: Path to the file to hash.
 
         Returns:
-            A 64-character hexadecimal string (SHA-256 digest).
+            A 64-character hexadecimal string (256-bit digest).
 
         Raises:
             FileNotFoundError: If the file does not exist.
         """
-        content = path.read_text(encoding='utf-8')
-        return self.hash_string(content)
+        if self._meta_path is None:
+            return self._hash_file_content(path)
+
+        stat = path.stat()
+        key = str(path)
+        entry = self._meta.get(key)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+
+        file_hash = self._hash_file_content(path)
+        self._meta[key] = (stat.st_mtime_ns, stat.st_size, file_hash)
+        self._meta_dirty = True
+        return file_hash
+
+    def _hash_file_content(self, path: Path) -> str:
+        """Hash a file's bytes without decoding them.
+
+        Line endings are normalized the way a text-mode read would, so the
+        result equals hash_string() of the file's text. Large files are
+        memory-mapped and fed to the hasher without an intermediate copy.
+
+        Args:
+            path: Path to the file to hash.
+
+        Returns:
+            A 64-character hexadecimal string (256-bit digest).
+        """
+        with path.open('rb') as f:
+            if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+                return _new_hash(_normalize_newlines(f.read())).hexdigest()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if mapped.find(b'\r') == -1:
+                    return _new_hash(mapped).hexdigest()
+                return _new_hash(_normalize_newlines(mapped[:])).hexdigest()
+
+    def save_meta(self) -> None:
+        """Persist the file metadata cache if hash_file() changed it.
+
+        Does nothing when the hasher was created without a meta_path.
+        """
+        if self._meta_path is None or not self._meta_dirty:
+            return
+
+        payload = {'algorithm': HASH_ALGORITHM, 'files': self._meta}
+        tmp_path = self._meta_path.with_name(self._meta_path.name + '.tmp')
+        tmp_path.write_text(json.dumps(payload), encoding='utf-8')
+        tmp_path.replace(self._meta_path)
+        self._meta_dirty = False
 
-    def hash_files(self, paths: list[Path]) -> dict[str, str]:
+    def hash_files(self, paths: list[Path], max_workers: int | None = None) -> dict[str, str]:
         """Hash multiple files and return a mapping of path to hash.
 
+        Larger batches are hashed on a thread pool. File reads and the hash
+        primitives release the GIL, so the threads overlap I/O and hashing.
+
         Args:
             paths: List of file paths to hash.
+            max_workers: Maximum number of hashing threads. Defaults to the
+                         CPU count.
 
         Returns:
-            Dictionary mapping string path to hex digest.
+            Dictionary mapping string path to hex digest, in input order.
         """
-        return {str(path): self.hash_file(path) for path in paths}
+        if len(paths) < _PARALLEL_HASH_THRESHOLD:
+            return {str(path): self.hash_file(path) for path in paths}
+
+        workers = max_workers if max_workers is not None else (os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+            file_hashes = executor.map(self.hash_file, paths)
+            return {str(path): file_hash for path, file_hash in zip(paths, file_hashes, strict=True)}
 
-    def hash_combined(self, hashes: list[str]) -> str:
+    def hash_combined(self, hashes: Iterable[str | bytes]) -> str:
         """Combine multiple hashes into a single hash.
 
         Useful for creating composite cache keys from multiple source
         files or a combination of source and test file hashes.
 
         Args:
-            hashes: List of hex digest strings to combine.
+            hashes: Hex digest strings to combine. Digests already encoded
+                    as bytes are fed to the hasher without re-encoding.
 
         Returns:
             A single 64-character hexadecimal string.
         """
-        combined = ''.join(hashes)
-        return self.hash_string(combined)
+        # Feed each digest into one hasher rather than joining them first; the
+        # result is identical to hashing the concatenation.
+        hasher = _new_hash()
+        update = hasher.update
+        for digest in hashes:
+            update(digest.encode('utf-8') if isinstance(digest, str) else digest)
+        return hasher.hexdigest()
+
+    def digest_combined(self, digests: Iterable[bytes]) -> bytes:
+        """Combine raw digests into a single raw digest.
+
+        The bytes counterpart of hash_combined(), for callers that keep
+        digests as bytes end to end.
+
+        Args:
+            digests: Raw digests to combine, in order.
+
+        Returns:
+            The 32-byte digest of the concatenated inputs.
+        """
+        hasher = _new_hash()
+        update = hasher.update
+        for digest in digests:
+            update(digest)
+        return hasher.digest()
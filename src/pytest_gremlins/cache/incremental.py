@@ -6,16 +6,97 @@ to implement smart cache invalidation based on content changes.
 
 from __future__ import annotations
 
+from collections import OrderedDict
+import logging
 from typing import TYPE_CHECKING, Any
 
-from pytest_gremlins.cache.hasher import ContentHasher
+from pytest_gremlins.cache.hasher import HASH_ALGORITHM, ContentHasher
 from pytest_gremlins.cache.store import ResultStore
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
     from pathlib import Path
 
 
+logger = logging.getLogger(__name__)
+
+# Metadata entry recording the hash algorithm behind the stored cache keys.
+_HASH_ALGORITHM_KEY = 'hash_algorithm'
+
+# Releases before the metadata entry existed always hashed with SHA-256.
+_LEGACY_HASH_ALGORITHM = 'sha256'
+
+# Hex length of the combined test hash embedded in cache keys. 128 bits is
+# ample for distinguishing test sets and keeps keys compact.
+_COMBINED_TEST_HASH_LENGTH = 32
+
+# Upper bound on memoized combined test hashes. Gremlins on the same line share
+# a test set, so a few hundred entries cover a typical run.
+_TEST_HASH_MEMO_SIZE = 256
+
+_HASHER = ContentHasher()
+
+# Upper bound on results kept in memory in front of the SQLite store.
+_RESULT_MEMO_SIZE = 4096
+
+
+def _combine_sorted_test_items(items: Iterable[tuple[str, str]]) -> str:
+    """Hash (test name, content hash) pairs that are already sorted by name.
+
+    Args:
+        items: Test name and content hash pairs, sorted by test name.
+
+    Returns:
+        Combined hash of all test names and hashes, or 'no_tests' if empty.
+    """
+    # Include both test names AND hashes for correct invalidation
+    # Renaming a test file (same content) should invalidate the cache
+    # One C-level join per pair rather than an f-string per pair.
+    joined = '|'.join(map(':'.join, items))
+    if not joined:
+        return 'no_tests'
+    return _HASHER.hash_string(joined)[:_COMBINED_TEST_HASH_LENGTH]
+
+
+class FrozenTestHashes:
+    """Immutable, pre-sorted snapshot of a test name to content hash mapping.
+
+    Accepted anywhere IncrementalCache takes test_hashes. Names and hashes are
+    kept as two parallel tuples sorted by test name, which is far smaller
+    than a dict per gremlin. The combined hash is computed on first use, so
+    one instance can be shared by every gremlin covered by the same tests.
+
+    Example:
+        >>> frozen = FrozenTestHashes({'test_b': 'h2', 'test_a': 'h1'})
+        >>> frozen.names, frozen.hashes
+        (('test_a', 'test_b'), ('h1', 'h2'))
+    """
+
+    __slots__ = ('_combined', 'hashes', 'names')
+
+    def __init__(self, test_hashes: Mapping[str, str]) -> None:
+        """Snapshot a test hash mapping.
+
+        Args:
+            test_hashes: Mapping of test name to content hash.
+        """
+        self.names: tuple[str, ...] = tuple(sorted(test_hashes))
+        self.hashes: tuple[str, ...] = tuple(test_hashes[name] for name in self.names)
+        self._combined: str | None = None
+
+    @property
+    def combined(self) -> str:
+        """Combined hash of the snapshot, as embedded in cache keys."""
+        if self._combined is None:
+            self._combined = _combine_sorted_test_items(zip(self.names, self.hashes, strict=True))
+        return self._combined
+
+    def __len__(self) -> int:
+        """Return the number of tests in the snapshot."""
+        return len(self.names)
+
+
 class IncrementalCache:
     """Coordinator for incremental analysis caching.
 
@@ -30,9 +111,19 @@ class IncrementalCache:
 
     The cache key is composed of:
     - gremlin_id: Unique identifier for the mutation
-    - source_hash: SHA-256 hash of the source file content
+    - source_hash: Content hash of the source file
     - test_hashes: Combined hash of all test files covering this gremlin
 
+    Callers checking many gremlins against the same tests should build the
+    test_hashes once and pass it for every gremlin, ideally wrapped in a
+    FrozenTestHashes so the sort and hash happen only once.
+
+    Recently read or written results are kept in a bounded in-memory LRU in
+    front of the SQLite store. The layer keeps its own copies, so changing a
+    result dict before or after caching it does not affect later hits. It is
+    private to this instance: writes made through another connection to the
+    same store are not seen for keys already held in memory.
+
     Example:
         >>> from pathlib import Path
         >>> cache = IncrementalCache(Path('.gremlins_cache'))
@@ -42,23 +133,110 @@ class IncrementalCache:
         >>> cache.close()
     """
 
-    def __init__(self, cache_dir: Path) -> None:
+    # Slots keep the hit/miss counters and memo lookups on the hot path to
+    # plain attribute access.
+    __slots__ = (
+        '_cache_dir',
+        '_hasher',
+        '_hits',
+        '_last_test_hashes',
+        '_memory_hits',
+        '_misses',
+        '_result_memo',
+        '_store',
+        '_test_hash_memo',
+    )
+
+    def __init__(self, cache_dir: Path, synchronous: str = 'NORMAL', exclusive: bool = False) -> None:
         """Initialize the incremental cache.
 
         Args:
             cache_dir: Directory to store cache files.
+            synchronous: SQLite synchronous mode for the result store. Use
+                         'FULL' to fsync on every commit.
+            exclusive: Keep the result store locked for the cache's lifetime.
+                       Only safe when no other process uses the same cache.
         """
         self._cache_dir = cache_dir
-        self._hasher = ContentHasher()
-        self._store = ResultStore(cache_dir / 'results.db')
+        self._hasher = ContentHasher(meta_path=cache_dir / 'file_meta.json')
+        self._store = ResultStore(cache_dir / 'results.db', synchronous=synchronous, exclusive=exclusive)
+        self._check_hash_algorithm()
         self._hits = 0
         self._misses = 0
+        self._test_hash_memo: OrderedDict[frozenset[tuple[str, str]], str] = OrderedDict()
+        # Most recently used results by cache key, in front of the store.
+        self._result_memo: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._memory_hits = 0
+        # (mapping passed last, snapshot of its contents, combined hash)
+        self._last_test_hashes: tuple[dict[str, str], dict[str, str], str] | None = None
+
+    def _check_hash_algorithm(self) -> None:
+        """Clear stored results whose keys were built with another hash algorithm.
+
+        Content hashes, and so every cache key, depend on whether the
+        optional blake3 package is installed. A cache written under the
+        other algorithm would never hit, so it is cleared once with a
+        warning and the current algorithm is recorded.
+        """
+        stored = self._store.get_metadata(_HASH_ALGORITHM_KEY)
+        if stored == HASH_ALGORITHM:
+            return
+        if stored is None and self._store.count() == 0:
+            self._store.set_metadata(_HASH_ALGORITHM_KEY, HASH_ALGORITHM)
+            return
+        previous = stored or _LEGACY_HASH_ALGORITHM
+        if previous != HASH_ALGORITHM:
+            logger.warning(
+                'Cached results in %s were keyed with %s, now hashing with %s; clearing the result cache',
+                self._cache_dir,
+                previous,
+                HASH_ALGORITHM,
+            )
+            self._store.clear()
+        self._store.set_metadata(_HASH_ALGORITHM_KEY, HASH_ALGORITHM)
+
+    def _combine_test_hashes(self, test_hashes: dict[str, str] | FrozenTestHashes) -> str:
+        """Combine test names and hashes into a single order-independent hash.
+
+        Results are memoized on the mapping's content, so gremlins sharing
+        the same tests skip the sort and re-hash on every lookup. Passing
+        the same dict again takes a cheaper path that only compares it with
+        a snapshot, without building the frozenset memo key. A
+        FrozenTestHashes carries its own combined hash and skips the memo.
+
+        Args:
+            test_hashes: Mapping of test name to content hash.
+
+        Returns:
+            Combined hash of all test names and hashes, or 'no_tests' if empty.
+        """
+        if isinstance(test_hashes, FrozenTestHashes):
+            return test_hashes.combined
+        if not test_hashes:
+            return 'no_tests'
+
+        last = self._last_test_hashes
+        if last is not None and last[0] is test_hashes and last[1] == test_hashes:
+            return last[2]
+
+        memo_key = frozenset(test_hashes.items())
+        combined = self._test_hash_memo.get(memo_key)
+        if combined is not None:
+            self._test_hash_memo.move_to_end(memo_key)
+        else:
+            combined = _combine_sorted_test_items(sorted(test_hashes.items()))
+            self._test_hash_memo[memo_key] = combined
+            if len(self._test_hash_memo) > _TEST_HASH_MEMO_SIZE:
+                self._test_hash_memo.popitem(last=False)
+
+        self._last_test_hashes = (test_hashes, dict(test_hashes), combined)
+        return combined
 
     def _build_cache_key(
         self,
         gremlin_id: str,
-        source_hash: str,
-        test_hashes: dict[str, str],
+        source_hash: str | bytes,
+        test_hashes: dict[str, str] | FrozenTestHashes,
     ) -> str:
         """Build a cache key from gremlin and content hashes.
 
@@ -69,24 +247,23 @@ class IncrementalCache:
 
         Args:
             gremlin_id: Unique identifier for the gremlin.
-            source_hash: SHA-256 hash of the source file.
+            source_hash: Content hash of the source file, either as a hex
+                string or as a raw digest. Raw digests are hexlified here,
+                so both forms produce the same key.
             test_hashes: Mapping of test name to content hash.
 
         Returns:
             A cache key string.
         """
-        # Include both test names AND hashes for correct invalidation
-        # Renaming a test file (same content) should invalidate the cache
-        sorted_test_items = [f'{name}:{test_hashes[name]}' for name in sorted(test_hashes.keys())]
-        combined_test_hash = self._hasher.hash_string('|'.join(sorted_test_items)) if sorted_test_items else 'no_tests'
-
-        return f'{gremlin_id}:{source_hash}:{combined_test_hash}'
+        if isinstance(source_hash, bytes):
+            source_hash = source_hash.hex()
+        return f'{gremlin_id}:{source_hash}:{self._combine_test_hashes(test_hashes)}'
 
     def get_cached_result(
         self,
         gremlin_id: str,
-        source_hash: str,
-        test_hashes: dict[str, str],
+        source_hash: str | bytes,
+        test_hashes: dict[str, str] | FrozenTestHashes,
     ) -> dict[str, Any] | None:
         """Retrieve a cached result if available.
 
@@ -98,27 +275,78 @@ class IncrementalCache:
 
         Args:
             gremlin_id: Unique identifier for the gremlin.
-            source_hash: Current SHA-256 hash of the source file.
+            source_hash: Current content hash of the source file.
             test_hashes: Current mapping of test name to content hash.
 
         Returns:
             Cached result dictionary, or None if cache miss.
         """
         cache_key = self._build_cache_key(gremlin_id, source_hash, test_hashes)
+        result = self._result_memo.get(cache_key)
+        if result is not None:
+            self._result_memo.move_to_end(cache_key)
+            self._memory_hits += 1
+            self._hits += 1
+            return dict(result)
+
         result = self._store.get(cache_key)
 
         if result is None:
             self._misses += 1
         else:
             self._hits += 1
+            self._remember(cache_key, result)
 
         return result
 
+    def get_cached_results(
+        self,
+        requests: Sequence[tuple[str, str | bytes, dict[str, str] | FrozenTestHashes]],
+    ) -> dict[str, dict[str, Any]]:
+        """Retrieve cached results for many gremlins in one lookup.
+
+        Builds every cache key up front, answers what it can from memory
+        and fetches the rest with a single store query instead of one query
+        per gremlin.
+
+        Args:
+            requests: Sequence of (gremlin_id, source_hash, test_hashes)
+                tuples, as accepted by get_cached_result().
+
+        Returns:
+            Mapping of gremlin_id to cached result for every cache hit.
+            Gremlins that miss the cache are omitted.
+        """
+        key_to_gremlin = {
+            self._build_cache_key(gremlin_id, source_hash, test_hashes): gremlin_id
+            for gremlin_id, source_hash, test_hashes in requests
+        }
+
+        found: dict[str, dict[str, Any]] = {}
+        missing: list[str] = []
+        for cache_key in key_to_gremlin:
+            result = self._result_memo.get(cache_key)
+            if result is None:
+                missing.append(cache_key)
+            else:
+                self._result_memo.move_to_end(cache_key)
+                found[cache_key] = dict(result)
+        self._memory_hits += len(found)
+
+        for cache_key, result in self._store.get_many(missing).items():
+            found[cache_key] = result
+            self._remember(cache_key, result)
+
+        self._hits += len(found)
+        self._misses += len(key_to_gremlin) - len(found)
+
+        return {key_to_gremlin[cache_key]: result for cache_key, result in found.items()}
+
     def cache_result(
         self,
         gremlin_id: str,
-        source_hash: str,
-        test_hashes: dict[str, str],
+        source_hash: str | bytes,
+        test_hashes: dict[str, str] | FrozenTestHashes,
         result: dict[str, Any],
     ) -> None:
         """Cache a gremlin test result.
@@ -129,18 +357,37 @@ class IncrementalCache:
 
         Args:
             gremlin_id: Unique identifier for the gremlin.
-            source_hash: SHA-256 hash of the source file.
+            source_hash: Content hash of the source file.
             test_hashes: Mapping of test name to content hash.
             result: The result dictionary to cache.
         """
         cache_key = self._build_cache_key(gremlin_id, source_hash, test_hashes)
         self._store.put(cache_key, result)
+        self._remember(cache_key, result)
+
+    def cache_results(
+        self,
+        items: Iterable[tuple[str, str | bytes, dict[str, str] | FrozenTestHashes, dict[str, Any]]],
+    ) -> None:
+        """Cache many gremlin results in a single transaction.
+
+        Args:
+            items: Iterable of (gremlin_id, source_hash, test_hashes, result)
+                tuples, as accepted by cache_result().
+        """
+        rows = [
+            (self._build_cache_key(gremlin_id, source_hash, test_hashes), result)
+            for gremlin_id, source_hash, test_hashes, result in items
+        ]
+        self._store.put_many(rows)
+        for cache_key, result in rows:
+            self._remember(cache_key, result)
 
     def cache_result_deferred(
         self,
         gremlin_id: str,
-        source_hash: str,
-        test_hashes: dict[str, str],
+        source_hash: str | bytes,
+        test_hashes: dict[str, str] | FrozenTestHashes,
         result: dict[str, Any],
     ) -> None:
         """Cache a gremlin test result without committing immediately.
@@ -150,12 +397,45 @@ class IncrementalCache:
 
         Args:
             gremlin_id: Unique identifier for the gremlin.
-            source_hash: SHA-256 hash of the source file.
+            source_hash: Content hash of the source file.
             test_hashes: Mapping of test name to content hash.
             result: The result dictionary to cache.
         """
         cache_key = self._build_cache_key(gremlin_id, source_hash, test_hashes)
         self._store.put_deferred(cache_key, result)
+        self._remember(cache_key, result)
+
+    def _remember(self, cache_key: str, result: dict[str, Any]) -> None:
+        """Keep a copy of a result in the in-memory LRU, evicting the oldest entry when full.
+
+        Results are flat dicts of scalars, so a shallow copy fully detaches
+        the remembered result from the caller's dict.
+
+        Args:
+            cache_key: The cache key of the result.
+            result: The result dictionary.
+        """
+        self._result_memo[cache_key] = dict(result)
+        self._result_memo.move_to_end(cache_key)
+        if len(self._result_memo) > _RESULT_MEMO_SIZE:
+            self._result_memo.popitem(last=False)
+
+    def hash_file(self, path: Path) -> str:
+        """Hash a file's content, skipping the read if it is unchanged.
+
+        Files whose modification time and size match the previous run reuse
+        the hash remembered in the cache directory's file_meta.json.
+
+        Args:
+            path: Path to the file to hash.
+
+        Returns:
+            The file's content hash.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        return self._hasher.hash_file(path)
 
     def flush(self) -> None:
         """Commit all pending deferred cache writes."""
@@ -171,11 +451,16 @@ class IncrementalCache:
         Args:
             file_prefix: Prefix to match in gremlin IDs.
         """
-        self._store.delete_by_prefix(f'{file_prefix}:')
+        key_prefix = f'{file_prefix}:'
+        self._store.delete_by_prefix(key_prefix)
+        for cache_key in [key for key in self._result_memo if key.startswith(key_prefix)]:
+            del self._result_memo[cache_key]
 
     def clear(self) -> None:
         """Remove all cached results."""
         self._store.clear()
+        self._result_memo.clear()
+        self._memory_hits = 0
         self._hits = 0
         self._misses = 0
 
@@ -183,16 +468,23 @@ class IncrementalCache:
         """Get cache statistics.
 
         Returns:
-            Dictionary with hits, misses, and total_entries counts.
+            Dictionary with hits, misses, and total_entries counts. hits
+            includes memory_hits, the lookups answered by the in-memory
+            layer without querying the store.
         """
         return {
             'hits': self._hits,
             'misses': self._misses,
+            'memory_hits': self._memory_hits,
             'total_entries': self._store.count(),
         }
 
     def close(self) -> None:
-        """Close the cache and release resources."""
+        """Close the cache and release resources.
+
+        Persists the file metadata cache alongside the result database.
+        """
+        self._hasher.save_meta()
         self._store.close()
 
     def __enter__(self) -> IncrementalCache:
@@ -10,20 +10,121 @@ from __future__ import annotations
 import json
 import logging
 import sqlite3
+import sys
 from typing import TYPE_CHECKING, Any
 
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _HAS_ORJSON = False
+else:
+    _HAS_ORJSON = True
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
     from pathlib import Path
 
 
 logger = logging.getLogger(__name__)
 
+# Allowed values for PRAGMA synchronous. With WAL journaling, NORMAL only
+# syncs at checkpoints, which is durable enough for a rebuildable cache.
+_SYNCHRONOUS_MODES = frozenset({'OFF', 'NORMAL', 'FULL', 'EXTRA'})
+
+# Let SQLite read the database through a memory map of up to 256 MiB.
+# Builds compiled without mmap support ignore this silently. 32-bit processes
+# skip it: a mapping that size competes for their limited address space.
+_MMAP_SIZE = 256 * 1024 * 1024 if sys.maxsize > 2**32 else 0
+
+# Page size for newly created databases. Only takes effect before the file
+# is first written; existing databases keep the page size they were made with.
+_PAGE_SIZE = 8192
+
+# Keys per IN query in get_many. Older SQLite builds cap bound parameters
+# at 999 per statement, so stay well below that.
+_MAX_QUERY_PARAMS = 500
+
+# Deferred writes buffered before put_deferred() commits them on its own.
+# Bounds memory and how much a crashed run loses; each batch is a single
+# append to the WAL, so flushing early costs little.
+_MAX_PENDING_WRITES = 1000
+
+# Page cache size; negative values are KiB rather than pages (64 MiB). SQLite
+# allocates pages on demand, so small stores never use the full amount.
+_CACHE_SIZE_KIB = -65536
+
+_MAX_CODE_POINT = 0x10FFFF
+_SURROGATES = range(0xD800, 0xE000)
+
+# Compiled statements kept per connection (the sqlite3 default is 128).
+_CACHED_STATEMENTS = 256
+
+_SELECT_RESULT_SQL = 'SELECT result_json FROM results WHERE cache_key = ?'
+_HAS_KEY_SQL = 'SELECT 1 FROM results WHERE cache_key = ?'
+_INSERT_SQL = 'INSERT OR REPLACE INTO results (cache_key, result_json) VALUES (?, ?)'
+
+
+def _dumps(result: dict[str, Any]) -> bytes:
+    """Serialize a result dictionary for storage.
+
+    Uses orjson when it is installed and falls back to the standard library
+    json module otherwise. Both produce plain JSON, so databases written with
+    either encoder stay readable by the other.
+
+    Args:
+        result: The result dictionary to serialize.
+
+    Returns:
+        The UTF-8 encoded JSON document.
+    """
+    if _HAS_ORJSON:
+        return orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(result).encode()
+
+
+def _loads(data: bytes | str) -> dict[str, Any]:
+    """Deserialize a stored result.
+
+    Args:
+        data: JSON document as stored in the database. Rows written by older
+              versions are TEXT, newer ones are BLOB; both are accepted.
+
+    Returns:
+        The decoded result dictionary.
+    """
+    result: dict[str, Any] = orjson.loads(data) if _HAS_ORJSON else json.loads(data)
+    return result
+
+
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """Return the smallest string sorting after every string with this prefix.
+
+    SQLite compares TEXT as UTF-8 bytes, which orders like code points, so
+    incrementing the last character that can be incremented gives an
+    exclusive upper bound for a prefix range query.
+
+    Args:
+        prefix: A non-empty key prefix.
+
+    Returns:
+        The exclusive upper bound, or None if no string sorts after the
+        prefix range (the prefix consists only of U+10FFFF).
+    """
+    stripped = prefix.rstrip(chr(_MAX_CODE_POINT))
+    if not stripped:
+        return None
+    next_code_point = ord(stripped[-1]) + 1
+    if next_code_point in _SURROGATES:
+        next_code_point = _SURROGATES.stop
+    return stripped[:-1] + chr(next_code_point)
+
 
 class ResultStore:
     """SQLite-backed cache for gremlin test results.
 
-    Stores results as JSON blobs indexed by content-based cache keys.
+    Stores results as JSON blobs indexed by content-based cache keys. JSON
+    encoding goes through orjson when it is installed.
     Keys are typically composed of source file hash + test file hash +
     gremlin definition.
 
@@ -36,35 +137,69 @@ class ResultStore:
         >>> store.close()
     """
 
-    def __init__(self, db_path: Path) -> None:
+    def __init__(self, db_path: Path, synchronous: str = 'NORMAL', exclusive: bool = False) -> None:
         """Initialize the result store.
 
         If the database file is corrupted, it will be deleted and a fresh
         database will be created. A warning will be logged in this case.
 
+        The database uses WAL journaling with an in-memory temp store and
+        memory-mapped reads, so commits are cheap log appends.
+
         Args:
             db_path: Path to the SQLite database file. Parent directories
                      will be created if they don't exist.
+            synchronous: SQLite synchronous mode ('OFF', 'NORMAL', 'FULL'
+                         or 'EXTRA'). Use 'FULL' to fsync on every commit.
+            exclusive: Hold the database lock for the lifetime of the
+                       connection instead of per transaction. Saves the
+                       lock calls on every read and commit, but no other
+                       connection can open the database meanwhile.
+
+        Raises:
+            ValueError: If synchronous is not a valid SQLite mode.
         """
+        synchronous = synchronous.upper()
+        if synchronous not in _SYNCHRONOUS_MODES:
+            msg = f'Invalid synchronous mode {synchronous!r}, expected one of {sorted(_SYNCHRONOUS_MODES)}'
+            raise ValueError(msg)
         db_path.parent.mkdir(parents=True, exist_ok=True)
         self._db_path = db_path
+        self._synchronous = synchronous
+        self._exclusive = exclusive
         self._conn = self._open_or_recreate_db()
-        self._pending_writes: list[tuple[str, str]] = []
+        # Point lookups and single writes run once per gremlin; reuse one cursor
+        # for each instead of allocating a fresh one through Connection.execute.
+        self._lookup_cursor = self._conn.cursor()
+        self._write_cursor = self._conn.cursor()
+        self._pending_writes: list[tuple[str, bytes]] = []
 
     def _open_or_recreate_db(self) -> sqlite3.Connection:
         """Open the database, recreating it if corrupted.
 
-        Attempts to connect to the database and initialize the schema.
-        If a DatabaseError occurs (indicating corruption), the file is
-        deleted and a fresh database is created.
+        Attempts to connect to the database, initialize the schema and run
+        a quick integrity check. If any step raises a DatabaseError or the
+        check reports damage, the file is deleted and a fresh database is
+        created, so corruption is handled here rather than on a later read.
+        Operational errors such as a lock held by another connection are
+        raised unchanged; the file is intact and must not be deleted.
+
+        The connection runs in autocommit mode: single statements commit on
+        their own and batch writes manage their transaction explicitly.
 
         Returns:
             An open SQLite connection with initialized schema.
         """
         conn: sqlite3.Connection | None = None
         try:
-            conn = sqlite3.connect(str(self._db_path))
+            conn = self._connect()
+            self._configure_conn(conn)
             self._init_schema_on_conn(conn)
+            self._check_integrity(conn)
+        except sqlite3.OperationalError:
+            if conn is not None:  # pragma: no branch
+                conn.close()
+            raise
         except sqlite3.DatabaseError:
             logger.warning(
                 'Cache database corrupted at %s, recreating',
@@ -73,13 +208,74 @@ class ResultStore:
             if conn is not None:  # pragma: no branch
                 conn.close()
             self._db_path.unlink(missing_ok=True)
-            conn = sqlite3.connect(str(self._db_path))
+            for suffix in ('-wal', '-shm'):
+                self._db_path.with_name(self._db_path.name + suffix).unlink(missing_ok=True)
+            conn = self._connect()
+            self._configure_conn(conn)
             self._init_schema_on_conn(conn)
         return conn
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open an autocommit connection with a larger statement cache.
+
+        Returns:
+            A new SQLite connection to the store's database file.
+        """
+        return sqlite3.connect(str(self._db_path), isolation_level=None, cached_statements=_CACHED_STATEMENTS)
+
+    def _configure_conn(self, conn: sqlite3.Connection) -> None:
+        """Apply journaling and I/O PRAGMAs to a new connection.
+
+        Args:
+            conn: The database connection to configure.
+        """
+        # page_size must come first: switching to WAL writes the header.
+        conn.execute(f'PRAGMA page_size={_PAGE_SIZE}')
+        if self._exclusive:
+            # Set before WAL so the WAL index lives in heap memory, not -shm.
+            conn.execute('PRAGMA locking_mode=EXCLUSIVE')
+        journal_mode = conn.execute('PRAGMA journal_mode=WAL').fetchone()[0]
+        if journal_mode != 'wal':
+            # Some filesystems (e.g. network mounts) cannot host the WAL
+            # shared-memory file; SQLite then keeps its previous mode.
+            logger.debug('WAL journaling unavailable for %s, using %s', self._db_path, journal_mode)
+        conn.execute(f'PRAGMA synchronous={self._synchronous}')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute(f'PRAGMA mmap_size={_MMAP_SIZE}')
+        conn.execute(f'PRAGMA cache_size={_CACHE_SIZE_KIB}')
+        conn.execute('PRAGMA cache_spill=0')
+
+    def _check_integrity(self, conn: sqlite3.Connection) -> None:
+        """Verify the database pages with PRAGMA quick_check.
+
+        Damage past the file header does not fail on open, only when a
+        query reaches the bad page. The check reads every page, so its
+        cost grows with the size of the cache: roughly a millisecond per
+        megabyte when the file is in the OS page cache, more on a cold
+        read. It runs once per open, not per query.
+
+        Args:
+            conn: The database connection to check.
+
+        Raises:
+            sqlite3.DatabaseError: If the check finds any problem.
+        """
+        status = conn.execute('PRAGMA quick_check(1)').fetchone()[0]
+        if status != 'ok':
+            msg = f'integrity check failed: {status}'
+            raise sqlite3.DatabaseError(msg)
+
     def _init_schema_on_conn(self, conn: sqlite3.Connection) -> None:
         """Create the results table if it doesn't exist.
 
+        The table is a WITHOUT ROWID table clustered on cache_key, so each
+        write updates one B-tree instead of a rowid table plus a key index.
+        Databases created before this keep their original layout; every
+        query works the same against both.
+
+        A small metadata table holds named values describing the stored
+        results, such as the hash algorithm their keys were built with.
+
         Args:
             conn: The database connection to initialize.
         """
@@ -87,9 +283,14 @@ class ResultStore:
             CREATE TABLE IF NOT EXISTS results (
                 cache_key TEXT PRIMARY KEY,
                 result_json TEXT NOT NULL
-            )
+            ) WITHOUT ROWID
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS metadata (
+                name TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            ) WITHOUT ROWID
         """)
-        conn.commit()
 
     def get(self, cache_key: str) -> dict[str, Any] | None:
         """Retrieve a cached result by key.
@@ -100,15 +301,35 @@ class ResultStore:
         Returns:
             The cached result dictionary, or None if not found.
         """
-        cursor = self._conn.execute(
-            'SELECT result_json FROM results WHERE cache_key = ?',
-            (cache_key,),
-        )
-        row = cursor.fetchone()
+        row = self._lookup_cursor.execute(_SELECT_RESULT_SQL, (cache_key,)).fetchone()
         if row is None:
             return None
-        result: dict[str, Any] = json.loads(row[0])
-        return result
+        return _loads(row[0])
+
+    def get_many(self, cache_keys: Sequence[str]) -> dict[str, dict[str, Any]]:
+        """Retrieve several cached results with as few queries as possible.
+
+        Keys are looked up with one IN query per chunk of
+        _MAX_QUERY_PARAMS keys, which keeps every query under SQLite's
+        bound-parameter limit.
+
+        Args:
+            cache_keys: The content-based cache keys to look up.
+
+        Returns:
+            Mapping of cache key to cached result for every key that was
+            found. Missing keys are omitted.
+        """
+        found: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(cache_keys), _MAX_QUERY_PARAMS):
+            chunk = tuple(cache_keys[start : start + _MAX_QUERY_PARAMS])
+            placeholders = ', '.join('?' * len(chunk))
+            cursor = self._conn.execute(
+                f'SELECT cache_key, result_json FROM results WHERE cache_key IN ({placeholders})',  # noqa: S608
+                chunk,
+            )
+            found.update((cache_key, _loads(result_json)) for cache_key, result_json in cursor.fetchall())
+        return found
 
     def put(self, cache_key: str, result: dict[str, Any]) -> None:
         """Store a result in the cache.
@@ -117,25 +338,33 @@ class ResultStore:
             cache_key: The content-based cache key.
             result: The result dictionary to cache.
         """
-        result_json = json.dumps(result)
-        self._conn.execute(
-            'INSERT OR REPLACE INTO results (cache_key, result_json) VALUES (?, ?)',
-            (cache_key, result_json),
-        )
-        self._conn.commit()
+        result_json = _dumps(result)
+        self._write_cursor.execute(_INSERT_SQL, (cache_key, result_json))
+
+    def put_many(self, items: Iterable[tuple[str, dict[str, Any]]]) -> None:
+        """Store several results in a single transaction.
+
+        Args:
+            items: Iterable of (cache_key, result) pairs to store.
+        """
+        self._write_rows([(cache_key, _dumps(result)) for cache_key, result in items])
 
     def put_deferred(self, cache_key: str, result: dict[str, Any]) -> None:
         """Store a result without committing immediately.
 
         Results are batched and committed on flush() or close(). This is
-        faster for bulk inserts as it reduces commit overhead.
+        faster for bulk inserts as it reduces commit overhead. Once
+        _MAX_PENDING_WRITES results are waiting, the batch is committed
+        immediately so the buffer stays bounded.
 
         Args:
             cache_key: The content-based cache key.
             result: The result dictionary to cache.
         """
-        result_json = json.dumps(result)
+        result_json = _dumps(result)
         self._pending_writes.append((cache_key, result_json))
+        if len(self._pending_writes) >= _MAX_PENDING_WRITES:
+            self.flush()
 
     def flush(self) -> None:
         """Commit all pending deferred writes.
@@ -143,15 +372,28 @@ class ResultStore:
         This commits any results added via put_deferred() in a single
         transaction, which is much faster than individual commits.
         """
-        if not self._pending_writes:
+        self._write_rows(self._pending_writes)
+        self._pending_writes.clear()
+
+    def _write_rows(self, rows: list[tuple[str, bytes]]) -> None:
+        """Insert serialized rows in one explicit transaction.
+
+        The batch costs one commit (and one WAL sync) regardless of the
+        number of rows. If any insert fails, the whole batch is rolled back.
+
+        Args:
+            rows: (cache_key, serialized result) pairs to insert.
+        """
+        if not rows:
             return
 
-        self._conn.executemany(
-            'INSERT OR REPLACE INTO results (cache_key, result_json) VALUES (?, ?)',
-            self._pending_writes,
-        )
-        self._conn.commit()
-        self._pending_writes.clear()
+        self._conn.execute('BEGIN IMMEDIATE')
+        try:
+            self._conn.executemany(_INSERT_SQL, rows)
+        except BaseException:
+            self._conn.execute('ROLLBACK')
+            raise
+        self._conn.execute('COMMIT')
 
     def delete(self, cache_key: str) -> None:
         """Remove a result from the cache.
@@ -160,31 +402,60 @@ class ResultStore:
             cache_key: The cache key to remove.
         """
         self._conn.execute('DELETE FROM results WHERE cache_key = ?', (cache_key,))
-        self._conn.commit()
 
     def delete_by_prefix(self, prefix: str) -> None:
         """Remove all results with keys matching a prefix.
 
         Useful for invalidating all gremlins in a specific file when
-        that file's content changes.
+        that file's content changes. Matching is exact and case-sensitive,
+        and runs as a range query on the primary key index.
 
         Args:
             prefix: The key prefix to match. All keys starting with
                     this prefix will be deleted.
         """
-        # Escape LIKE metacharacters (%, _) in the prefix to treat them as literals.
-        # Use backslash as the escape character (specified in ESCAPE clause).
-        escaped_prefix = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
-        self._conn.execute(
-            "DELETE FROM results WHERE cache_key LIKE ? ESCAPE '\\'",
-            (escaped_prefix + '%',),
-        )
-        self._conn.commit()
+        if not prefix:
+            self.clear()
+            return
+
+        # Keys sharing the prefix form one contiguous range in the primary key
+        # index, so a range delete touches only the matching rows instead of
+        # scanning the table the way LIKE does.
+        upper_bound = _prefix_upper_bound(prefix)
+        if upper_bound is None:
+            self._conn.execute('DELETE FROM results WHERE cache_key >= ?', (prefix,))
+        else:
+            self._conn.execute(
+                'DELETE FROM results WHERE cache_key >= ? AND cache_key < ?',
+                (prefix, upper_bound),
+            )
+
+    def get_metadata(self, name: str) -> str | None:
+        """Read a named metadata value.
+
+        Args:
+            name: The metadata name.
+
+        Returns:
+            The stored value, or None if it was never set.
+        """
+        row = self._conn.execute('SELECT value FROM metadata WHERE name = ?', (name,)).fetchone()
+        return None if row is None else str(row[0])
+
+    def set_metadata(self, name: str, value: str) -> None:
+        """Store a named metadata value, replacing any previous one.
+
+        Metadata is kept apart from results and survives clear().
+
+        Args:
+            name: The metadata name.
+            value: The value to store.
+        """
+        self._conn.execute('INSERT OR REPLACE INTO metadata (name, value) VALUES (?, ?)', (name, value))
 
     def clear(self) -> None:
         """Remove all entries from the cache."""
         self._conn.execute('DELETE FROM results')
-        self._conn.commit()
 
     def has(self, cache_key: str) -> bool:
         """Check if a key exists in the cache.
@@ -195,11 +466,7 @@ class ResultStore:
         Returns:
             True if the key exists, False otherwise.
         """
-        cursor = self._conn.execute(
-            'SELECT 1 FROM results WHERE cache_key = ?',
-            (cache_key,),
-        )
-        return cursor.fetchone() is not None
+        return self._lookup_cursor.execute(_HAS_KEY_SQL, (cache_key,)).fetchone() is not None
 
     def keys(self) -> list[str]:
         """Get all cache keys.
@@ -210,6 +477,19 @@ class ResultStore:
         cursor = self._conn.execute('SELECT cache_key FROM results')
         return [row[0] for row in cursor.fetchall()]
 
+    def iter_keys(self) -> Iterator[str]:
+        """Iterate over cache keys without loading them all at once.
+
+        Rows are streamed from the primary key index, so memory use does not
+        grow with the size of the cache. Writing to the store while the
+        iterator is live may or may not show the new keys.
+
+        Yields:
+            Each cache key currently stored, in key order.
+        """
+        for (cache_key,) in self._conn.execute('SELECT cache_key FROM results ORDER BY cache_key'):
+            yield cache_key
+
     def count(self) -> int:
         """Get the number of cached entries.
 
@@ -7,15 +7,16 @@ section and provides sensible defaults when configuration is absent.
 from __future__ import annotations
 
 from dataclasses import dataclass
-import tomllib
-from typing import TYPE_CHECKING
+import functools
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Mapping
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GremlinConfig:
     """Configuration for pytest-gremlins.
 
@@ -33,6 +34,55 @@ class GremlinConfig:
     exclude: list[str] | None = None
 
 
+@functools.lru_cache(maxsize=8)
+def _load_pyproject(path: str, mtime_ns: int, size: int) -> dict[str, Any]:  # noqa: ARG001
+    """Parse pyproject.toml.
+
+    Memoized on the file's path, modification time and size, so repeated
+    loads of an unchanged file skip parsing while edits are picked up.
+
+    Args:
+        path: Path to pyproject.toml.
+        mtime_ns: The file's modification time; part of the cache key only.
+        size: The file's size in bytes; part of the cache key only.
+
+    Returns:
+        The parsed TOML document.
+    """
+    # Imported here so projects without a pyproject.toml never load the parser.
+    import tomllib  # noqa: PLC0415
+
+    with Path(path).open('rb') as f:
+        return tomllib.load(f)
+
+
+def _copy_list(value: list[str] | None) -> list[str] | None:
+    """Copy a list from the memoized document so callers cannot mutate the cache."""
+    return None if value is None else list(value)
+
+
+def load_config_from_mapping(data: Mapping[str, Any]) -> GremlinConfig:
+    """Build configuration from an already-parsed pyproject.toml document.
+
+    Args:
+        data: The parsed TOML document, as returned by tomllib.
+
+    Returns:
+        GremlinConfig with values from [tool.pytest-gremlins] or defaults.
+
+    Example:
+        >>> load_config_from_mapping({'tool': {'pytest-gremlins': {'paths': ['src']}}})
+        GremlinConfig(operators=None, paths=['src'], exclude=None)
+    """
+    tool_config = data.get('tool', {}).get('pytest-gremlins', {})
+
+    return GremlinConfig(
+        operators=_copy_list(tool_config.get('operators')),
+        paths=_copy_list(tool_config.get('paths')),
+        exclude=_copy_list(tool_config.get('exclude')),
+    )
+
+
 def load_config(rootdir: Path) -> GremlinConfig:
     """Load configuration from pyproject.toml.
 
@@ -48,19 +98,29 @@ def load_config(rootdir: Path) -> GremlinConfig:
     """
     pyproject_path = rootdir / 'pyproject.toml'
 
-    if not pyproject_path.exists():
+    # A single stat both detects a missing file and keys the parse cache.
+    try:
+        stat = pyproject_path.stat()
+        data = _load_pyproject(str(pyproject_path), stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
         return GremlinConfig()
 
-    with pyproject_path.open('rb') as f:
-        data = tomllib.load(f)
+    return load_config_from_mapping(data)
 
-    tool_config = data.get('tool', {}).get('pytest-gremlins', {})
 
-    return GremlinConfig(
-        operators=tool_config.get('operators'),
-        paths=tool_config.get('paths'),
-        exclude=tool_config.get('exclude'),
-    )
+def _split_csv(value: str | None) -> list[str] | None:
+    """Split a comma-separated CLI value into stripped, non-empty items.
+
+    Args:
+        value: The raw option value, or None if the option was not given.
+
+    Returns:
+        The items in order, or None if the value holds no items at all.
+    """
+    if not value:
+        return None
+    items = [item for item in map(str.strip, value.split(',')) if item]
+    return items or None
 
 
 def merge_configs(
@@ -81,16 +141,12 @@ def merge_configs(
     Returns:
         GremlinConfig with CLI values overriding file config where provided.
     """
-    operators: list[str] | None = None
-    if cli_operators and cli_operators.strip():
-        operators = [op.strip() for op in cli_operators.split(',')]
-    elif file_config.operators is not None:
+    operators = _split_csv(cli_operators)
+    if operators is None:
         operators = file_config.operators
 
-    paths: list[str] | None = None
-    if cli_targets and cli_targets.strip():
-        paths = [p.strip() for p in cli_targets.split(',')]
-    elif file_config.paths is not None:
+    paths = _split_csv(cli_targets)
+    if paths is None:
         paths = file_config.paths
 
     return GremlinConfig(
@@ -68,10 +68,7 @@ class CoverageCollector:
             coverage_data: Dict mapping file paths to lists of line numbers.
         """
         self.recorded_tests.add(test_name)
-        for file_path, lines in coverage_data.items():
-            for line_number in lines:
-                self.coverage_map.add(file_path, line_number, test_name)
-                self._total_mappings += 1
+        self._total_mappings += self.coverage_map.add_test_coverage(test_name, coverage_data)
 
     def extract_lines_from_coverage_data(
         self,
@@ -11,11 +11,21 @@ Example:
 
 from __future__ import annotations
 
+from collections import Counter
+import sys
 from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import (
+        Iterable,
+        Iterator,
+        Mapping,
+        Set as AbstractSet,
+    )
+
+
+_NO_TESTS: frozenset[str] = frozenset()
 
 
 class CoverageMap:
@@ -26,16 +36,17 @@ class CoverageMap:
     source location.
 
     Attributes:
-        _data: Internal dict mapping "file:line" strings to sets of test names.
+        _by_file: Internal dict mapping file paths to dicts of line numbers
+            to sets of test names.
     """
 
     def __init__(self) -> None:
         """Create an empty coverage map."""
-        self._data: dict[str, set[str]] = {}
+        self._by_file: dict[str, dict[int, set[str]]] = {}
 
     def __len__(self) -> int:
         """Return the number of source locations in the map."""
-        return len(self._data)
+        return sum(map(len, self._by_file.values()))
 
     def add(self, file_path: str, line_number: int, test_name: str) -> None:
         """Add a coverage mapping from a source location to a test.
@@ -45,10 +56,51 @@ class CoverageMap:
             line_number: Line number in the source file.
             test_name: Name of the test function that covers this line.
         """
-        key = f'{file_path}:{line_number}'
-        if key not in self._data:
-            self._data[key] = set()
-        self._data[key].add(test_name)
+        self._by_file.setdefault(file_path, {}).setdefault(line_number, set()).add(test_name)
+
+    def add_many(self, file_path: str, line_numbers: Iterable[int], test_name: str) -> int:
+        """Add coverage mappings from several lines of one file to a test.
+
+        Equivalent to calling ``add`` once per line, but looks up the file's
+        line table once and skips the per-call overhead.
+
+        Args:
+            file_path: Path to the source file.
+            line_numbers: Line numbers in the source file.
+            test_name: Name of the test function that covers these lines.
+
+        Returns:
+            The number of lines added.
+        """
+        test_name = sys.intern(test_name)
+        lines = self._by_file.setdefault(sys.intern(file_path), {})
+        count = 0
+        for line_number in line_numbers:
+            lines.setdefault(line_number, set()).add(test_name)
+            count += 1
+        return count
+
+    def add_test_coverage(self, test_name: str, coverage_data: Mapping[str, Iterable[int]]) -> int:
+        """Add every line one test covered, across all files.
+
+        Args:
+            test_name: Name of the test function.
+            coverage_data: Mapping of file paths to the line numbers the test covered.
+
+        Returns:
+            The number of lines added.
+        """
+        # coverage.py hands back fresh strings for every test; interning them
+        # lets all tests share one copy of each path and name.
+        test_name = sys.intern(test_name)
+        by_file = self._by_file
+        count = 0
+        for file_path, line_numbers in coverage_data.items():
+            lines = by_file.setdefault(sys.intern(file_path), {})
+            for line_number in line_numbers:
+                lines.setdefault(line_number, set()).add(test_name)
+                count += 1
+        return count
 
     def get_tests(self, file_path: str, line_number: int) -> set[str]:
         """Get the set of tests that cover a source location.
@@ -61,10 +113,28 @@ class CoverageMap:
             A set of test function names that cover this location.
             Returns an empty set if no tests cover this location.
         """
-        key = f'{file_path}:{line_number}'
-        if key not in self._data:
+        lines = self._by_file.get(file_path)
+        if lines is None or line_number not in lines:
             return set()
-        return self._data[key].copy()
+        return lines[line_number].copy()
+
+    def get_tests_view(self, file_path: str, line_number: int) -> AbstractSet[str]:
+        """Get a read-only view of the tests that cover a source location.
+
+        Unlike ``get_tests``, this does not copy: it returns the map's own
+        set, or a shared empty set on a miss. Callers must not modify it.
+
+        Args:
+            file_path: Path to the source file.
+            line_number: Line number in the source file.
+
+        Returns:
+            The test function names that cover this location.
+        """
+        lines = self._by_file.get(file_path)
+        if lines is None:
+            return _NO_TESTS
+        return lines.get(line_number, _NO_TESTS)
 
     def __contains__(self, location: tuple[str, int]) -> bool:
         """Check if a source location is in the map.
@@ -76,8 +146,8 @@ class CoverageMap:
             True if the location has coverage data, False otherwise.
         """
         file_path, line_number = location
-        key = f'{file_path}:{line_number}'
-        return key in self._data
+        lines = self._by_file.get(file_path)
+        return lines is not None and line_number in lines
 
     def locations(self) -> Iterator[tuple[str, int]]:
         """Iterate over all source locations in the map.
@@ -85,9 +155,21 @@ class CoverageMap:
         Yields:
             Tuples of (file_path, line_number) for each location.
         """
-        for key in self._data:
-            file_path, line_str = key.rsplit(':', 1)
-            yield file_path, int(line_str)
+        for file_path, lines in self._by_file.items():
+            for line_number in lines:
+                yield file_path, line_number
+
+    def count_lines_per_test(self) -> dict[str, int]:
+        """Count how many source locations each test covers.
+
+        Returns:
+            Dict mapping test names to the number of locations they cover.
+        """
+        counts: Counter[str] = Counter()
+        for lines in self._by_file.values():
+            for tests in lines.values():
+                counts.update(tests)
+        return dict(counts)
 
     def get_incidentally_tested(
         self,
@@ -107,9 +189,10 @@ class CoverageMap:
             List of (file_path, line_number, test_count) tuples, sorted by
             test_count in descending order.
         """
-        results: list[tuple[str, int, int]] = []
-        for file_path, line_number in self.locations():
-            test_count = len(self._data[f'{file_path}:{line_number}'])
-            if test_count >= threshold:
-                results.append((file_path, line_number, test_count))
+        results = [
+            (file_path, line_number, len(tests))
+            for file_path, lines in self._by_file.items()
+            for line_number, tests in lines.items()
+            if len(tests) >= threshold
+        ]
         return sorted(results, key=lambda x: x[2], reverse=True)
@@ -25,6 +25,8 @@ from typing import TYPE_CHECKING, Any
 
 
 if TYPE_CHECKING:
+    from collections.abc import Set as AbstractSet
+
     from pytest_gremlins.coverage.mapper import CoverageMap
     from pytest_gremlins.instrumentation.gremlin import Gremlin
 
@@ -39,6 +41,9 @@ class PrioritizedSelector:
     Attributes:
         coverage_map: The CoverageMap containing line-to-test mappings.
         _specificity_cache: Cached test specificity scores (lines covered per test).
+        _rank_cache: Cached position of each test in the global priority order.
+        _selection_cache: Prioritized tests already computed, keyed by location.
+        _range_cache: Specificity range of each cached selection, keyed by location.
     """
 
     def __init__(self, coverage_map: CoverageMap) -> None:
@@ -49,6 +54,9 @@ class PrioritizedSelector:
         """
         self.coverage_map = coverage_map
         self._specificity_cache: dict[str, int] | None = None
+        self._rank_cache: dict[str, int] | None = None
+        self._selection_cache: dict[tuple[str, int], tuple[str, ...]] = {}
+        self._range_cache: dict[tuple[str, int], tuple[tuple[str, ...], tuple[int, int]]] = {}
 
     def get_test_specificity(self) -> dict[str, int]:
         """Compute specificity scores for all tests (lower = more specific).
@@ -63,27 +71,33 @@ class PrioritizedSelector:
         if self._specificity_cache is not None:
             return self._specificity_cache
 
-        test_lines: dict[str, set[str]] = {}
+        self._specificity_cache = self.coverage_map.count_lines_per_test()
+        return self._specificity_cache
 
-        for file_path, line_number in self.coverage_map.locations():
-            tests = self.coverage_map.get_tests(file_path, line_number)
-            location_key = f'{file_path}:{line_number}'
-            for test_name in tests:
-                if test_name not in test_lines:
-                    test_lines[test_name] = set()
-                test_lines[test_name].add(location_key)
+    def _get_test_rank(self) -> dict[str, int]:
+        """Rank every test once by (specificity, name).
 
-        self._specificity_cache = {test_name: len(lines) for test_name, lines in test_lines.items()}
-        return self._specificity_cache
+        Sorting a location's tests by rank gives the same order as sorting by
+        (specificity, name), but compares plain ints and builds no key tuples.
 
-    def select_tests_prioritized(self, gremlin: Gremlin) -> list[str]:
+        Returns:
+            Dict mapping test names to their position in the priority order.
+        """
+        if self._rank_cache is None:
+            specificity = self.get_test_specificity()
+            # Sorting (count, name) pairs directly needs no key function.
+            ordered = sorted(zip(specificity.values(), specificity, strict=True))
+            self._rank_cache = {test_name: rank for rank, (_, test_name) in enumerate(ordered)}
+        return self._rank_cache
+
+    def select_tests_prioritized(self, gremlin: Gremlin) -> tuple[str, ...]:
         """Select tests for a gremlin, ordered by specificity (most specific first).
 
         Args:
             gremlin: The gremlin to select tests for.
 
         Returns:
-            List of test names ordered by specificity (fewest lines first).
+            Tuple of test names ordered by specificity (fewest lines first).
             Tests with equal specificity are sorted alphabetically for determinism.
         """
         return self.select_tests_for_location_prioritized(
@@ -95,7 +109,7 @@ class PrioritizedSelector:
         self,
         file_path: str,
         line_number: int,
-    ) -> list[str]:
+    ) -> tuple[str, ...]:
         """Select and prioritize tests for a specific source location.
 
         Args:
@@ -103,50 +117,79 @@ class PrioritizedSelector:
             line_number: Line number in the source file.
 
         Returns:
-            List of test names ordered by specificity (fewest lines first).
+            Tuple of test names ordered by specificity (fewest lines first).
         """
-        tests = self.coverage_map.get_tests(file_path, line_number)
+        tests = self.coverage_map.get_tests_view(file_path, line_number)
         if not tests:
-            return []
+            return ()
 
-        specificity = self.get_test_specificity()
+        # Several gremlins often share a line. The map only ever grows, so a
+        # cached ordering is current as long as it holds as many tests.
+        location = (file_path, line_number)
+        ordered = self._selection_cache.get(location)
+        if ordered is None or len(ordered) != len(tests):
+            ordered = tuple(self._prioritize(tests))
+            self._selection_cache[location] = ordered
+        return ordered
 
-        # Sort by specificity (ascending - fewer lines first), then alphabetically
-        return sorted(
-            tests,
-            key=lambda t: (specificity.get(t, float('inf')), t),
-        )
+    def _prioritize(self, tests: AbstractSet[str]) -> list[str]:
+        """Order tests by specificity (fewer lines first), then alphabetically.
+
+        Args:
+            tests: The tests covering one location.
+
+        Returns:
+            The tests in priority order.
+        """
+        try:
+            return sorted(tests, key=self._get_test_rank().__getitem__)
+        except KeyError:
+            # Tests added to the map after the ranks were cached go last.
+            specificity = self.get_test_specificity()
+            return sorted(
+                tests,
+                key=lambda t: (specificity.get(t, float('inf')), t),
+            )
 
     def select_tests_with_stats(
         self,
         gremlin: Gremlin,
-    ) -> tuple[list[str], dict[str, Any]]:
+    ) -> tuple[tuple[str, ...], dict[str, Any]]:
         """Select prioritized tests for a gremlin and return statistics.
 
         Args:
             gremlin: The gremlin to select tests for.
 
         Returns:
-            Tuple of (prioritized tests list, statistics dict). Stats include:
+            Tuple of (prioritized tests tuple, statistics dict). Stats include:
                 - selected_count: Number of tests selected
                 - coverage_location: The location string (file:line)
                 - most_specific_test: Name of the most specific test (if any)
                 - specificity_range: Tuple of (min, max) lines covered
         """
         tests = self.select_tests_prioritized(gremlin)
-        specificity = self.get_test_specificity()
+        if not tests:
+            return tests, {
+                'selected_count': 0,
+                'coverage_location': f'{gremlin.file_path}:{gremlin.line_number}',
+                'most_specific_test': None,
+                'specificity_range': (0, 0),
+            }
+
+        # The range is reused for as long as the location's cached ordering is.
+        location = (gremlin.file_path, gremlin.line_number)
+        cached = self._range_cache.get(location)
+        if cached is not None and cached[0] is tests:
+            specificity_range = cached[1]
+        else:
+            specificity = self.get_test_specificity()
+            test_specificities = [specificity.get(t, 0) for t in tests]
+            specificity_range = (min(test_specificities), max(test_specificities))
+            self._range_cache[location] = (tests, specificity_range)
 
-        stats: dict[str, Any] = {
+        return tests, {
             'selected_count': len(tests),
             'coverage_location': f'{gremlin.file_path}:{gremlin.line_number}',
+            'most_specific_test': tests[0],
+            'specificity_range': specificity_range,
         }
-
-        if tests:
-            test_specificities = [specificity.get(t, 0) for t in tests]
-            stats['most_specific_test'] = tests[0]
-            stats['specificity_range'] = (min(test_specificities), max(test_specificities))
-        else:
-            stats['most_specific_test'] = None
-            stats['specificity_range'] = (0, 0)
-
-        return tests, stats
@@ -86,9 +86,10 @@ class TestSelector:
         Returns:
             Set of all test function names that cover any of the gremlins.
         """
+        get_tests_view = self.coverage_map.get_tests_view
         result: set[str] = set()
         for gremlin in gremlins:
-            result.update(self.select_tests(gremlin))
+            result.update(get_tests_view(gremlin.file_path, gremlin.line_number))
         return result
 
     def select_tests_with_stats(
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     import ast
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Gremlin:
     """A mutation (gremlin) injected into source code.
 
@@ -8,7 +8,8 @@ The import hooks work as follows:
 1. GremlinFinder is registered on sys.meta_path
 2. When Python imports a module, GremlinFinder.find_spec() is called
 3. If the module has instrumented code, return a ModuleSpec with GremlinLoader
-4. GremlinLoader.exec_module() compiles and executes the instrumented AST
+4. GremlinLoader.exec_module() executes the instrumented code (compiled once,
+   when the hooks are registered)
 5. The __gremlin_active__ variable is injected from ACTIVE_GREMLIN env var
 
 Example:
@@ -30,6 +31,7 @@ from importlib.abc import Loader, MetaPathFinder
 from importlib.machinery import ModuleSpec
 import os
 import sys
+import types
 from typing import TYPE_CHECKING
 
 from pytest_gremlins.instrumentation.switcher import ACTIVE_GREMLIN_ENV_VAR
@@ -37,23 +39,22 @@ from pytest_gremlins.instrumentation.switcher import ACTIVE_GREMLIN_ENV_VAR
 
 if TYPE_CHECKING:
     import ast
-    from collections.abc import Sequence
-    import types
+    from collections.abc import Mapping, Sequence
 
 
 class GremlinLoader(Loader):
     """Loader that executes instrumented AST code.
 
-    This loader compiles and executes a pre-transformed AST instead of
-    loading code from disk. It also injects the __gremlin_active__ variable
-    from the ACTIVE_GREMLIN environment variable.
+    This loader executes a pre-transformed AST, or code already compiled from
+    one, instead of loading code from disk. It also injects the
+    __gremlin_active__ variable from the ACTIVE_GREMLIN environment variable.
     """
 
-    def __init__(self, tree: ast.Module, module_name: str) -> None:
+    def __init__(self, tree: ast.Module | types.CodeType, module_name: str) -> None:
         """Initialize the loader with an instrumented AST.
 
         Args:
-            tree: The instrumented AST to execute.
+            tree: The instrumented AST to execute, or its compiled code object.
             module_name: The name of the module being loaded.
         """
         self._tree = tree
@@ -75,7 +76,7 @@ class GremlinLoader(Loader):
 
         This method:
         1. Injects __gremlin_active__ from the ACTIVE_GREMLIN env var
-        2. Compiles the instrumented AST
+        2. Compiles the instrumented AST, unless it was precompiled
         3. Executes it in the module's namespace
 
         Args:
@@ -87,7 +88,9 @@ class GremlinLoader(Loader):
         # Compile and execute the instrumented AST
         # Note: This exec is intentional - we're executing pre-validated, transformed AST
         # from our own instrumentation process, not arbitrary user input.
-        code = compile(self._tree, self._module_name, 'exec')
+        code = self._tree
+        if not isinstance(code, types.CodeType):
+            code = compile(code, self._module_name, 'exec')
         exec(code, module.__dict__)  # noqa: S102
 
 
@@ -98,13 +101,15 @@ class GremlinFinder(MetaPathFinder):
     with GremlinLoader for modules that have instrumented code available.
     """
 
-    def __init__(self, instrumented_modules: dict[str, ast.Module]) -> None:
+    def __init__(self, instrumented_modules: Mapping[str, ast.Module | types.CodeType]) -> None:
         """Initialize the finder with instrumented module ASTs.
 
         Args:
-            instrumented_modules: Mapping of module names to their instrumented ASTs.
+            instrumented_modules: Mapping of module names to their instrumented
+                ASTs or the code objects compiled from them.
         """
-        self._instrumented_modules = instrumented_modules
+        # Loaders hold no per-import state, so one per module is built up front.
+        self._loaders = {name: GremlinLoader(tree, name) for name, tree in instrumented_modules.items()}
 
     def find_spec(
         self,
@@ -122,11 +127,13 @@ class GremlinFinder(MetaPathFinder):
         Returns:
             ModuleSpec with GremlinLoader if module is instrumented, None otherwise.
         """
-        if fullname not in self._instrumented_modules:
+        # Every import in the process passes through here, so the common
+        # non-instrumented case costs a single dict lookup.
+        loader = self._loaders.get(fullname)
+        if loader is None:
             return None
 
-        tree = self._instrumented_modules[fullname]
-        loader = GremlinLoader(tree, fullname)
+        # The import system records load state on the spec, so each import gets its own.
         return ModuleSpec(fullname, loader)
 
 
@@ -139,6 +146,8 @@ def register_import_hooks(instrumented_modules: dict[str, ast.Module]) -> None:
 
     This function adds a GremlinFinder to sys.meta_path that will intercept
     imports for the specified modules and load instrumented code instead.
+    Each AST is compiled here, once, so re-importing a module does not
+    compile it again.
 
     Args:
         instrumented_modules: Mapping of module names to their instrumented ASTs.
@@ -146,7 +155,8 @@ def register_import_hooks(instrumented_modules: dict[str, ast.Module]) -> None:
     global _registered_finder  # noqa: PLW0603
     unregister_import_hooks()  # Clean up any existing registration
 
-    _registered_finder = GremlinFinder(instrumented_modules)
+    compiled = {name: compile(tree, name, 'exec') for name, tree in instrumented_modules.items()}
+    _registered_finder = GremlinFinder(compiled)
     sys.meta_path.insert(0, _registered_finder)
 
 
@@ -7,22 +7,18 @@ into the pytest test runner.
 from __future__ import annotations
 
 import ast
-import contextlib
 from dataclasses import dataclass, field
 import json
 import logging
 import os
 from pathlib import Path
 import shutil
-import sqlite3
 import subprocess
 import sys
 import tempfile
 from typing import TYPE_CHECKING
 import warnings
 
-from pytest_gremlins.cache.hasher import ContentHasher
-from pytest_gremlins.cache.incremental import IncrementalCache
 from pytest_gremlins.config import load_config, merge_configs
 from pytest_gremlins.coverage import CoverageCollector, PrioritizedSelector, TestSelector
 from pytest_gremlins.instrumentation.switcher import ACTIVE_GREMLIN_ENV_VAR
@@ -39,6 +35,8 @@ if TYPE_CHECKING:
 
     import pytest
 
+    from pytest_gremlins.cache.hasher import ContentHasher
+    from pytest_gremlins.cache.incremental import FrozenTestHashes, IncrementalCache
     from pytest_gremlins.instrumentation.gremlin import Gremlin
     from pytest_gremlins.operators import GremlinOperator
 
@@ -69,7 +67,9 @@ class GremlinSession:
         cache_enabled: Whether incremental caching is enabled.
         cache: The incremental cache instance (if caching is enabled).
         source_hashes: Content hashes for source files.
-        test_hashes: Content hashes for test files.
+        test_hashes: Content hashes for test files, computed lazily on first use.
+        hasher: Hasher for test files when the incremental cache is disabled, created on first use.
+        frozen_test_hashes: Cache-ready test hash snapshots keyed by the tests covering a gremlin.
         cache_hits: Number of cache hits in this session.
         cache_misses: Number of cache misses in this session.
         parallel_enabled: Whether parallel execution is enabled.
@@ -94,6 +94,8 @@ class GremlinSession:
     cache: IncrementalCache | None = None
     source_hashes: dict[str, str] = field(default_factory=dict)
     test_hashes: dict[str, str] = field(default_factory=dict)
+    hasher: ContentHasher | None = None
+    frozen_test_hashes: dict[tuple[str, ...], FrozenTestHashes] = field(default_factory=dict)
     cache_hits: int = 0
     cache_misses: int = 0
     parallel_enabled: bool = False
@@ -236,6 +238,9 @@ def pytest_configure(config: pytest.Config) -> None:
     cache: IncrementalCache | None = None
     cache_enabled = config.option.gremlin_cache
     if cache_enabled:
+        # Imported here so runs without the cache never load sqlite3 or the codecs.
+        from pytest_gremlins.cache.incremental import IncrementalCache  # noqa: PLC0415
+
         cache_dir = rootdir / '.gremlins_cache'
         cache = IncrementalCache(cache_dir)
 
@@ -293,14 +298,15 @@ def pytest_collection_finish(session: pytest.Session) -> None:
     source_files = _discover_source_files(session, gremlin_session)
     gremlin_session.source_files = source_files
 
-    # Compute content hashes for source and test files (for caching)
+    # Compute content hashes for source files (for caching). Sources are already
+    # in memory; test files are hashed lazily, only once a gremlin's selected
+    # tests actually need them (see _get_test_file_hash).
     if gremlin_session.cache_enabled:
+        from pytest_gremlins.cache.hasher import ContentHasher  # noqa: PLC0415
+
         hasher = ContentHasher()
         for file_path, source in source_files.items():
             gremlin_session.source_hashes[file_path] = hasher.hash_string(source)
-        for test_file in gremlin_session.test_files:
-            with contextlib.suppress(FileNotFoundError):
-                gremlin_session.test_hashes[str(test_file)] = hasher.hash_file(test_file)
 
     rootdir = Path(session.config.rootdir)  # type: ignore[attr-defined]
     all_gremlins: list[Gremlin] = []
@@ -513,10 +519,11 @@ def main():
 
     class GremlinFinder(MetaPathFinder):
         def find_spec(self, fullname, path, target=None):
-            if fullname in instrumented_sources:
-                loader = GremlinLoader(instrumented_sources[fullname], fullname)
-                return ModuleSpec(fullname, loader)
-            return None
+            # Called for every import, so misses cost one dict lookup.
+            source = instrumented_sources.get(fullname)
+            if source is None:
+                return None
+            return ModuleSpec(fullname, GremlinLoader(source, fullname))
 
     # Register finder at the START of meta_path
     sys.meta_path.insert(0, GremlinFinder())
@@ -537,7 +544,7 @@ def _cleanup_instrumented_dir(instrumented_dir: Path | None) -> None:
     Args:
         instrumented_dir: Path to the directory to remove, or None.
     """
-    if instrumented_dir is not None and instrumented_dir.exists():
+    if instrumented_dir is not None:
         shutil.rmtree(instrumented_dir, ignore_errors=True)
 
 
@@ -684,6 +691,9 @@ def _run_tests_with_coverage(
     Returns:
         Dict mapping test names to their coverage data (file path -> lines).
     """
+    # Imported here so plugin start-up does not pay for sqlite3.
+    import sqlite3  # noqa: PLC0415
+
     coverage_db_path = rootdir / '.coverage'
     coverage_db_path.unlink(missing_ok=True)
 
@@ -814,7 +824,7 @@ def _run_batch_mutation_testing(  # pragma: no cover  # noqa: C901
     gremlins = gremlin_session.gremlins
 
     # Build gremlin -> test mapping for filtering (prioritized order)
-    gremlin_tests: dict[str, list[str]] = {}
+    gremlin_tests: dict[str, tuple[str, ...]] = {}
     for gremlin in gremlins:
         selected_tests = _select_tests_for_gremlin_prioritized(gremlin, gremlin_session)
         gremlin_tests[gremlin.gremlin_id] = selected_tests
@@ -823,9 +833,9 @@ def _run_batch_mutation_testing(  # pragma: no cover  # noqa: C901
     cached_results: list[GremlinResult] = []
     uncached_gremlins: list[Gremlin] = []
 
+    cached_by_id = _check_cache_for_gremlins(gremlins, gremlin_tests, gremlin_session)
     for gremlin in gremlins:
-        selected_tests = gremlin_tests[gremlin.gremlin_id]
-        cached_result = _check_cache_for_gremlin(gremlin, selected_tests, gremlin_session)
+        cached_result = cached_by_id.get(gremlin.gremlin_id)
         if cached_result is not None:
             gremlin_session.cache_hits += 1
             cached_results.append(cached_result)
@@ -936,7 +946,7 @@ def _run_parallel_mutation_testing(  # pragma: no cover  # noqa: C901
     gremlins = gremlin_session.gremlins
 
     # Build gremlin -> test mapping for filtering (prioritized order)
-    gremlin_tests: dict[str, list[str]] = {}
+    gremlin_tests: dict[str, tuple[str, ...]] = {}
     for gremlin in gremlins:
         selected_tests = _select_tests_for_gremlin_prioritized(gremlin, gremlin_session)
         gremlin_tests[gremlin.gremlin_id] = selected_tests
@@ -945,9 +955,9 @@ def _run_parallel_mutation_testing(  # pragma: no cover  # noqa: C901
     cached_results: list[GremlinResult] = []
     uncached_gremlins: list[Gremlin] = []
 
+    cached_by_id = _check_cache_for_gremlins(gremlins, gremlin_tests, gremlin_session)
     for gremlin in gremlins:
-        selected_tests = gremlin_tests[gremlin.gremlin_id]
-        cached_result = _check_cache_for_gremlin(gremlin, selected_tests, gremlin_session)
+        cached_result = cached_by_id.get(gremlin.gremlin_id)
         if cached_result is not None:
             gremlin_session.cache_hits += 1
             cached_results.append(cached_result)
@@ -1120,14 +1130,78 @@ def _build_test_hashes_for_gremlin(
 
         if '::' in node_id:
             test_file = node_id.split('::')[0]
-            for file_path, file_hash in gremlin_session.test_hashes.items():
-                if file_path.endswith(test_file) or test_file in file_path:
-                    test_hashes[test_name] = file_hash
-                    break
+            for file_path in gremlin_session.test_files:
+                file_path_str = str(file_path)
+                if file_path_str.endswith(test_file) or test_file in file_path_str:
+                    file_hash = _get_test_file_hash(file_path, gremlin_session)
+                    if file_hash is not None:
+                        test_hashes[test_name] = file_hash
+                        break
 
     return test_hashes
 
 
+def _get_frozen_test_hashes(
+    selected_tests: Sequence[str],
+    gremlin_session: GremlinSession,
+) -> FrozenTestHashes:
+    """Get the cache-ready test hashes for a gremlin's covering tests.
+
+    Gremlins covered by the same tests share one snapshot, so the test hashes
+    are built, sorted and combined once per distinct test set.
+
+    Args:
+        selected_tests: Sequence of test names that cover the gremlin.
+        gremlin_session: The current gremlin session with test metadata.
+
+    Returns:
+        Snapshot of the test name to file content hash mapping.
+    """
+    key = tuple(selected_tests)
+    frozen = gremlin_session.frozen_test_hashes.get(key)
+    if frozen is None:
+        from pytest_gremlins.cache.incremental import FrozenTestHashes  # noqa: PLC0415
+
+        frozen = FrozenTestHashes(_build_test_hashes_for_gremlin(selected_tests, gremlin_session))
+        gremlin_session.frozen_test_hashes[key] = frozen
+    return frozen
+
+
+def _get_test_file_hash(test_file: Path, gremlin_session: GremlinSession) -> str | None:
+    """Get the content hash of a test file, hashing it on first use.
+
+    Hashes are memoized in the session, so each test file is read at most
+    once per run and files no gremlin depends on are never hashed. With the
+    incremental cache enabled, files unchanged since the previous run are
+    not read at all.
+
+    Args:
+        test_file: Path to the test file.
+        gremlin_session: The current gremlin session.
+
+    Returns:
+        The file's content hash, or None if the file no longer exists.
+    """
+    key = str(test_file)
+    file_hash = gremlin_session.test_hashes.get(key)
+    if file_hash is None:
+        hasher: IncrementalCache | ContentHasher
+        if gremlin_session.cache is not None:
+            hasher = gremlin_session.cache
+        else:
+            if gremlin_session.hasher is None:
+                from pytest_gremlins.cache.hasher import ContentHasher  # noqa: PLC0415
+
+                gremlin_session.hasher = ContentHasher()
+            hasher = gremlin_session.hasher
+        try:
+            file_hash = hasher.hash_file(test_file)
+        except FileNotFoundError:
+            return None
+        gremlin_session.test_hashes[key] = file_hash
+    return file_hash
+
+
 def _check_cache_for_gremlin(
     gremlin: Gremlin,
     selected_tests: Sequence[str],
@@ -1150,7 +1224,7 @@ def _check_cache_for_gremlin(
     if not source_hash:
         return None
 
-    test_hashes = _build_test_hashes_for_gremlin(selected_tests, gremlin_session)
+    test_hashes = _get_frozen_test_hashes(selected_tests, gremlin_session)
 
     cached = gremlin_session.cache.get_cached_result(
         gremlin_id=gremlin.gremlin_id,
@@ -1170,6 +1244,47 @@ def _check_cache_for_gremlin(
     )
 
 
+def _check_cache_for_gremlins(
+    gremlins: Sequence[Gremlin],
+    gremlin_tests: dict[str, tuple[str, ...]],
+    gremlin_session: GremlinSession,
+) -> dict[str, GremlinResult]:
+    """Check the cache for many gremlins with a single batched lookup.
+
+    Args:
+        gremlins: The gremlins to check the cache for.
+        gremlin_tests: Mapping of gremlin_id to the tests that cover it.
+        gremlin_session: The current gremlin session.
+
+    Returns:
+        Mapping of gremlin_id to cached GremlinResult for every cache hit.
+    """
+    if not gremlin_session.cache_enabled or gremlin_session.cache is None:
+        return {}
+
+    gremlin_by_id: dict[str, Gremlin] = {}
+    requests: list[tuple[str, str, FrozenTestHashes]] = []
+    for gremlin in gremlins:
+        source_hash = gremlin_session.source_hashes.get(gremlin.file_path, '')
+        if not source_hash:
+            continue
+        test_hashes = _get_frozen_test_hashes(gremlin_tests[gremlin.gremlin_id], gremlin_session)
+        gremlin_by_id[gremlin.gremlin_id] = gremlin
+        requests.append((gremlin.gremlin_id, source_hash, test_hashes))
+
+    cached_by_id = gremlin_session.cache.get_cached_results(requests)
+
+    return {
+        gremlin_id: GremlinResult(
+            gremlin=gremlin_by_id[gremlin_id],
+            status=GremlinResultStatus(cached['status']),
+            killing_test=cached.get('killing_test'),
+            execution_time_ms=cached.get('execution_time_ms'),
+        )
+        for gremlin_id, cached in cached_by_id.items()
+    }
+
+
 def _cache_gremlin_result(
     gremlin: Gremlin,
     selected_tests: Sequence[str],
@@ -1191,7 +1306,7 @@ def _cache_gremlin_result(
     if not source_hash:
         return
 
-    test_hashes = _build_test_hashes_for_gremlin(selected_tests, gremlin_session)
+    test_hashes = _get_frozen_test_hashes(selected_tests, gremlin_session)
 
     # Use deferred writes to batch commits for better performance
     gremlin_session.cache.cache_result_deferred(
@@ -1241,7 +1356,7 @@ def _report_gremlin_cache_miss(
 def _select_tests_for_gremlin_prioritized(
     gremlin: Gremlin,
     gremlin_session: GremlinSession,
-) -> list[str]:
+) -> tuple[str, ...]:
     """Select tests for a gremlin, ordered by specificity (most specific first).
 
     Uses the PrioritizedSelector to return tests in an order that maximizes
@@ -1259,14 +1374,14 @@ def _select_tests_for_gremlin_prioritized(
         gremlin_session: The current gremlin session.
 
     Returns:
-        List of test names ordered by specificity (most specific first).
+        Tuple of test names ordered by specificity (most specific first).
     """
     if gremlin_session.prioritized_selector is None:
-        return list(gremlin_session.test_node_ids.keys())
+        return tuple(gremlin_session.test_node_ids)
 
     selected = gremlin_session.prioritized_selector.select_tests_prioritized(gremlin)
     if not selected:
-        return list(gremlin_session.test_node_ids.keys())
+        return tuple(gremlin_session.test_node_ids)
 
     return selected
 
@@ -0,0 +1,48 @@
+"""Shared fixtures for cache tests.
+
+Hash inputs are identical across the cache performance tests, so they are
+computed once per session rather than in every test's setup. Tests must
+treat the returned mappings as read-only.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from pytest_gremlins.cache.hasher import ContentHasher
+
+
+@pytest.fixture(scope='session')
+def content_hasher() -> ContentHasher:
+    """A ContentHasher shared across the session."""
+    return ContentHasher()
+
+
+@pytest.fixture(scope='session')
+def source_hash(content_hasher: ContentHasher) -> str:
+    """Content hash of a small sample source file."""
+    return content_hasher.hash_string('def add(a, b): return a + b')
+
+
+@pytest.fixture(scope='session')
+def sample_test_hashes(content_hasher: ContentHasher) -> dict[str, str]:
+    """Content hashes for 20 sample test functions, keyed by test name."""
+    return {f'test_{i}': content_hasher.hash_string(f'def test_{i}(): pass') for i in range(20)}
+
+
+@pytest.fixture(scope='session')
+def single_test_hashes(content_hasher: ContentHasher) -> dict[str, str]:
+    """Content hash for a single sample test, keyed by test name."""
+    return {'test_add': content_hasher.hash_string('def test_add(): pass')}
+
+
+@pytest.fixture(scope='session')
+def sample_test_files() -> dict[str, str]:
+    """Contents of 20 sample test modules, keyed by file name."""
+    return {
+        f'test_module_{i}.py': '\n'.join(
+            [f'from module_{i} import function_{i}', '']
+            + [f'def test_function_{i}_{j}():\n    assert function_{i}({j}) == {j}\n' for j in range(20)]
+        )
+        for i in range(20)
+    }
@@ -35,19 +35,20 @@ class TestHasherBugs:
         # Currently they're the same, which is a bug
         assert combined_empty == string_empty  # This passes, showing the bug exists
 
-    def test_hash_file_with_binary_content_raises_clear_error(self, tmp_path):
-        """hash_file raises UnicodeDecodeError for binary files.
+    def test_hash_file_with_binary_content_returns_hash(self, tmp_path):
+        """hash_file hashes binary files instead of failing to decode them.
 
-        BUG: hash_file uses read_text() which fails on binary files.
-        The error message is not helpful for users.
+        Previously hash_file used read_text() and raised UnicodeDecodeError
+        on files that are not valid UTF-8. It now hashes the raw bytes.
         """
         hasher = ContentHasher()
         binary_file = tmp_path / 'test.pyc'
         binary_file.write_bytes(b'\x00\x01\x02\x03\xff\xfe')
 
-        # Currently raises UnicodeDecodeError - not very helpful
-        with pytest.raises(UnicodeDecodeError):
-            hasher.hash_file(binary_file)
+        first = hasher.hash_file(binary_file)
+
+        assert len(first) == 64
+        assert hasher.hash_file(binary_file) == first
 
 
 @pytest.mark.medium
@@ -4,6 +4,7 @@ These tests simulate the actual cache usage pattern from the plugin
 to identify where time is being lost.
 """
 
+import itertools
 from pathlib import Path
 import time
 
@@ -17,56 +18,63 @@ from pytest_gremlins.cache.incremental import IncrementalCache
 class TestPluginCachePattern:
     """Tests that simulate the actual plugin cache usage pattern."""
 
-    def test_warm_run_is_faster_than_cold_run(self, tmp_path: Path) -> None:
+    def test_warm_run_is_faster_than_cold_run(
+        self, tmp_path: Path, source_hash: str, sample_test_hashes: dict[str, str]
+    ) -> None:
         """Warm run with cache hits is at least 10x faster than cold run."""
-        cache_dir = tmp_path / '.gremlins_cache'
         num_gremlins = 50
-        num_tests = 20
 
-        # Simulate source and test file hashes (pre-computed)
-        hasher = ContentHasher()
-        source_hash = hasher.hash_string('def add(a, b): return a + b')
-        test_hashes = {f'test_{i}': hasher.hash_string(f'def test_{i}(): pass') for i in range(num_tests)}
+        # Simulate selecting tests for each gremlin (the same 5 tests per gremlin)
+        selected_test_hashes = dict(itertools.islice(sample_test_hashes.items(), 5))
 
-        # COLD RUN: Compute hashes and write to cache
-        with IncrementalCache(cache_dir) as cache:
-            cold_start = time.perf_counter()
+        # Both runs are short enough that scheduler noise matters, so each side
+        # keeps the best of a few passes. Every pass starts from a fresh cache
+        # directory and a fresh IncrementalCache, so no pass is served from
+        # the in-memory layer of an earlier one.
+        cold_times = []
+        warm_times = []
+        for run in range(3):
+            cache_dir = tmp_path / f'.gremlins_cache_{run}'
 
-            for i in range(num_gremlins):
-                gremlin_id = f'src/module.py:gremlin_{i}'
-                # Simulate selecting tests for this gremlin (5 tests per gremlin)
-                selected_test_hashes = dict(list(test_hashes.items())[:5])
+            # COLD RUN: Compute hashes and write to cache
+            with IncrementalCache(cache_dir) as cache:
+                cold_start = time.perf_counter()
 
-                # Check cache (miss expected)
-                result = cache.get_cached_result(gremlin_id, source_hash, selected_test_hashes)
-                assert result is None
+                for i in range(num_gremlins):
+                    gremlin_id = f'src/module.py:gremlin_{i}'
 
-                # Simulate test execution time (skip actual execution)
-                # In real scenario, this would be ~0.5-5 seconds per gremlin
+                    # Check cache (miss expected)
+                    result = cache.get_cached_result(gremlin_id, source_hash, selected_test_hashes)
+                    assert result is None
 
-                # Cache the result
-                cache.cache_result(
-                    gremlin_id,
-                    source_hash,
-                    selected_test_hashes,
-                    {'status': 'zapped', 'killing_test': 'test_0'},
-                )
+                    # Simulate test execution time (skip actual execution)
+                    # In real scenario, this would be ~0.5-5 seconds per gremlin
 
-            cold_time = time.perf_counter() - cold_start
+                    # Cache the result
+                    cache.cache_result(
+                        gremlin_id,
+                        source_hash,
+                        selected_test_hashes,
+                        {'status': 'zapped', 'killing_test': 'test_0'},
+                    )
 
-        # WARM RUN: All cache hits
-        with IncrementalCache(cache_dir) as cache:
-            warm_start = time.perf_counter()
+                cold_times.append(time.perf_counter() - cold_start)
 
-            for i in range(num_gremlins):
-                gremlin_id = f'src/module.py:gremlin_{i}'
-                selected_test_hashes = dict(list(test_hashes.items())[:5])
+            # WARM RUN: All cache hits
+            with IncrementalCache(cache_dir) as cache:
+                warm_start = time.perf_counter()
+
+                for i in range(num_gremlins):
+                    gremlin_id = f'src/module.py:gremlin_{i}'
 
-                # Check cache (hit expected)
-                result = cache.get_cached_result(gremlin_id, source_hash, selected_test_hashes)
-                assert result is not None
+                    # Check cache (hit expected)
+                    result = cache.get_cached_result(gremlin_id, source_hash, selected_test_hashes)
+                    assert result is not None
 
-            warm_time = time.perf_counter() - warm_start
+                warm_times.append(time.perf_counter() - warm_start)
+
+        cold_time = min(cold_times)
+        warm_time = min(warm_times)
 
         # Warm run should be much faster (no writes, just reads)
         # Target: warm_time < cold_time / 10 (at least 10x faster)
@@ -75,36 +83,30 @@ class TestPluginCachePattern:
             f'Warm run speedup was only {speedup:.1f}x (cold={cold_time * 1000:.1f}ms, warm={warm_time * 1000:.1f}ms)'
         )
 
-    def test_cache_overhead_per_gremlin(self, tmp_path: Path) -> None:
+    def test_cache_overhead_per_gremlin(
+        self, tmp_path: Path, source_hash: str, single_test_hashes: dict[str, str]
+    ) -> None:
         """Cache overhead per gremlin is under 1ms for cache hits."""
         cache_dir = tmp_path / '.gremlins_cache'
         num_gremlins = 100
 
-        hasher = ContentHasher()
-        source_hash = hasher.hash_string('def add(a, b): return a + b')
-        test_hashes = {'test_add': hasher.hash_string('def test_add(): pass')}
-
         # Populate cache
         with IncrementalCache(cache_dir) as cache:
-            for i in range(num_gremlins):
-                cache.cache_result(
-                    f'gremlin_{i}',
-                    source_hash,
-                    test_hashes,
-                    {'status': 'zapped'},
-                )
+            cache.cache_results(
+                (f'gremlin_{i}', source_hash, single_test_hashes, {'status': 'zapped'}) for i in range(num_gremlins)
+            )
 
         # Measure cache lookup overhead
         with IncrementalCache(cache_dir) as cache:
             start = time.perf_counter()
             for i in range(num_gremlins):
-                cache.get_cached_result(f'gremlin_{i}', source_hash, test_hashes)
+                cache.get_cached_result(f'gremlin_{i}', source_hash, single_test_hashes)
             elapsed = time.perf_counter() - start
 
         per_gremlin_ms = (elapsed / num_gremlins) * 1000
         assert per_gremlin_ms < 1.0, f'Cache overhead per gremlin: {per_gremlin_ms:.3f}ms (target: <1ms)'
 
-    def test_file_hash_computation_cost(self, tmp_path: Path) -> None:
+    def test_file_hash_computation_cost(self, tmp_path: Path, content_hasher: ContentHasher) -> None:
         """File hash computation for 50 files takes under 50ms."""
         # Create 50 simulated source files
         src_dir = tmp_path / 'src'
@@ -113,31 +115,25 @@ class TestPluginCachePattern:
         for i in range(50):
             (src_dir / f'module_{i}.py').write_text('\n'.join([f'def function_{j}(): return {j}' for j in range(100)]))
 
-        hasher = ContentHasher()
-
         # Time hashing all files
         start = time.perf_counter()
         hashes = {}
         for f in src_dir.iterdir():
-            hashes[str(f)] = hasher.hash_file(f)
+            hashes[str(f)] = content_hasher.hash_file(f)
         elapsed = time.perf_counter() - start
 
         # 50 files should hash in under 50ms (1ms per file)
         assert elapsed < 0.05, f'Hashing 50 files took {elapsed * 1000:.1f}ms (target: <50ms)'
 
-    def test_upfront_hashing_vs_lazy_hashing(self) -> None:
+    def test_upfront_hashing_vs_lazy_hashing(
+        self, content_hasher: ContentHasher, sample_test_files: dict[str, str]
+    ) -> None:
         """Lazy hashing (hash on demand) is faster when cache hit rate is high."""
-        num_files = 20
-
-        # Create file hashes (simulate upfront computation)
-        hasher = ContentHasher()
-        file_hashes = {f'file_{i}.py': hasher.hash_string(f'content_{i}') for i in range(num_files)}
-
         # Pattern 1: Upfront hashing (current behavior)
         # Hash all files, then check cache for each gremlin
         start = time.perf_counter()
-        # Simulate hashing all files upfront
-        _ = {k: hasher.hash_string(v) for k, v in file_hashes.items()}  # Re-hash as simulation
+        # Simulate hashing the contents of every test file upfront
+        _ = {name: content_hasher.hash_string(content) for name, content in sample_test_files.items()}
         upfront_hash_time = time.perf_counter() - start
 
         # Pattern 2: Lazy hashing (only hash when needed)
@@ -209,11 +205,7 @@ class TestBatchOperations:
         # Simulate batch lookup pattern
         with IncrementalCache(cache_dir) as cache:
             start = time.perf_counter()
-            results = []
-            for i in range(num_gremlins):
-                result = cache.get_cached_result(f'g_{i}', 'src_hash', {'test': 'hash'})
-                if result:
-                    results.append(result)
+            results = cache.get_cached_results([(f'g_{i}', 'src_hash', {'test': 'hash'}) for i in range(num_gremlins)])
             elapsed = time.perf_counter() - start
 
         assert len(results) == num_gremlins
@@ -1,11 +1,13 @@
 """Tests for cache key computation memoization."""
 
+from collections.abc import Iterable
 from pathlib import Path
 import time
 
 import pytest
 
-from pytest_gremlins.cache.incremental import IncrementalCache
+from pytest_gremlins.cache import incremental as incremental_module
+from pytest_gremlins.cache.incremental import FrozenTestHashes, IncrementalCache
 
 
 @pytest.mark.medium
@@ -36,3 +38,125 @@ class TestCacheKeyMemoization:
         # Both should be fast (< 50ms for 100 computations)
         assert first_time < 0.05, f'First round took {first_time * 1000:.1f}ms'
         assert second_time < 0.05, f'Second round took {second_time * 1000:.1f}ms'
+
+    def test_memoized_key_matches_freshly_computed_key(self, tmp_path: Path) -> None:
+        """A memoized combined hash yields the same key as a fresh computation."""
+        test_hashes = {'test_a': 'hash_a', 'test_b': 'hash_b'}
+
+        with IncrementalCache(tmp_path / 'warm') as warm_cache:
+            warm_cache._build_cache_key('g1', 'src', test_hashes)
+            memoized_key = warm_cache._build_cache_key('g1', 'src', test_hashes)
+        with IncrementalCache(tmp_path / 'cold') as cold_cache:
+            fresh_key = cold_cache._build_cache_key('g1', 'src', dict(test_hashes))
+
+        assert memoized_key == fresh_key
+
+    def test_mutating_test_hashes_in_place_changes_key(self, tmp_path: Path) -> None:
+        """Memoization is keyed on content, so mutating the same dict changes the key."""
+        test_hashes = {'test_a': 'hash_a'}
+
+        with IncrementalCache(tmp_path / '.gremlins_cache') as cache:
+            key_before = cache._build_cache_key('g1', 'src', test_hashes)
+            test_hashes['test_a'] = 'hash_a_modified'
+            key_after = cache._build_cache_key('g1', 'src', test_hashes)
+
+        assert key_before != key_after
+
+    def test_reused_dict_skips_content_memo(self, tmp_path: Path) -> None:
+        """Passing the same unchanged dict again is answered without the content memo."""
+        test_hashes = {'test_a': 'hash_a', 'test_b': 'hash_b'}
+
+        with IncrementalCache(tmp_path / '.gremlins_cache') as cache:
+            key_first = cache._build_cache_key('g1', 'src', test_hashes)
+            cache._test_hash_memo.clear()
+            key_second = cache._build_cache_key('g1', 'src', test_hashes)
+
+            assert key_second == key_first
+            assert not cache._test_hash_memo
+
+    def test_memo_is_bounded(self, tmp_path: Path) -> None:
+        """The combined hash memo does not grow without bound."""
+        with IncrementalCache(tmp_path / '.gremlins_cache') as cache:
+            for i in range(1000):
+                cache._build_cache_key('g1', 'src', {f'test_{i}': 'hash'})
+
+            assert len(cache._test_hash_memo) <= 256
+
+    def test_cache_key_embeds_compact_test_hash(self, tmp_path: Path) -> None:
+        """The combined test hash in the key is a 128-bit hex digest."""
+        with IncrementalCache(tmp_path / '.gremlins_cache') as cache:
+            key = cache._build_cache_key('g1', 'src', {'test_a': 'hash_a'})
+
+        gremlin_id, source_hash, combined_test_hash = key.split(':')
+        assert (gremlin_id, source_hash) == ('g1', 'src')
+        assert len(combined_test_hash) == 32
+        int(combined_test_hash, 16)
+
+
+@pytest.mark.medium
+class TestFrozenTestHashes:
+    """Tests for pre-sorted test hash snapshots."""
+
+    def test_frozen_snapshot_builds_same_key_as_dict(self, tmp_path: Path) -> None:
+        """A FrozenTestHashes produces the same cache key as the dict it wraps."""
+        test_hashes = {'test_b': 'hash_b', 'test_a': 'hash_a'}
+
+        with IncrementalCache(tmp_path / '.gremlins_cache') as cache:
+            from_dict = cache._build_cache_key('g001', 'src', test_hashes)
+            from_frozen = cache._build_cache_key('g001', 'src', FrozenTestHashes(test_hashes))
+
+        assert from_frozen == from_dict
+
+    def test_empty_snapshot_uses_no_tests_marker(self) -> None:
+        """An empty snapshot combines to the same marker as an empty dict."""
+        assert FrozenTestHashes({}).combined == 'no_tests'
+
+    def test_snapshot_is_unaffected_by_later_dict_changes(self, tmp_path: Path) -> None:
+        """Mutating the source dict after freezing does not change the snapshot."""
+        test_hashes = {'test_a': 'hash_a'}
+        frozen = FrozenTestHashes(test_hashes)
+        test_hashes['test_a'] = 'changed'
+
+        with IncrementalCache(tmp_path / '.gremlins_cache') as cache:
+            cache.cache_result('g001', 'src', frozen, {'status': 'zapped'})
+
+            assert cache.get_cached_result('g001', 'src', {'test_a': 'hash_a'}) == {'status': 'zapped'}
+            assert cache.get_cached_result('g001', 'src', test_hashes) is None
+
+    def test_snapshot_stores_parallel_sorted_names_and_hashes(self) -> None:
+        """Names are sorted and hashes stay aligned with their names."""
+        frozen = FrozenTestHashes({'test_c': 'hash_c', 'test_a': 'hash_a', 'test_b': 'hash_b'})
+
+        assert frozen.names == ('test_a', 'test_b', 'test_c')
+        assert frozen.hashes == ('hash_a', 'hash_b', 'hash_c')
+        assert len(frozen) == 3
+
+    def test_raw_source_digest_builds_same_key_as_hex(self, tmp_path: Path) -> None:
+        """A bytes source digest is hexlified into the same key as its hex string."""
+        digest = bytes(range(32))
+
+        with IncrementalCache(tmp_path / '.gremlins_cache') as cache:
+            from_bytes = cache._build_cache_key('g001', digest, {'test_a': 'hash_a'})
+            from_hex = cache._build_cache_key('g001', digest.hex(), {'test_a': 'hash_a'})
+
+        assert from_bytes == from_hex
+
+    def test_shared_snapshot_combines_test_hashes_once_per_run(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Keys for many gremlins sharing a snapshot hash the test set only once."""
+        calls: list[int] = []
+        original = incremental_module._combine_sorted_test_items
+
+        def counting_combine(items: Iterable[tuple[str, str]]) -> str:
+            calls.append(1)
+            return original(items)
+
+        monkeypatch.setattr(incremental_module, '_combine_sorted_test_items', counting_combine)
+        frozen = FrozenTestHashes({f'test_{i}': f'hash_{i}' for i in range(5)})
+
+        with IncrementalCache(tmp_path / '.gremlins_cache') as cache:
+            keys = {cache._build_cache_key(f'gremlin_{i}', 'src', frozen) for i in range(50)}
+
+        assert len(keys) == 50
+        assert len(calls) == 1
@@ -4,9 +4,13 @@ Content hashing is the foundation of incremental analysis. Files with
 identical content produce identical hashes, enabling cache lookups.
 """
 
+import hashlib
+import importlib.util
+import json
+
 import pytest
 
-from pytest_gremlins.cache.hasher import ContentHasher
+from pytest_gremlins.cache.hasher import HASH_ALGORITHM, ContentHasher
 
 
 @pytest.mark.small
@@ -73,6 +77,24 @@ class TestContentHasher:
 
         assert file_hash == string_hash
 
+    def test_hash_file_normalizes_line_endings(self, tmp_path):
+        """CRLF and CR line endings hash like the text a text-mode read would see."""
+        hasher = ContentHasher()
+        file_path = tmp_path / 'test.py'
+        file_path.write_bytes(b'class MyClass:\r\n    pass\r')
+
+        assert hasher.hash_file(file_path) == hasher.hash_string('class MyClass:\n    pass\n')
+
+    @pytest.mark.parametrize('newline', ['\n', '\r\n'])
+    def test_hash_file_matches_hash_string_for_large_files(self, tmp_path, newline):
+        """Files large enough to be memory-mapped hash the same as their text."""
+        hasher = ContentHasher()
+        lines = [f'def function_{i}(): return {i}' for i in range(5000)]
+        file_path = tmp_path / 'big.py'
+        file_path.write_bytes(newline.join(lines).encode())
+
+        assert hasher.hash_file(file_path) == hasher.hash_string('\n'.join(lines))
+
     def test_hash_file_raises_for_missing_file(self, tmp_path):
         """hash_file raises FileNotFoundError for missing files."""
         hasher = ContentHasher()
@@ -96,6 +118,20 @@ class TestContentHasher:
         assert str(file2) in result
         assert result[str(file1)] != result[str(file2)]
 
+    def test_hash_files_parallel_matches_sequential(self, tmp_path):
+        """Batches large enough for the thread pool give the same per-file hashes."""
+        hasher = ContentHasher()
+        paths = []
+        for i in range(40):
+            path = tmp_path / f'module_{i}.py'
+            path.write_text(f'def function_{i}(): return {i}\n')
+            paths.append(path)
+
+        result = hasher.hash_files(paths, max_workers=4)
+
+        assert list(result) == [str(path) for path in paths]
+        assert result == {str(path): hasher.hash_file(path) for path in paths}
+
     def test_hash_combined_produces_single_hash(self):
         """hash_combined combines multiple hashes into one."""
         hasher = ContentHasher()
@@ -116,3 +152,134 @@ class TestContentHasher:
         result2 = hasher.hash_combined(hashes2)
 
         assert result1 != result2
+
+    def test_hash_combined_matches_hash_of_concatenation(self):
+        """Streaming the hashes gives the same digest as hashing them joined."""
+        hasher = ContentHasher()
+        hashes = ['abc123', 'def456', 'ghi789']
+
+        assert hasher.hash_combined(hashes) == hasher.hash_string(''.join(hashes))
+
+    def test_hash_combined_accepts_bytes_digests(self):
+        """Bytes digests combine to the same hash as their str equivalents."""
+        hasher = ContentHasher()
+        hashes = ['abc123', 'def456']
+
+        assert hasher.hash_combined([h.encode() for h in hashes]) == hasher.hash_combined(hashes)
+
+    def test_digest_string_is_raw_form_of_hash_string(self):
+        """digest_string returns the bytes behind hash_string's hex output."""
+        hasher = ContentHasher()
+
+        digest = hasher.digest_string('def foo(): return 42')
+
+        assert len(digest) == 32
+        assert digest.hex() == hasher.hash_string('def foo(): return 42')
+
+    def test_digest_combined_matches_hash_combined(self):
+        """digest_combined is the raw form of hash_combined over the same bytes."""
+        hasher = ContentHasher()
+        digests = [hasher.digest_string('a'), hasher.digest_string('b')]
+
+        assert hasher.digest_combined(digests).hex() == hasher.hash_combined(digests)
+
+
+@pytest.mark.small
+class TestHashBackend:
+    """Tests for the hash primitive selection."""
+
+    def test_blake3_is_used_when_installed(self):
+        """BLAKE3 is preferred whenever the blake3 package is importable."""
+        expected = 'blake3' if importlib.util.find_spec('blake3') is not None else 'sha256'
+
+        assert expected == HASH_ALGORITHM
+
+    def test_hash_string_matches_selected_backend(self):
+        """hash_string output is the selected backend's digest of the UTF-8 bytes."""
+        content = 'def foo(): return 42'
+        if HASH_ALGORITHM == 'blake3':
+            blake3 = pytest.importorskip('blake3')
+            expected = blake3.blake3(content.encode()).hexdigest()
+        else:
+            expected = hashlib.sha256(content.encode()).hexdigest()
+
+        assert ContentHasher().hash_string(content) == expected
+
+
+@pytest.mark.medium
+class TestFileMetaCache:
+    """Tests for the mtime and size fast path in hash_file."""
+
+    def test_unchanged_file_is_not_reread(self, tmp_path, monkeypatch):
+        """A file whose stat() matches the remembered entry is not read again."""
+        source = tmp_path / 'module.py'
+        source.write_text('x = 1\n')
+        hasher = ContentHasher(meta_path=tmp_path / 'file_meta.json')
+        first = hasher.hash_file(source)
+
+        def fail_read(*_args, **_kwargs):
+            raise AssertionError('file was re-read')
+
+        monkeypatch.setattr(type(source), 'open', fail_read)
+
+        assert hasher.hash_file(source) == first
+
+    def test_meta_cache_persists_across_hashers(self, tmp_path):
+        """Saved metadata lets a new hasher reuse hashes from a previous run."""
+        source = tmp_path / 'module.py'
+        source.write_text('x = 1\n')
+        meta_path = tmp_path / 'file_meta.json'
+        first = ContentHasher(meta_path=meta_path)
+        file_hash = first.hash_file(source)
+        first.save_meta()
+
+        second = ContentHasher(meta_path=meta_path)
+
+        assert second._meta[str(source)][2] == file_hash
+
+    def test_changed_file_is_rehashed(self, tmp_path):
+        """A size or mtime change invalidates the remembered hash."""
+        source = tmp_path / 'module.py'
+        source.write_text('x = 1\n')
+        hasher = ContentHasher(meta_path=tmp_path / 'file_meta.json')
+        first = hasher.hash_file(source)
+
+        source.write_text('x = 22\n')
+
+        assert hasher.hash_file(source) != first
+
+    def test_unreadable_meta_file_starts_empty(self, tmp_path):
+        """A corrupt metadata file is ignored rather than raising."""
+        meta_path = tmp_path / 'file_meta.json'
+        meta_path.write_text('not json')
+        source = tmp_path / 'module.py'
+        source.write_text('x = 1\n')
+
+        hasher = ContentHasher(meta_path=meta_path)
+
+        assert hasher.hash_file(source) == ContentHasher().hash_file(source)
+
+    def test_meta_from_other_algorithm_is_ignored(self, tmp_path):
+        """Entries recorded with a different hash algorithm are discarded."""
+        source = tmp_path / 'module.py'
+        source.write_text('x = 1\n')
+        stat = source.stat()
+        meta_path = tmp_path / 'file_meta.json'
+        meta_path.write_text(
+            json.dumps({'algorithm': 'md5', 'files': {str(source): [stat.st_mtime_ns, stat.st_size, 'stale']}})
+        )
+
+        hasher = ContentHasher(meta_path=meta_path)
+
+        assert hasher.hash_file(source) != 'stale'
+
+    def test_save_meta_without_path_is_noop(self, tmp_path):
+        """A hasher without a meta path never writes metadata."""
+        source = tmp_path / 'module.py'
+        source.write_text('x = 1\n')
+        hasher = ContentHasher()
+        hasher.hash_file(source)
+
+        hasher.save_meta()
+
+        assert list(tmp_path.iterdir()) == [source]
@@ -7,6 +7,7 @@ implement the invalidation rules for incremental analysis.
 import pytest
 
 from pytest_gremlins.cache.incremental import IncrementalCache
+from pytest_gremlins.cache.store import ResultStore
 
 
 @pytest.mark.medium
@@ -337,6 +338,11 @@ class TestIncrementalCache:
         assert stats['misses'] == 1
         assert stats['total_entries'] == 1
 
+    def test_cache_has_no_instance_dict(self, tmp_path):
+        """IncrementalCache declares its attributes as slots."""
+        with IncrementalCache(tmp_path / '.gremlins_cache') as cache:
+            assert not hasattr(cache, '__dict__')
+
     def test_empty_test_hashes_supported(self, tmp_path):
         """Cache works with empty test_hashes (no tests cover gremlin)."""
         result_data = {'gremlin_id': 'g001', 'status': 'survived'}
@@ -356,3 +362,116 @@ class TestIncrementalCache:
             )
 
         assert retrieved == result_data
+
+    def test_close_persists_file_metadata(self, tmp_path):
+        """File hashes are remembered in the cache directory across sessions."""
+        cache_dir = tmp_path / '.gremlins_cache'
+        test_file = tmp_path / 'test_module.py'
+        test_file.write_text('def test_a(): pass\n')
+
+        with IncrementalCache(cache_dir) as cache:
+            file_hash = cache.hash_file(test_file)
+
+        assert (cache_dir / 'file_meta.json').exists()
+        with IncrementalCache(cache_dir) as cache:
+            assert cache.hash_file(test_file) == file_hash
+
+    def test_repeat_lookup_is_served_from_memory(self, tmp_path):
+        """A second lookup for the same key does not query the store again."""
+        with IncrementalCache(tmp_path / '.gremlins_cache') as cache:
+            cache.cache_result('g001', 'hash', {'test': 'hash'}, {'status': 'zapped'})
+            cache.get_cached_result('g001', 'hash', {'test': 'hash'})
+
+            stats = cache.get_stats()
+
+        assert stats['hits'] == 1
+        assert stats['memory_hits'] == 1
+
+    def test_results_read_from_store_are_remembered(self, tmp_path):
+        """Results fetched from SQLite populate the in-memory layer."""
+        cache_dir = tmp_path / '.gremlins_cache'
+        with IncrementalCache(cache_dir) as cache:
+            cache.cache_result('g001', 'hash', {'test': 'hash'}, {'status': 'zapped'})
+
+        with IncrementalCache(cache_dir) as cache:
+            cache.get_cached_results([('g001', 'hash', {'test': 'hash'})])
+            cache.get_cached_results([('g001', 'hash', {'test': 'hash'})])
+
+            stats = cache.get_stats()
+
+        assert stats['hits'] == 2
+        assert stats['memory_hits'] == 1
+
+    def test_invalidate_file_drops_remembered_results(self, tmp_path):
+        """Invalidated entries are not served from memory afterwards."""
+        with IncrementalCache(tmp_path / '.gremlins_cache') as cache:
+            cache.cache_result('g001', 'hash', {'test': 'hash'}, {'status': 'zapped'})
+            cache.invalidate_file('g001')
+
+            assert cache.get_cached_result('g001', 'hash', {'test': 'hash'}) is None
+
+    def test_clear_drops_remembered_results(self, tmp_path):
+        """clear() empties the in-memory layer as well as the store."""
+        with IncrementalCache(tmp_path / '.gremlins_cache') as cache:
+            cache.cache_result('g001', 'hash', {'test': 'hash'}, {'status': 'zapped'})
+            cache.clear()
+
+            assert cache.get_cached_result('g001', 'hash', {'test': 'hash'}) is None
+            assert cache.get_stats()['memory_hits'] == 0
+
+    def test_memory_layer_is_bounded(self, tmp_path, monkeypatch):
+        """The in-memory layer evicts least recently used results when full."""
+        monkeypatch.setattr('pytest_gremlins.cache.incremental._RESULT_MEMO_SIZE', 2)
+        with IncrementalCache(tmp_path / '.gremlins_cache') as cache:
+            for gremlin_id in ('g001', 'g002', 'g003'):
+                cache.cache_result(gremlin_id, 'hash', {}, {'status': 'zapped'})
+
+            assert len(cache._result_memo) == 2
+            assert cache.get_cached_result('g001', 'hash', {}) == {'status': 'zapped'}
+            assert cache.get_stats()['memory_hits'] == 0
+
+    def test_changing_the_cached_dict_does_not_change_later_hits(self, tmp_path):
+        """The memory layer keeps its own copy of each cached result."""
+        result = {'status': 'zapped'}
+        with IncrementalCache(tmp_path / '.gremlins_cache') as cache:
+            cache.cache_result('g001', 'hash', {'test': 'hash'}, result)
+            result['status'] = 'survived'
+
+            assert cache.get_cached_result('g001', 'hash', {'test': 'hash'}) == {'status': 'zapped'}
+
+    def test_changing_a_returned_hit_does_not_change_later_hits(self, tmp_path):
+        """Every memory hit returns a fresh dict."""
+        with IncrementalCache(tmp_path / '.gremlins_cache') as cache:
+            cache.cache_result('g001', 'hash', {'test': 'hash'}, {'status': 'zapped'})
+            cache.get_cached_result('g001', 'hash', {'test': 'hash'})['status'] = 'MUTATED'
+            cache.get_cached_results([('g001', 'hash', {'test': 'hash'})])['g001']['status'] = 'MUTATED'
+
+            assert cache.get_cached_result('g001', 'hash', {'test': 'hash'}) == {'status': 'zapped'}
+            assert cache.get_stats()['memory_hits'] == 3
+
+    def test_hash_algorithm_change_clears_results(self, tmp_path, monkeypatch, caplog):
+        """Results keyed under another hash algorithm are cleared once on open."""
+        cache_dir = tmp_path / '.gremlins_cache'
+        with IncrementalCache(cache_dir) as cache:
+            cache.cache_result('g001', 'hash', {'test': 'hash'}, {'status': 'zapped'})
+
+        monkeypatch.setattr('pytest_gremlins.cache.incremental.HASH_ALGORITHM', 'other')
+        with IncrementalCache(cache_dir) as cache:
+            assert cache.get_cached_result('g001', 'hash', {'test': 'hash'}) is None
+            cache.cache_result('g001', 'hash', {'test': 'hash'}, {'status': 'survived'})
+
+        assert 'clearing the result cache' in caplog.text
+        caplog.clear()
+        with IncrementalCache(cache_dir) as cache:
+            assert cache.get_cached_result('g001', 'hash', {'test': 'hash'}) == {'status': 'survived'}
+        assert 'clearing' not in caplog.text
+
+    def test_results_without_recorded_algorithm_are_treated_as_sha256(self, tmp_path, monkeypatch):
+        """Caches written before the algorithm was recorded were keyed with SHA-256."""
+        cache_dir = tmp_path / '.gremlins_cache'
+        with ResultStore(cache_dir / 'results.db') as store:
+            store.put('g001:hash:no_tests', {'status': 'zapped'})
+
+        monkeypatch.setattr('pytest_gremlins.cache.incremental.HASH_ALGORITHM', 'sha256')
+        with IncrementalCache(cache_dir) as cache:
+            assert cache.get_cached_result('g001', 'hash', {}) == {'status': 'zapped'}
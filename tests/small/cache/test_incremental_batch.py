@@ -52,3 +52,51 @@ class TestIncrementalCacheBatchOperations:
         with IncrementalCache(cache_dir) as cache:
             result = cache.get_cached_result('g1', 'src', {'t': 'h'})
             assert result == {'status': 'zapped'}
+
+    def test_get_cached_results_maps_hits_by_gremlin_id(self, tmp_path: Path) -> None:
+        """get_cached_results returns hits keyed by gremlin ID and omits misses."""
+        with IncrementalCache(tmp_path / '.gremlins_cache') as cache:
+            cache.cache_result('g1', 'src', {'t': 'h'}, {'status': 'zapped'})
+            cache.cache_result('g2', 'src', {'t': 'h'}, {'status': 'survived'})
+
+            results = cache.get_cached_results(
+                [
+                    ('g1', 'src', {'t': 'h'}),
+                    ('g2', 'src', {'t': 'h'}),
+                    ('g3', 'src', {'t': 'h'}),
+                ]
+            )
+
+        assert results == {'g1': {'status': 'zapped'}, 'g2': {'status': 'survived'}}
+
+    def test_get_cached_results_updates_stats(self, tmp_path: Path) -> None:
+        """get_cached_results counts each requested gremlin as a hit or miss."""
+        with IncrementalCache(tmp_path / '.gremlins_cache') as cache:
+            cache.cache_result('g1', 'src', {'t': 'h'}, {'status': 'zapped'})
+
+            cache.get_cached_results(
+                [
+                    ('g1', 'src', {'t': 'h'}),
+                    ('g1', 'changed_src', {'t': 'h'}),
+                ]
+            )
+            stats = cache.get_stats()
+
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+
+    def test_cache_results_stores_all_items(self, tmp_path: Path) -> None:
+        """cache_results stores every result so later lookups hit."""
+        cache_dir = tmp_path / '.gremlins_cache'
+
+        with IncrementalCache(cache_dir) as cache:
+            cache.cache_results(
+                [
+                    ('g1', 'src', {'t': 'h'}, {'status': 'zapped'}),
+                    ('g2', 'src', {'t': 'h'}, {'status': 'survived'}),
+                ]
+            )
+
+        with IncrementalCache(cache_dir) as cache:
+            assert cache.get_cached_result('g1', 'src', {'t': 'h'}) == {'status': 'zapped'}
+            assert cache.get_cached_result('g2', 'src', {'t': 'h'}) == {'status': 'survived'}
@@ -4,6 +4,9 @@ The ResultStore persists gremlin results keyed by content hashes,
 enabling instant cache hits for unchanged code.
 """
 
+import logging
+import sqlite3
+
 import pytest
 
 from pytest_gremlins.cache.store import ResultStore
@@ -110,6 +113,18 @@ class TestResultStore:
         assert result1 is None
         assert result2 is None
 
+    def test_metadata_round_trips_and_survives_clear(self, tmp_path):
+        """Metadata values persist across reopen and are kept by clear."""
+        db_path = tmp_path / 'results.db'
+        with ResultStore(db_path) as store:
+            assert store.get_metadata('hash_algorithm') is None
+            store.set_metadata('hash_algorithm', 'sha256')
+            store.set_metadata('hash_algorithm', 'blake3')
+            store.clear()
+
+        with ResultStore(db_path) as store:
+            assert store.get_metadata('hash_algorithm') == 'blake3'
+
     def test_has_returns_true_for_existing_key(self, tmp_path):
         """has returns True when key exists in cache."""
         with ResultStore(tmp_path / 'results.db') as store:
@@ -142,6 +157,16 @@ class TestResultStore:
 
         assert keys == []
 
+    def test_iter_keys_yields_keys_lazily(self, tmp_path):
+        """iter_keys streams the same keys that keys() returns."""
+        with ResultStore(tmp_path / 'results.db') as store:
+            store.put('beta', {'status': 'survived'})
+            store.put('alpha', {'status': 'zapped'})
+            keys = store.iter_keys()
+
+            assert next(keys) == 'alpha'
+            assert list(keys) == ['beta']
+
     def test_count_returns_number_of_entries(self, tmp_path):
         """count returns total number of cached entries."""
         with ResultStore(tmp_path / 'results.db') as store:
@@ -218,3 +243,159 @@ class TestResultStore:
 
         assert retrieved == {'status': 'zapped'}
         assert 'corrupted' in caplog.text.lower()
+
+    def test_damaged_pages_are_detected_on_open(self, tmp_path, caplog):
+        """A database with a valid header but damaged pages is recreated on open."""
+        db_path = tmp_path / 'results.db'
+        with ResultStore(db_path) as store:
+            store.put_many((f'key{i}', {'status': 'zapped', 'padding': 'x' * 200}) for i in range(200))
+        data = bytearray(db_path.read_bytes())
+        data[2 * 8192 : 2 * 8192 + 64] = b'\xff' * 64
+        db_path.write_bytes(bytes(data))
+
+        with ResultStore(db_path) as store:
+            assert store.count() == 0
+
+        assert 'corrupted' in caplog.text.lower()
+
+    def test_database_uses_wal_journal_mode(self, tmp_path):
+        """The store opens its database in WAL mode with the requested sync level."""
+        with ResultStore(tmp_path / 'results.db', synchronous='full') as store:
+            journal_mode = store._conn.execute('PRAGMA journal_mode').fetchone()[0]
+            synchronous = store._conn.execute('PRAGMA synchronous').fetchone()[0]
+
+        assert journal_mode == 'wal'
+        assert synchronous == 2  # FULL
+
+    def test_connection_uses_memory_tuned_pragmas(self, tmp_path):
+        """The page cache, temp store and memory map are sized for the store's workload."""
+        with ResultStore(tmp_path / 'results.db') as store:
+            cache_size = store._conn.execute('PRAGMA cache_size').fetchone()[0]
+            temp_store = store._conn.execute('PRAGMA temp_store').fetchone()[0]
+
+        assert cache_size == -65536
+        assert temp_store == 2  # MEMORY
+
+    def test_logs_when_wal_is_not_accepted(self, tmp_path, monkeypatch, caplog):
+        """A database that refuses WAL still works and the fallback is logged."""
+        monkeypatch.setattr(ResultStore, '_connect', lambda _self: sqlite3.connect(':memory:', isolation_level=None))
+
+        with (
+            caplog.at_level(logging.DEBUG, logger='pytest_gremlins.cache.store'),
+            ResultStore(tmp_path / 'results.db') as store,
+        ):
+            store.put('key1', {'status': 'zapped'})
+            assert store.get('key1') == {'status': 'zapped'}
+
+        assert 'WAL journaling unavailable' in caplog.text
+
+    def test_new_database_clusters_rows_on_the_key(self, tmp_path):
+        """A freshly created results table is a WITHOUT ROWID table."""
+        with ResultStore(tmp_path / 'results.db') as store:
+            (sql,) = store._conn.execute("SELECT sql FROM sqlite_master WHERE name = 'results'").fetchone()
+
+        assert 'WITHOUT ROWID' in sql
+
+    def test_reads_and_writes_databases_with_rowid_layout(self, tmp_path):
+        """Databases created with the original rowid table keep working."""
+        db_path = tmp_path / 'results.db'
+        conn = sqlite3.connect(str(db_path))
+        conn.execute('CREATE TABLE results (cache_key TEXT PRIMARY KEY, result_json TEXT NOT NULL)')
+        conn.close()
+
+        with ResultStore(db_path) as store:
+            store.put_many([('file1:g001', {'status': 'zapped'}), ('file2:g001', {'status': 'survived'})])
+            store.delete_by_prefix('file1:')
+
+            assert store.keys() == ['file2:g001']
+            assert store.get('file2:g001') == {'status': 'survived'}
+
+    def test_new_database_uses_larger_pages(self, tmp_path):
+        """A freshly created database gets 8 KiB pages."""
+        with ResultStore(tmp_path / 'results.db') as store:
+            page_size = store._conn.execute('PRAGMA page_size').fetchone()[0]
+
+        assert page_size == 8192
+
+    def test_exclusive_store_keeps_the_database_locked(self, tmp_path):
+        """An exclusive store locks out other connections while it is open."""
+        db_path = tmp_path / 'results.db'
+
+        with ResultStore(db_path, exclusive=True) as store:
+            store.put('key1', {'status': 'zapped'})
+            locking_mode = store._conn.execute('PRAGMA locking_mode').fetchone()[0]
+            other = sqlite3.connect(str(db_path), timeout=0)
+            try:
+                with pytest.raises(sqlite3.OperationalError, match='locked'):
+                    other.execute('SELECT COUNT(*) FROM results').fetchone()
+            finally:
+                other.close()
+
+        assert locking_mode == 'exclusive'
+        with ResultStore(db_path) as store:
+            assert store.get('key1') == {'status': 'zapped'}
+
+    def test_locked_database_is_not_treated_as_corrupted(self, tmp_path, monkeypatch):
+        """An operational error on open is raised and the database file is kept."""
+        db_path = tmp_path / 'results.db'
+        with ResultStore(db_path) as store:
+            store.put('key1', {'status': 'zapped'})
+
+        def locked(_self, _conn):
+            raise sqlite3.OperationalError('database is locked')
+
+        monkeypatch.setattr(ResultStore, '_check_integrity', locked)
+        with pytest.raises(sqlite3.OperationalError, match='locked'):
+            ResultStore(db_path)
+        monkeypatch.undo()
+
+        with ResultStore(db_path) as store:
+            assert store.get('key1') == {'status': 'zapped'}
+
+    def test_invalid_synchronous_mode_raises(self, tmp_path):
+        """An unknown synchronous mode is rejected before touching the database."""
+        with pytest.raises(ValueError, match='Invalid synchronous mode'):
+            ResultStore(tmp_path / 'results.db', synchronous='sometimes')
+
+        assert not (tmp_path / 'results.db').exists()
+
+    def test_connection_runs_in_autocommit_mode(self, tmp_path):
+        """Single writes are committed without an explicit commit call."""
+        with ResultStore(tmp_path / 'results.db') as store:
+            store.put('key1', {'status': 'zapped'})
+
+            assert store._conn.isolation_level is None
+            assert not store._conn.in_transaction
+
+    def test_interleaved_reads_and_writes_share_cursors_safely(self, tmp_path):
+        """Reused lookup and write cursors do not interfere with each other."""
+        with ResultStore(tmp_path / 'results.db') as store:
+            for i in range(20):
+                store.put(f'key{i}', {'status': 'zapped', 'index': i})
+                assert store.has(f'key{i}')
+                assert store.get(f'key{i}') == {'status': 'zapped', 'index': i}
+
+            assert store.count() == 20
+
+    def test_delete_by_prefix_is_case_sensitive(self, tmp_path):
+        """Keys differing from the prefix only in case are kept."""
+        with ResultStore(tmp_path / 'results.db') as store:
+            store.put('file1:g001', {'status': 'zapped'})
+            store.put('FILE1:g001', {'status': 'zapped'})
+            store.delete_by_prefix('file1:')
+
+            assert store.keys() == ['FILE1:g001']
+
+    @pytest.mark.parametrize(
+        ('prefix', 'neighbour'),
+        [('a\U0010ffff', 'b'), ('\U0010ffff', 'z'), ('a\ud7ff', 'a\ue000')],
+    )
+    def test_delete_by_prefix_handles_boundary_code_points(self, tmp_path, prefix, neighbour):
+        """Prefixes ending in the highest code points match only their own keys."""
+        with ResultStore(tmp_path / 'results.db') as store:
+            store.put(prefix + ':g001', {'status': 'zapped'})
+            store.put(prefix + '\U0010ffff', {'status': 'zapped'})
+            store.put(neighbour, {'status': 'zapped'})
+            store.delete_by_prefix(prefix)
+
+            assert store.keys() == [neighbour]
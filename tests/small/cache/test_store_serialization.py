@@ -0,0 +1,65 @@
+"""Tests for result serialization in ResultStore."""
+
+from pathlib import Path
+import sqlite3
+
+import pytest
+
+from pytest_gremlins.cache import store as store_module
+from pytest_gremlins.cache.store import ResultStore
+
+
+@pytest.mark.medium
+class TestResultSerialization:
+    """Tests for the JSON codec used by ResultStore."""
+
+    @pytest.mark.parametrize('has_orjson', [True, False])
+    def test_round_trips_result_with_either_encoder(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, has_orjson: bool
+    ) -> None:
+        if has_orjson:
+            pytest.importorskip('orjson')
+        monkeypatch.setattr(store_module, '_HAS_ORJSON', has_orjson)
+        result = {'status': 'zapped', 'killing_test': 'test_foo', 'execution_time_ms': 1.5}
+
+        with ResultStore(tmp_path / 'results.db') as store:
+            store.put('key', result)
+            store.put_many([('batch', result)])
+
+            assert store.get('key') == result
+            assert store.get_many(['batch']) == {'batch': result}
+
+    def test_stores_encoded_results_as_blobs(self, tmp_path: Path) -> None:
+        with ResultStore(tmp_path / 'results.db') as store:
+            store.put('key', {'status': 'zapped'})
+            store.put_many([('batch', {'status': 'survived'})])
+
+            types = store._conn.execute('SELECT DISTINCT typeof(result_json) FROM results').fetchall()
+
+        assert types == [('blob',)]
+
+    def test_reads_rows_written_as_json_text(self, tmp_path: Path) -> None:
+        db_path = tmp_path / 'results.db'
+        with ResultStore(db_path):
+            pass
+        conn = sqlite3.connect(str(db_path))
+        conn.execute(
+            'INSERT INTO results (cache_key, result_json) VALUES (?, ?)',
+            ('legacy', '{"status": "survived", "killing_test": null}'),
+        )
+        conn.commit()
+        conn.close()
+
+        with ResultStore(db_path) as store:
+            assert store.get('legacy') == {'status': 'survived', 'killing_test': None}
+
+    def test_misses_never_reach_the_decoder(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        def fail_loads(_data: bytes | str) -> dict[str, object]:
+            raise AssertionError('decoder called on a miss')
+
+        with ResultStore(tmp_path / 'results.db') as store:
+            store.put('present', {'status': 'zapped'})
+            monkeypatch.setattr(store_module, '_loads', fail_loads)
+
+            assert store.get('missing') is None
+            assert store.get_many(['missing', 'also_missing']) == {}
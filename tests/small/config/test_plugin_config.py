@@ -85,3 +85,12 @@ class TestMergeConfigs:
         result = merge_configs(file_config, cli_operators=cli_operators)
 
         assert result.operators == ['boolean', 'arithmetic']
+
+    def test_cli_empty_items_are_dropped(self):
+        """Stray commas in CLI values do not produce empty names."""
+        file_config = GremlinConfig(paths=['src'])
+
+        result = merge_configs(file_config, cli_operators='boolean,,arithmetic,', cli_targets=' , ')
+
+        assert result.operators == ['boolean', 'arithmetic']
+        assert result.paths == ['src']
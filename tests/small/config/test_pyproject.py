@@ -6,7 +6,7 @@ provides defaults when configuration is absent.
 
 import pytest
 
-from pytest_gremlins.config import GremlinConfig, load_config
+from pytest_gremlins.config import GremlinConfig, _load_pyproject, load_config, load_config_from_mapping
 
 
 @pytest.mark.small
@@ -27,78 +27,105 @@ class TestLoadConfig:
         assert result.paths is None
         assert result.exclude is None
 
-    def test_returns_defaults_when_no_tool_section(self, tmp_path):
-        """Returns default config when [tool.pytest-gremlins] is absent."""
+    def test_reads_all_config_options(self, tmp_path):
+        """Reads all config options together."""
         pyproject = tmp_path / 'pyproject.toml'
-        pyproject.write_text('[project]\nname = "test"\n')
+        pyproject.write_text(
+            '[tool.pytest-gremlins]\noperators = ["boolean"]\npaths = ["src/mypackage"]\nexclude = ["**/conftest.py"]\n'
+        )
 
         result = load_config(tmp_path)
 
-        assert result.operators is None
-        assert result.paths is None
-        assert result.exclude is None
+        assert result.operators == ['boolean']
+        assert result.paths == ['src/mypackage']
+        assert result.exclude == ['**/conftest.py']
 
-    def test_reads_operators_list(self, tmp_path):
-        """Reads operators list from config."""
-        pyproject = tmp_path / 'pyproject.toml'
-        pyproject.write_text('[tool.pytest-gremlins]\noperators = ["comparison", "arithmetic"]\n')
+    def test_unchanged_file_is_parsed_once(self, tmp_path):
+        """Loading an unchanged pyproject.toml again reuses the parsed table."""
+        (tmp_path / 'pyproject.toml').write_text('[tool.pytest-gremlins]\noperators = ["comparison"]\n')
 
+        load_config(tmp_path)
+        hits_before = _load_pyproject.cache_info().hits
         result = load_config(tmp_path)
 
-        assert result.operators == ['comparison', 'arithmetic']
+        assert _load_pyproject.cache_info().hits == hits_before + 1
+        assert result.operators == ['comparison']
 
-    def test_reads_paths_list(self, tmp_path):
-        """Reads paths list from config."""
+    def test_edited_file_is_parsed_again(self, tmp_path):
+        """Changes to pyproject.toml are picked up by the next load."""
         pyproject = tmp_path / 'pyproject.toml'
-        pyproject.write_text('[tool.pytest-gremlins]\npaths = ["src", "lib"]\n')
+        pyproject.write_text('[tool.pytest-gremlins]\noperators = ["comparison"]\n')
+        load_config(tmp_path)
 
+        pyproject.write_text('[tool.pytest-gremlins]\noperators = ["comparison", "boolean"]\n')
         result = load_config(tmp_path)
 
-        assert result.paths == ['src', 'lib']
+        assert result.operators == ['comparison', 'boolean']
 
-    def test_reads_exclude_list(self, tmp_path):
-        """Reads exclude patterns list from config."""
-        pyproject = tmp_path / 'pyproject.toml'
-        pyproject.write_text('[tool.pytest-gremlins]\nexclude = ["**/migrations/*", "**/test_*"]\n')
+    def test_mutating_loaded_config_does_not_affect_later_loads(self, tmp_path):
+        """Each load returns fresh lists, even when the parse is cached."""
+        (tmp_path / 'pyproject.toml').write_text('[tool.pytest-gremlins]\npaths = ["src"]\n')
 
-        result = load_config(tmp_path)
+        first = load_config(tmp_path)
+        assert first.paths is not None
+        first.paths.append('tests')
 
-        assert result.exclude == ['**/migrations/*', '**/test_*']
+        assert load_config(tmp_path).paths == ['src']
 
-    def test_reads_all_config_options(self, tmp_path):
-        """Reads all config options together."""
-        pyproject = tmp_path / 'pyproject.toml'
-        pyproject.write_text(
-            '[tool.pytest-gremlins]\noperators = ["boolean"]\npaths = ["src/mypackage"]\nexclude = ["**/conftest.py"]\n'
-        )
 
-        result = load_config(tmp_path)
+@pytest.mark.small
+class TestLoadConfigFromMapping:
+    """Tests for load_config_from_mapping, which parses no files."""
 
-        assert result.operators == ['boolean']
-        assert result.paths == ['src/mypackage']
-        assert result.exclude == ['**/conftest.py']
+    def test_returns_defaults_when_no_tool_section(self):
+        """Returns default config when [tool.pytest-gremlins] is absent."""
+        result = load_config_from_mapping({'project': {'name': 'test'}})
 
-    def test_ignores_unknown_config_keys(self, tmp_path):
-        """Unknown config keys are ignored."""
-        pyproject = tmp_path / 'pyproject.toml'
-        pyproject.write_text('[tool.pytest-gremlins]\nunknown_key = "value"\noperators = ["comparison"]\n')
+        assert result.operators is None
+        assert result.paths is None
+        assert result.exclude is None
 
-        result = load_config(tmp_path)
+    @pytest.mark.parametrize(
+        ('tool_config', 'field', 'expected'),
+        [
+            ({'operators': ['comparison', 'arithmetic']}, 'operators', ['comparison', 'arithmetic']),
+            ({'paths': ['src', 'lib']}, 'paths', ['src', 'lib']),
+            ({'exclude': ['**/migrations/*', '**/test_*']}, 'exclude', ['**/migrations/*', '**/test_*']),
+        ],
+        ids=['operators', 'paths', 'exclude'],
+    )
+    def test_reads_list_option(self, tool_config, field, expected):
+        """Reads each list option from config."""
+        result = load_config_from_mapping({'tool': {'pytest-gremlins': tool_config}})
+
+        assert getattr(result, field) == expected
+
+    def test_ignores_unknown_config_keys(self):
+        """Unknown config keys are ignored."""
+        result = load_config_from_mapping(
+            {'tool': {'pytest-gremlins': {'unknown_key': 'value', 'operators': ['comparison']}}}
+        )
 
         assert result.operators == ['comparison']
         assert not hasattr(result, 'unknown_key')
 
-    def test_handles_empty_tool_section(self, tmp_path):
+    def test_handles_empty_tool_section(self):
         """Handles empty [tool.pytest-gremlins] section."""
-        pyproject = tmp_path / 'pyproject.toml'
-        pyproject.write_text('[tool.pytest-gremlins]\n')
-
-        result = load_config(tmp_path)
+        result = load_config_from_mapping({'tool': {'pytest-gremlins': {}}})
 
         assert result.operators is None
         assert result.paths is None
         assert result.exclude is None
 
+    def test_returned_lists_are_copies(self):
+        """The config does not share lists with the source mapping."""
+        data = {'tool': {'pytest-gremlins': {'paths': ['src']}}}
+
+        result = load_config_from_mapping(data)
+
+        assert result.paths == ['src']
+        assert result.paths is not data['tool']['pytest-gremlins']['paths']
+
 
 @pytest.mark.small
 class TestGremlinConfig:
@@ -123,3 +150,14 @@ class TestGremlinConfig:
         assert config.operators == ['comparison']
         assert config.paths == ['src']
         assert config.exclude == ['**/test_*']
+
+    def test_is_immutable(self):
+        """Fields cannot be reassigned after construction."""
+        config = GremlinConfig()
+
+        with pytest.raises(AttributeError):
+            config.paths = ['src']  # pyright: ignore[reportAttributeAccessIssue]
+
+    def test_has_no_instance_dict(self):
+        """Instances use slots rather than a per-instance __dict__."""
+        assert not hasattr(GremlinConfig(), '__dict__')
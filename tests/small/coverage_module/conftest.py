@@ -0,0 +1,41 @@
+"""Shared fixtures for coverage selection tests.
+
+Selectors only read a gremlin's location, so the AST nodes are parsed once
+and shared by every gremlin the factory builds.
+"""
+
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+from pytest_gremlins.instrumentation.gremlin import Gremlin
+
+
+_ORIGINAL = ast.parse('x', mode='eval').body
+_MUTATED = ast.parse('y', mode='eval').body
+
+
+@pytest.fixture(scope='session')
+def make_gremlin():
+    """Factory fixture for creating gremlins at a given location."""
+
+    def _make_gremlin(
+        file_path: str,
+        line_number: int,
+        gremlin_id: str = 'g001',
+        operator_name: str = 'test',
+        description: str = 'test',
+    ) -> Gremlin:
+        return Gremlin(
+            gremlin_id=gremlin_id,
+            file_path=file_path,
+            line_number=line_number,
+            original_node=_ORIGINAL,
+            mutated_node=_MUTATED,
+            operator_name=operator_name,
+            description=description,
+        )
+
+    return _make_gremlin
@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
 from pytest_gremlins.coverage.collector import CoverageCollector
 from pytest_gremlins.coverage.mapper import CoverageMap
 
 
+class FakeCoverageData:
+    """A minimal stand-in for coverage.py's CoverageData."""
+
+    __slots__ = ('_lines',)
+
+    def __init__(self, lines: dict[str, list[int] | None]) -> None:
+        self._lines = lines
+
+    def measured_files(self) -> list[str]:
+        return list(self._lines)
+
+    def lines(self, filename: str) -> list[int] | None:
+        return self._lines[filename]
+
+
 class TestCoverageCollectorCreation:
     """Test CoverageCollector initialization."""
 
@@ -54,15 +67,9 @@ class TestCoverageCollectorFromCoveragePy:
     def test_extract_from_coverage_data(self):
         collector = CoverageCollector()
 
-        # Mimic coverage.py's CoverageData structure
-        mock_coverage_data = MagicMock()
-        mock_coverage_data.measured_files.return_value = ['src/auth.py', 'src/utils.py']
-        mock_coverage_data.lines.side_effect = lambda f: {
-            'src/auth.py': [10, 11, 12],
-            'src/utils.py': [5, 6],
-        }[f]
+        coverage_data = FakeCoverageData({'src/auth.py': [10, 11, 12], 'src/utils.py': [5, 6]})
 
-        result = collector.extract_lines_from_coverage_data(mock_coverage_data)
+        result = collector.extract_lines_from_coverage_data(coverage_data)
 
         assert result == {
             'src/auth.py': [10, 11, 12],
@@ -72,15 +79,10 @@ class TestCoverageCollectorFromCoveragePy:
     def test_extract_from_coverage_data_handles_none_lines(self):
         collector = CoverageCollector()
 
-        # Mimic coverage.py's CoverageData structure where a file has no lines
-        mock_coverage_data = MagicMock()
-        mock_coverage_data.measured_files.return_value = ['src/auth.py', 'src/empty.py']
-        mock_coverage_data.lines.side_effect = lambda f: {
-            'src/auth.py': [10, 11],
-            'src/empty.py': None,  # No lines recorded
-        }[f]
+        # A measured file with no lines recorded
+        coverage_data = FakeCoverageData({'src/auth.py': [10, 11], 'src/empty.py': None})
 
-        result = collector.extract_lines_from_coverage_data(mock_coverage_data)
+        result = collector.extract_lines_from_coverage_data(coverage_data)
 
         assert result == {
             'src/auth.py': [10, 11],
@@ -90,14 +92,9 @@ class TestCoverageCollectorFromCoveragePy:
     def test_extract_from_coverage_data_handles_empty_lines(self):
         collector = CoverageCollector()
 
-        mock_coverage_data = MagicMock()
-        mock_coverage_data.measured_files.return_value = ['src/auth.py', 'src/empty.py']
-        mock_coverage_data.lines.side_effect = lambda f: {
-            'src/auth.py': [10, 11],
-            'src/empty.py': [],  # Empty list of lines
-        }[f]
+        coverage_data = FakeCoverageData({'src/auth.py': [10, 11], 'src/empty.py': []})
 
-        result = collector.extract_lines_from_coverage_data(mock_coverage_data)
+        result = collector.extract_lines_from_coverage_data(coverage_data)
 
         assert result == {
             'src/auth.py': [10, 11],
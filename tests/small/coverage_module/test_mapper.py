@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+
 import pytest
 
 from pytest_gremlins.coverage.mapper import CoverageMap
@@ -37,6 +39,35 @@ class TestCoverageMapAddCoverage:
         coverage_map.add('src/shipping.py', 17, 'test_calculate_shipping')
         assert len(coverage_map) == 2
 
+    def test_add_many_maps_every_line_to_the_test(self, coverage_map):
+        added = coverage_map.add_many('src/auth.py', iter([42, 43, 44]), 'test_login_success')
+        assert added == 3
+        assert sorted(coverage_map.locations()) == [('src/auth.py', 42), ('src/auth.py', 43), ('src/auth.py', 44)]
+        assert coverage_map.get_tests('src/auth.py', 43) == {'test_login_success'}
+
+    def test_add_test_coverage_maps_lines_across_files(self, coverage_map):
+        added = coverage_map.add_test_coverage('test_checkout', {'src/auth.py': [42, 43], 'src/cart.py': [7]})
+        assert added == 3
+        assert sorted(coverage_map.locations()) == [('src/auth.py', 42), ('src/auth.py', 43), ('src/cart.py', 7)]
+        assert coverage_map.get_tests('src/cart.py', 7) == {'test_checkout'}
+
+    def test_add_test_coverage_interns_paths_and_test_names(self, coverage_map):
+        # Built at runtime so they are not the interned literal objects.
+        stem = 'interned'
+        file_path = f'src/{stem}.py'
+        test_name = f'test_{stem}'
+        coverage_map.add_test_coverage(test_name, {file_path: [1]})
+
+        [(stored_path, _line)] = coverage_map.locations()
+        [stored_test] = coverage_map.get_tests_view('src/interned.py', 1)
+        assert stored_path is sys.intern('src/interned.py')
+        assert stored_test is sys.intern('test_interned')
+
+    def test_add_many_merges_with_existing_tests(self, coverage_map):
+        coverage_map.add('src/auth.py', 42, 'test_login_failure')
+        coverage_map.add_many('src/auth.py', [42], 'test_login_success')
+        assert coverage_map.get_tests('src/auth.py', 42) == {'test_login_failure', 'test_login_success'}
+
 
 class TestCoverageMapGetTests:
     """Test retrieving tests for a source location."""
@@ -62,6 +93,17 @@ class TestCoverageMapGetTests:
         result.add('intruder')  # Modify the result
         assert 'intruder' not in coverage_map.get_tests('src/auth.py', 42)
 
+    def test_get_tests_view_returns_tests_without_copying(self, coverage_map):
+        coverage_map.add('src/auth.py', 42, 'test_login_success')
+        view = coverage_map.get_tests_view('src/auth.py', 42)
+        assert view == {'test_login_success'}
+        assert view is coverage_map.get_tests_view('src/auth.py', 42)
+
+    def test_get_tests_view_returns_shared_empty_set_for_unknown_location(self, coverage_map):
+        coverage_map.add('src/auth.py', 42, 'test_login_success')
+        assert coverage_map.get_tests_view('src/auth.py', 99) == frozenset()
+        assert coverage_map.get_tests_view('unknown.py', 1) is coverage_map.get_tests_view('src/auth.py', 99)
+
 
 class TestCoverageMapIncidentallyTested:
     """Test identification of incidentally tested code.
@@ -105,6 +147,19 @@ class TestCoverageMapIncidentallyTested:
         ]
 
 
+class TestCoverageMapCountLinesPerTest:
+    """Test counting the locations each test covers."""
+
+    def test_count_lines_per_test_returns_empty_for_empty_map(self, coverage_map):
+        assert coverage_map.count_lines_per_test() == {}
+
+    def test_count_lines_per_test_counts_locations_across_files(self, coverage_map):
+        coverage_map.add_test_coverage('test_checkout', {'src/auth.py': [42, 43], 'src/cart.py': [7]})
+        coverage_map.add('src/auth.py', 42, 'test_login')
+        coverage_map.add('src/auth.py', 42, 'test_login')
+        assert coverage_map.count_lines_per_test() == {'test_checkout': 3, 'test_login': 1}
+
+
 class TestCoverageMapContains:
     """Test checking if a location is in the map."""
 
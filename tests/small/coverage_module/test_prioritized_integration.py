@@ -15,47 +15,51 @@ from pytest_gremlins.coverage.prioritized_selector import PrioritizedSelector
 from pytest_gremlins.instrumentation.gremlin import Gremlin
 
 
+_ORIGINAL = ast.parse('a < b', mode='eval').body
+_MUTATED = ast.parse('a <= b', mode='eval').body
+
+
+@pytest.fixture(scope='module')
+def coverage_map():
+    """Create a coverage map with tests of varying specificity."""
+    cm = CoverageMap()
+    # test_specific covers only line 42
+    cm.add('src/auth.py', 42, 'test_specific')
+    # test_medium covers lines 42-44
+    cm.add_many('src/auth.py', range(42, 45), 'test_medium')
+    # test_broad covers lines 42-51
+    cm.add_many('src/auth.py', range(42, 52), 'test_broad')
+    return cm
+
+
+@pytest.fixture(scope='module')
+def sample_gremlin():
+    """Create a sample gremlin at line 42."""
+    return Gremlin(
+        gremlin_id='g001',
+        file_path='src/auth.py',
+        line_number=42,
+        original_node=_ORIGINAL,
+        mutated_node=_MUTATED,
+        operator_name='comparison',
+        description='< to <=',
+    )
+
+
 class TestPrioritizedSelectorCompatibility:
     """Test that PrioritizedSelector can replace TestSelector in plugin usage."""
 
-    @pytest.fixture
-    def coverage_map(self):
-        """Create a coverage map with tests of varying specificity."""
-        cm = CoverageMap()
-        # test_specific covers only line 42
-        cm.add('src/auth.py', 42, 'test_specific')
-        # test_medium covers lines 42-44
-        for line in range(42, 45):
-            cm.add('src/auth.py', line, 'test_medium')
-        # test_broad covers lines 42-51
-        for line in range(42, 52):
-            cm.add('src/auth.py', line, 'test_broad')
-        return cm
-
-    @pytest.fixture
-    def sample_gremlin(self):
-        """Create a sample gremlin at line 42."""
-        return Gremlin(
-            gremlin_id='g001',
-            file_path='src/auth.py',
-            line_number=42,
-            original_node=ast.parse('a < b', mode='eval').body,
-            mutated_node=ast.parse('a <= b', mode='eval').body,
-            operator_name='comparison',
-            description='< to <=',
-        )
-
-    def test_prioritized_selector_provides_ordered_list_for_command_building(
+    def test_prioritized_selector_provides_ordered_sequence_for_command_building(
         self,
         coverage_map,
         sample_gremlin,
     ):
-        """Verify prioritized selection returns a list (not set) for command ordering."""
+        """Verify prioritized selection returns an ordered tuple (not a set) for command building."""
         selector = PrioritizedSelector(coverage_map)
         result = selector.select_tests_prioritized(sample_gremlin)
 
-        # Must be a list to preserve ordering in command building
-        assert isinstance(result, list)
+        # Must be an ordered sequence to preserve ordering in command building
+        assert isinstance(result, tuple)
         # First test should be most specific
         assert result[0] == 'test_specific'
 
@@ -74,8 +74,8 @@ class TestPrioritizedSelectorSelectTests:
         selector = PrioritizedSelector(coverage_map_with_specificity)
         result = selector.select_tests_prioritized(sample_gremlin)
 
-        # Result is a list ordered by specificity (most specific first)
-        assert isinstance(result, list)
+        # Result is a tuple ordered by specificity (most specific first)
+        assert isinstance(result, tuple)
         assert len(result) == 3
         # test_specific covers only 1 line -> highest priority
         assert result[0] == 'test_specific'
@@ -87,22 +87,16 @@ class TestPrioritizedSelectorSelectTests:
     def test_select_tests_returns_empty_for_uncovered_gremlin(
         self,
         coverage_map_with_specificity,
+        make_gremlin,
     ):
         selector = PrioritizedSelector(coverage_map_with_specificity)
-        gremlin = Gremlin(
-            gremlin_id='g999',
-            file_path='src/unknown.py',
-            line_number=1,
-            original_node=ast.parse('x', mode='eval').body,
-            mutated_node=ast.parse('y', mode='eval').body,
-            operator_name='test',
-            description='test',
-        )
+        gremlin = make_gremlin('src/unknown.py', 1, gremlin_id='g999')
         result = selector.select_tests_prioritized(gremlin)
-        assert result == []
+        assert result == ()
 
     def test_select_tests_maintains_order_stability_for_equal_specificity(
         self,
+        make_gremlin,
     ):
         """Tests with equal specificity maintain consistent ordering."""
 
@@ -116,15 +110,7 @@ class TestPrioritizedSelectorSelectTests:
         cm.add('src/auth.py', 43, 'test_gamma')
 
         selector = PrioritizedSelector(cm)
-        gremlin = Gremlin(
-            gremlin_id='g001',
-            file_path='src/auth.py',
-            line_number=42,
-            original_node=ast.parse('x', mode='eval').body,
-            mutated_node=ast.parse('y', mode='eval').body,
-            operator_name='test',
-            description='test',
-        )
+        gremlin = make_gremlin('src/auth.py', 42)
 
         result = selector.select_tests_prioritized(gremlin)
 
@@ -132,7 +118,30 @@ class TestPrioritizedSelectorSelectTests:
         assert len(result) == 3
         assert set(result) == {'test_alpha', 'test_beta', 'test_gamma'}
         # For equal specificity, sort alphabetically for determinism
-        assert result == ['test_alpha', 'test_beta', 'test_gamma']
+        assert result == ('test_alpha', 'test_beta', 'test_gamma')
+
+    def test_select_tests_returns_cached_ordering_for_a_shared_location(
+        self, coverage_map_with_specificity, monkeypatch
+    ):
+        selector = PrioritizedSelector(coverage_map_with_specificity)
+        first = selector.select_tests_for_location_prioritized('src/auth.py', 42)
+
+        def fail_prioritize(_tests):
+            raise AssertionError('location was sorted twice')
+
+        monkeypatch.setattr(selector, '_prioritize', fail_prioritize)
+        second = selector.select_tests_for_location_prioritized('src/auth.py', 42)
+
+        assert second is first
+
+    def test_select_tests_puts_tests_added_after_ranking_last(self, coverage_map_with_specificity):
+        selector = PrioritizedSelector(coverage_map_with_specificity)
+        selector.select_tests_for_location_prioritized('src/auth.py', 42)
+
+        coverage_map_with_specificity.add('src/auth.py', 42, 'test_late')
+        result = selector.select_tests_for_location_prioritized('src/auth.py', 42)
+
+        assert result == ('test_specific', 'test_medium', 'test_broad', 'test_late')
 
 
 class TestTestSpecificityComputation:
@@ -177,24 +186,43 @@ class TestPrioritizedSelectorStats:
         assert 'specificity_range' in stats
         assert stats['specificity_range'] == (1, 10)  # min, max lines covered
 
-    def test_stats_for_uncovered_gremlin_has_none_values(self):
+    def test_stats_range_is_computed_once_per_location(
+        self,
+        coverage_map_with_specificity,
+        sample_gremlin,
+        monkeypatch,
+    ):
+        selector = PrioritizedSelector(coverage_map_with_specificity)
+        selector.select_tests_with_stats(sample_gremlin)
+
+        def fail_specificity():
+            raise AssertionError('specificity range recomputed')
+
+        monkeypatch.setattr(selector, 'get_test_specificity', fail_specificity)
+        _tests, stats = selector.select_tests_with_stats(sample_gremlin)
+
+        assert stats['specificity_range'] == (1, 10)
+
+    def test_stats_range_follows_tests_added_to_the_location(self, coverage_map_with_specificity, sample_gremlin):
+        selector = PrioritizedSelector(coverage_map_with_specificity)
+        selector.select_tests_with_stats(sample_gremlin)
+
+        coverage_map_with_specificity.add('src/auth.py', 42, 'test_late')
+        tests, stats = selector.select_tests_with_stats(sample_gremlin)
+
+        assert tests[-1] == 'test_late'
+        assert stats['specificity_range'] == (0, 10)
+
+    def test_stats_for_uncovered_gremlin_has_none_values(self, make_gremlin):
         cm = CoverageMap()
         cm.add('src/auth.py', 42, 'test_something')  # Different file
 
         selector = PrioritizedSelector(cm)
-        gremlin = Gremlin(
-            gremlin_id='g999',
-            file_path='src/unknown.py',
-            line_number=1,
-            original_node=ast.parse('x', mode='eval').body,
-            mutated_node=ast.parse('y', mode='eval').body,
-            operator_name='test',
-            description='test',
-        )
+        gremlin = make_gremlin('src/unknown.py', 1, gremlin_id='g999')
 
         tests, stats = selector.select_tests_with_stats(gremlin)
 
-        assert tests == []
+        assert tests == ()
         assert stats['selected_count'] == 0
         assert stats['most_specific_test'] is None
         assert stats['specificity_range'] == (0, 0)
@@ -11,21 +11,26 @@ from pytest_gremlins.coverage.selector import TestSelector as Selector
 from pytest_gremlins.instrumentation.gremlin import Gremlin
 
 
-@pytest.fixture
+# Parsed once and shared: the selector only reads a gremlin's location.
+_ORIGINAL = ast.parse('a < b', mode='eval').body
+_MUTATED = ast.parse('a <= b', mode='eval').body
+
+
+@pytest.fixture(scope='module')
 def sample_gremlin():
     """Create a sample gremlin for testing."""
     return Gremlin(
         gremlin_id='g001',
         file_path='src/auth.py',
         line_number=42,
-        original_node=ast.parse('a < b', mode='eval').body,
-        mutated_node=ast.parse('a <= b', mode='eval').body,
+        original_node=_ORIGINAL,
+        mutated_node=_MUTATED,
         operator_name='comparison',
         description='< to <=',
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def coverage_map():
     """Create a CoverageMap with test data."""
     cm = CoverageMap()
@@ -57,30 +62,14 @@ class TestSelectorSelectTests:
         result = selector.select_tests(sample_gremlin)
         assert result == {'test_login_success', 'test_login_failure'}
 
-    def test_select_tests_returns_empty_for_uncovered_gremlin(self, selector):
-        gremlin = Gremlin(
-            gremlin_id='g999',
-            file_path='src/unknown.py',
-            line_number=1,
-            original_node=ast.parse('x', mode='eval').body,
-            mutated_node=ast.parse('y', mode='eval').body,
-            operator_name='test',
-            description='test',
-        )
+    def test_select_tests_returns_empty_for_uncovered_gremlin(self, selector, make_gremlin):
+        gremlin = make_gremlin('src/unknown.py', 1, gremlin_id='g999')
         result = selector.select_tests(gremlin)
         assert result == set()
 
-    def test_select_tests_uses_file_path_and_line_from_gremlin(self, coverage_map):
+    def test_select_tests_uses_file_path_and_line_from_gremlin(self, coverage_map, make_gremlin):
         selector = Selector(coverage_map)
-        gremlin = Gremlin(
-            gremlin_id='g002',
-            file_path='src/shipping.py',
-            line_number=17,
-            original_node=ast.parse('x', mode='eval').body,
-            mutated_node=ast.parse('y', mode='eval').body,
-            operator_name='test',
-            description='test',
-        )
+        gremlin = make_gremlin('src/shipping.py', 17, gremlin_id='g002')
         result = selector.select_tests(gremlin)
         assert result == {'test_calculate_shipping'}
 
@@ -100,26 +89,10 @@ class TestSelectorSelectTestsForLocation:
 class TestSelectorBatchSelection:
     """Test selecting tests for multiple gremlins."""
 
-    def test_select_tests_for_gremlins_returns_all_matching_tests(self, selector):
+    def test_select_tests_for_gremlins_returns_all_matching_tests(self, selector, make_gremlin):
         gremlins = [
-            Gremlin(
-                gremlin_id='g001',
-                file_path='src/auth.py',
-                line_number=42,
-                original_node=ast.parse('x', mode='eval').body,
-                mutated_node=ast.parse('y', mode='eval').body,
-                operator_name='test',
-                description='test',
-            ),
-            Gremlin(
-                gremlin_id='g002',
-                file_path='src/shipping.py',
-                line_number=17,
-                original_node=ast.parse('x', mode='eval').body,
-                mutated_node=ast.parse('y', mode='eval').body,
-                operator_name='test',
-                description='test',
-            ),
+            make_gremlin('src/auth.py', 42),
+            make_gremlin('src/shipping.py', 17, gremlin_id='g002'),
         ]
         result = selector.select_tests_for_gremlins(gremlins)
         assert result == {
@@ -128,26 +101,11 @@ class TestSelectorBatchSelection:
             'test_calculate_shipping',
         }
 
-    def test_select_tests_for_gremlins_deduplicates(self, selector):
+    def test_select_tests_for_gremlins_deduplicates(self, selector, make_gremlin):
         gremlins = [
-            Gremlin(
-                gremlin_id='g001',
-                file_path='src/auth.py',
-                line_number=42,
-                original_node=ast.parse('x', mode='eval').body,
-                mutated_node=ast.parse('y', mode='eval').body,
-                operator_name='test',
-                description='test',
-            ),
-            Gremlin(
-                gremlin_id='g002',
-                file_path='src/auth.py',
-                line_number=42,  # Same location
-                original_node=ast.parse('x', mode='eval').body,
-                mutated_node=ast.parse('y', mode='eval').body,
-                operator_name='different',
-                description='different',
-            ),
+            make_gremlin('src/auth.py', 42),
+            # Same location as the first gremlin
+            make_gremlin('src/auth.py', 42, gremlin_id='g002', operator_name='different', description='different'),
         ]
         result = selector.select_tests_for_gremlins(gremlins)
         assert result == {'test_login_success', 'test_login_failure'}
@@ -156,16 +114,8 @@ class TestSelectorBatchSelection:
 class TestSelectorStats:
     """Test selector statistics."""
 
-    def test_get_selection_stats_empty_result(self, selector):
-        gremlin = Gremlin(
-            gremlin_id='g999',
-            file_path='unknown.py',
-            line_number=1,
-            original_node=ast.parse('x', mode='eval').body,
-            mutated_node=ast.parse('y', mode='eval').body,
-            operator_name='test',
-            description='test',
-        )
+    def test_get_selection_stats_empty_result(self, selector, make_gremlin):
+        gremlin = make_gremlin('unknown.py', 1, gremlin_id='g999')
         tests, stats = selector.select_tests_with_stats(gremlin)
         assert tests == set()
         assert stats['selected_count'] == 0
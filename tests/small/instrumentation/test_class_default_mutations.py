@@ -11,11 +11,21 @@ These tests verify the instrumentation layer handles class-level constants.
 from __future__ import annotations
 
 import ast
+from typing import TYPE_CHECKING
 
 from pytest_gremlins.instrumentation.transformer import transform_source
 from pytest_gremlins.operators.boolean import BooleanOperator
 
 
+if TYPE_CHECKING:
+    from types import CodeType
+
+
+def _compiled(tree: ast.Module) -> CodeType:
+    """Fill in missing locations on a transformed tree and compile it."""
+    return compile(ast.fix_missing_locations(tree), 'example.py', 'exec')
+
+
 class TestTransformerDetectsClassDefaultBooleans:
     """Verify the transformer creates gremlins for boolean defaults in class bodies."""
 
@@ -91,9 +101,7 @@ class Addr:
     last: bool = False
 """
         _gremlins, tree = transform_source(source, 'example.py', [BooleanOperator()])
-        ast.fix_missing_locations(tree)
-
-        code = compile(tree, 'example.py', 'exec')
+        code = _compiled(tree)
         # NOTE: exec() is used intentionally to test AST-generated instrumented code.
         # This is testing mutation switching infrastructure, not running untrusted input.
         exec_globals: dict[str, object] = {'__gremlin_active__': None}
@@ -112,11 +120,9 @@ class Addr:
     last: bool = False
 """
         gremlins, tree = transform_source(source, 'example.py', [BooleanOperator()])
-        ast.fix_missing_locations(tree)
-
         # Activate the gremlin that flips False to True
         gremlin_id = gremlins[0].gremlin_id
-        code = compile(tree, 'example.py', 'exec')
+        code = _compiled(tree)
         # NOTE: exec() is used intentionally to test AST-generated instrumented code.
         exec_globals: dict[str, object] = {'__gremlin_active__': gremlin_id}
         exec(code, exec_globals)  # noqa: S102
@@ -134,10 +140,8 @@ class Range:
     from0: bool = True
 """
         gremlins, tree = transform_source(source, 'example.py', [BooleanOperator()])
-        ast.fix_missing_locations(tree)
-
         gremlin_id = gremlins[0].gremlin_id
-        code = compile(tree, 'example.py', 'exec')
+        code = _compiled(tree)
         # NOTE: exec() is used intentionally to test AST-generated instrumented code.
         exec_globals: dict[str, object] = {'__gremlin_active__': gremlin_id}
         exec(code, exec_globals)  # noqa: S102
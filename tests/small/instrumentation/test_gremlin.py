@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import ast
+import pickle
 
 import pytest
 
@@ -43,3 +44,13 @@ class TestGremlinCreation:
     def test_gremlin_is_immutable(self, sample_gremlin):
         with pytest.raises(AttributeError):
             sample_gremlin.gremlin_id = 'g002'
+
+    def test_gremlin_has_no_instance_dict(self, sample_gremlin):
+        assert not hasattr(sample_gremlin, '__dict__')
+
+    def test_gremlin_survives_pickling(self, sample_gremlin):
+        restored = pickle.loads(pickle.dumps(sample_gremlin))  # noqa: S301
+
+        assert restored.gremlin_id == sample_gremlin.gremlin_id
+        assert restored.line_number == sample_gremlin.line_number
+        assert ast.dump(restored.mutated_node) == ast.dump(sample_gremlin.mutated_node)
@@ -54,6 +54,17 @@ class TestGremlinFinder:
         assert isinstance(result, ModuleSpec)
         assert result.name == 'my_module'
 
+    def test_find_spec_reuses_loader_but_not_spec_across_calls(self):
+        finder = GremlinFinder(instrumented_modules={'my_module': ast.parse('x = 1')})
+
+        first = finder.find_spec('my_module', None)
+        second = finder.find_spec('my_module', None)
+
+        assert first is not None
+        assert second is not None
+        assert first is not second
+        assert first.loader is second.loader
+
     def test_find_spec_returns_none_for_submodule_when_only_parent_instrumented(self):
         tree = ast.parse('x = 1')
         instrumented_modules = {'my_package': tree}
@@ -94,6 +105,15 @@ class TestGremlinLoader:
 
         assert module.result == 42  # type: ignore[attr-defined]
 
+    def test_exec_module_executes_precompiled_code(self):
+        code = compile('result = 42', 'test_module', 'exec')
+        loader = GremlinLoader(code, module_name='test_module')
+
+        module = types.ModuleType('test_module')
+        loader.exec_module(module)
+
+        assert module.result == 42  # type: ignore[attr-defined]
+
     def test_exec_module_injects_gremlin_active_variable(self):
         source = 'value = __gremlin_active__'
         tree = ast.parse(source)
@@ -136,6 +156,22 @@ class TestImportHookRegistration:
         finder_types = [type(f) for f in sys.meta_path]
         assert GremlinFinder in finder_types
 
+    def test_register_hooks_compiles_modules_once_up_front(self, clean_meta_path, monkeypatch):  # noqa: ARG002
+        tree = ast.fix_missing_locations(ast.parse('value = 1'))
+        register_import_hooks(instrumented_modules={'_gremlin_precompiled': tree})
+
+        def fail_compile(*_args, **_kwargs):
+            raise AssertionError('module compiled again on import')
+
+        monkeypatch.setattr('builtins.compile', fail_compile)
+        spec = sys.meta_path[0].find_spec('_gremlin_precompiled', None)
+        assert spec is not None
+        module = types.ModuleType('_gremlin_precompiled')
+        spec.loader.exec_module(module)  # type: ignore[union-attr]
+        unregister_import_hooks()
+
+        assert module.value == 1  # type: ignore[attr-defined]
+
     def test_unregister_hooks_removes_finder_from_meta_path(self, clean_meta_path):  # noqa: ARG002
         register_import_hooks(instrumented_modules={})
         unregister_import_hooks()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import ast
+import functools
 
 import pytest
 
@@ -16,6 +17,44 @@ from pytest_gremlins.instrumentation.transformer import (
 from pytest_gremlins.operators.comparison import ComparisonOperator
 
 
+_IS_ADULT_SOURCE = """
+def is_adult(age):
+    return age >= 18
+"""
+
+
+# Sources repeat across the operator presence cases; transform each one once.
+# Callers only read the returned gremlins and tree.
+_transform = functools.cache(transform_source)
+
+
+# Parsed once at import; generate_comparison_mutations leaves its input untouched.
+_COMPARE_CASES = [
+    pytest.param(ast.parse(source, mode='eval').body, expected_ops, id=source)
+    for source, expected_ops in [
+        ('x < 10', ['LtE', 'Gt']),
+        ('x <= 10', ['Lt', 'Gt']),
+        ('x > 10', ['GtE', 'Lt']),
+        ('x >= 10', ['Gt', 'Lt']),
+        ('x == 10', ['NotEq']),
+        ('x != 10', ['Eq']),
+    ]
+]
+
+
+@pytest.fixture(scope='module')
+def is_adult_transformed():
+    """Transform the is_adult source once; tests only read or compile the result."""
+    return transform_source(_IS_ADULT_SOURCE, 'example.py')
+
+
+@pytest.fixture(scope='module')
+def is_adult_code(is_adult_transformed):
+    """Compile the transformed is_adult module once; tests exec it with their own globals."""
+    _, tree = is_adult_transformed
+    return compile(ast.fix_missing_locations(tree), 'example.py', 'exec')
+
+
 class TestMutationGenerator:
     """Test generating mutations for comparison operators."""
 
@@ -32,21 +71,8 @@ class TestMutationGenerator:
         assert 'LtE' in mutation_ops
         assert 'Gt' in mutation_ops
 
-    @pytest.mark.parametrize(
-        ('source', 'expected_ops'),
-        [
-            ('x < 10', ['LtE', 'Gt']),
-            ('x <= 10', ['Lt', 'Gt']),
-            ('x > 10', ['GtE', 'Lt']),
-            ('x >= 10', ['Gt', 'Lt']),
-            ('x == 10', ['NotEq']),
-            ('x != 10', ['Eq']),
-        ],
-    )
-    def test_generate_mutations_for_comparison_operators(self, source, expected_ops):
-        tree = ast.parse(source, mode='eval')
-        compare_node = tree.body
-
+    @pytest.mark.parametrize(('compare_node', 'expected_ops'), _COMPARE_CASES)
+    def test_generate_mutations_for_comparison_operators(self, compare_node, expected_ops):
         mutations = generate_comparison_mutations(compare_node)
 
         actual_ops = [m.ops[0].__class__.__name__ for m in mutations]
@@ -93,11 +119,7 @@ class TestBuildSwitchingCode:
     """Test building AST code that implements mutation switching."""
 
     def test_build_switching_expression_returns_if_expression(self):
-        source = """
-def is_adult(age):
-    return age >= 18
-"""
-        gremlins, tree = collect_gremlins(source, 'example.py')
+        gremlins, tree = collect_gremlins(_IS_ADULT_SOURCE, 'example.py')
         func_def = tree.body[0]
         assert isinstance(func_def, ast.FunctionDef)
         return_stmt = func_def.body[0]
@@ -150,12 +172,8 @@ def is_adult(age):
 class TestMutationSwitchingTransformer:
     """Test the full AST transformer that embeds mutation switching."""
 
-    def test_transform_source_replaces_comparisons_with_switches(self):
-        source = """
-def is_adult(age):
-    return age >= 18
-"""
-        gremlins, tree = transform_source(source, 'example.py')
+    def test_transform_source_replaces_comparisons_with_switches(self, is_adult_transformed):
+        gremlins, tree = is_adult_transformed
 
         # Now uses all 5 operators: 2 comparison + 2 boundary + 1 return = 5 gremlins
         assert len(gremlins) >= 2
@@ -165,40 +183,24 @@ def is_adult(age):
         function_body = func_def.body[0]
         assert isinstance(function_body, ast.If)
 
-    def test_transformed_code_executes_correctly_with_no_gremlin(self):
-        source = """
-def is_adult(age):
-    return age >= 18
-"""
-        _, tree = transform_source(source, 'example.py')
-        ast.fix_missing_locations(tree)
-
-        code = compile(tree, 'example.py', 'exec')
+    @pytest.mark.parametrize(('age', 'expected'), [(21, True), (18, True), (17, False)])
+    def test_transformed_code_executes_correctly_with_no_gremlin(self, is_adult_code, age, expected):
         exec_globals: dict[str, object] = {'__gremlin_active__': None}
         # NOTE: Python's exec() builtin is used intentionally here to test AST-generated code
         # This is testing mutation testing infrastructure in a controlled test environment
         # Not using shell commands - this is Python code execution
-        exec(code, exec_globals)  # noqa: S102
+        exec(is_adult_code, exec_globals)  # noqa: S102
 
         is_adult = exec_globals['is_adult']
         assert callable(is_adult)
-        assert is_adult(21) is True
-        assert is_adult(18) is True
-        assert is_adult(17) is False
+        assert is_adult(age) is expected
 
-    def test_transformed_code_executes_mutation_when_gremlin_active(self):
-        source = """
-def is_adult(age):
-    return age >= 18
-"""
-        gremlins, tree = transform_source(source, 'example.py')
-        ast.fix_missing_locations(tree)
-
-        code = compile(tree, 'example.py', 'exec')
+    def test_transformed_code_executes_mutation_when_gremlin_active(self, is_adult_transformed, is_adult_code):
+        gremlins, _ = is_adult_transformed
         exec_globals: dict[str, object] = {'__gremlin_active__': gremlins[0].gremlin_id}
         # NOTE: Python's exec() builtin is used intentionally here to test AST-generated code
         # This is testing mutation testing infrastructure in a controlled test environment
-        exec(code, exec_globals)  # noqa: S102
+        exec(is_adult_code, exec_globals)  # noqa: S102
 
         is_adult = exec_globals['is_adult']
         assert callable(is_adult)
@@ -208,45 +210,27 @@ def is_adult(age):
 class TestMultiOperatorTransformer:
     """Test transformer with multiple operators."""
 
-    def test_transform_source_generates_gremlins_for_arithmetic_operations(self):
-        source = """
-def calculate(x, y):
-    return x + y
-"""
-        gremlins, _tree = transform_source(source, 'example.py')
-
-        assert len(gremlins) >= 1
-        assert any(g.operator_name == 'arithmetic' for g in gremlins)
-
-    def test_transform_source_generates_gremlins_for_boolean_operations(self):
-        source = """
-def check(a, b):
-    return a and b
-"""
-        gremlins, _tree = transform_source(source, 'example.py')
-
-        assert len(gremlins) >= 1
-        assert any(g.operator_name == 'boolean' for g in gremlins)
-
-    def test_transform_source_generates_gremlins_for_boundary_conditions(self):
-        source = """
-def is_adult(age):
-    return age >= 18
-"""
-        gremlins, _tree = transform_source(source, 'example.py')
-
-        boundary_gremlins = [g for g in gremlins if g.operator_name == 'boundary']
-        assert len(boundary_gremlins) >= 1
-
-    def test_transform_source_generates_gremlins_for_return_statements(self):
-        source = """
-def get_value():
-    return 42
-"""
-        gremlins, _tree = transform_source(source, 'example.py')
+    @pytest.mark.parametrize(
+        ('source', 'operator_name', 'present'),
+        [
+            pytest.param('def calculate(x, y):\n    return x + y\n', 'arithmetic', True, id='arithmetic'),
+            pytest.param('def check(a, b):\n    return a and b\n', 'boolean', True, id='boolean'),
+            pytest.param(_IS_ADULT_SOURCE, 'boundary', True, id='boundary'),
+            pytest.param('def get_value():\n    return 42\n', 'return', True, id='return'),
+            pytest.param('def bitwise(x, y):\n    return x & y\n', 'return', True, id='return-with-bitwise-binop'),
+            pytest.param('def check(x):\n    return x\n', 'return', True, id='return-without-boolop'),
+            pytest.param(
+                'def bitwise(x, y):\n    a = x & y\n    return a\n', 'arithmetic', False, id='no-arithmetic-for-bitwise'
+            ),
+            pytest.param('def negate(x):\n    return -x\n', 'boolean', False, id='no-boolean-for-unary-minus'),
+            pytest.param('def check(x):\n    return x is None\n', 'comparison', False, id='no-comparison-for-is'),
+            pytest.param('def get_value():\n    return 42\n', 'boolean', False, id='no-boolean-for-int-constant'),
+        ],
+    )
+    def test_operator_presence(self, source, operator_name, present):
+        gremlins, _tree = _transform(source, 'example.py')
 
-        assert len(gremlins) >= 1
-        assert any(g.operator_name == 'return' for g in gremlins)
+        assert any(g.operator_name == operator_name for g in gremlins) is present
 
     def test_transform_source_uses_all_five_operators(self):
         source = """
@@ -257,7 +241,7 @@ def complex_function(x, y):
         return True
     return False
 """
-        gremlins, _tree = transform_source(source, 'example.py')
+        gremlins, _tree = _transform(source, 'example.py')
 
         operator_names = {g.operator_name for g in gremlins}
         assert 'comparison' in operator_names
@@ -267,101 +251,18 @@ def complex_function(x, y):
         assert 'return' in operator_names
 
     def test_transform_source_generates_gremlins_for_not_operator(self):
-        source = """
-def negate(x):
-    return not x
-"""
-        gremlins, _tree = transform_source(source, 'example.py')
+        gremlins, _tree = _transform('def negate(x):\n    return not x\n', 'example.py')
 
         assert any(g.operator_name == 'boolean' for g in gremlins)
         assert any('not' in g.description.lower() for g in gremlins)
 
     def test_transform_source_handles_return_true_false_mutations(self):
-        source = """
-def check():
-    return True
-"""
-        gremlins, _tree = transform_source(source, 'example.py')
+        gremlins, _tree = _transform('def check():\n    return True\n', 'example.py')
 
         # True/False mutations come from boolean operator, not return
         boolean_gremlins = [g for g in gremlins if g.operator_name == 'boolean']
         assert any('True' in g.description or 'False' in g.description for g in boolean_gremlins)
 
-    def test_transform_source_handles_unsupported_binop(self):
-        source = """
-def bitwise(x, y):
-    return x & y
-"""
-        gremlins, _tree = transform_source(source, 'example.py')
-
-        # BitAnd is not a supported arithmetic operator
-        # But return mutation should still work
-        return_gremlins = [g for g in gremlins if g.operator_name == 'return']
-        assert len(return_gremlins) >= 1
-
-    def test_transform_source_handles_unsupported_boolop(self):
-        source = """
-def check(x):
-    return x
-"""
-        # No boolean operations, just testing that visitor handles code without them
-        gremlins, _tree = transform_source(source, 'example.py')
-        # Should have at least return gremlins
-        assert any(g.operator_name == 'return' for g in gremlins)
-
-
-class TestTransformerEdgeCases:
-    """Test edge cases in the transformer."""
-
-    def test_transform_source_handles_bitwise_binop(self):
-        """BitAnd is a BinOp but not mutated by arithmetic operator."""
-        source = """
-def bitwise(x, y):
-    a = x & y
-    return a
-"""
-        gremlins, _tree = transform_source(source, 'example.py')
-
-        # Should have return gremlins but no arithmetic for bitwise
-        arithmetic_gremlins = [g for g in gremlins if g.operator_name == 'arithmetic']
-        assert len(arithmetic_gremlins) == 0  # & is not an arithmetic operator
-
-    def test_transform_source_handles_unary_minus(self):
-        """Unary minus is a UnaryOp but not mutated by boolean operator."""
-        source = """
-def negate(x):
-    return -x
-"""
-        gremlins, _tree = transform_source(source, 'example.py')
-
-        # Should have return gremlins but no boolean for unary minus
-        boolean_gremlins = [g for g in gremlins if g.operator_name == 'boolean']
-        assert len(boolean_gremlins) == 0  # -x is not a boolean operator
-
-    def test_transform_source_handles_unsupported_comparison(self):
-        """Is/IsNot comparisons are not mutated."""
-        source = """
-def check(x):
-    return x is None
-"""
-        gremlins, _tree = transform_source(source, 'example.py')
-
-        # Is operator is not mutated by comparison operator
-        comparison_gremlins = [g for g in gremlins if g.operator_name == 'comparison']
-        assert len(comparison_gremlins) == 0
-
-    def test_transform_source_handles_non_boolean_constant(self):
-        """Non-boolean constants are not mutated by boolean operator."""
-        source = """
-def get_value():
-    return 42
-"""
-        gremlins, _tree = transform_source(source, 'example.py')
-
-        # 42 is not a boolean constant
-        boolean_gremlins = [g for g in gremlins if g.operator_name == 'boolean']
-        assert len(boolean_gremlins) == 0
-
 
 class TestCreateGremlinsForNode:
     """Test create_gremlins_for_node function directly."""
@@ -18,6 +18,15 @@ from pytest_gremlins.instrumentation.transformer import (
 from pytest_gremlins.operators import ComparisonOperator
 
 
+_COMPARE_GE_10 = ast.parse('x >= 10', mode='eval').body
+
+
+@pytest.fixture(scope='module')
+def comparison_only():
+    """Operator list with only the comparison operator, shared by the module."""
+    return [ComparisonOperator()]
+
+
 @pytest.mark.small
 class TestReturnDescriptionConstantToConstant:
     """Tests for _get_return_description with constant-to-constant mutations."""
@@ -55,7 +64,7 @@ class TestReturnDescriptionConstantToConstant:
 class TestTransformerEdgeCasesForCoverage:
     """Tests for transformer visitor edge cases."""
 
-    def test_visit_boolop_returns_unchanged_when_no_gremlins(self) -> None:
+    def test_visit_boolop_returns_unchanged_when_no_gremlins(self, comparison_only) -> None:
         """Covers line 417: visit_BoolOp returns node when no gremlins produced.
 
         This happens when BoolOp uses operators that can't be mutated,
@@ -67,15 +76,14 @@ def check(a, b):
     return a and b
 """
         # Use only ComparisonOperator - it won't produce gremlins for BoolOp
-        operators = [ComparisonOperator()]
-        gremlins, _tree = transform_source(source, 'test.py', operators=operators)
+        gremlins, _tree = transform_source(source, 'test.py', operators=comparison_only)
 
         # With only comparison operator, no gremlins from 'and' expression
         # The BoolOp should return unchanged node (line 417)
         assert all(g.operator_name == 'comparison' for g in gremlins)
         # The 'and' expression should be unchanged in the tree
 
-    def test_visit_return_returns_unchanged_when_no_gremlins(self) -> None:
+    def test_visit_return_returns_unchanged_when_no_gremlins(self, comparison_only) -> None:
         """Covers line 448: visit_Return returns node when no gremlins produced.
 
         Return statements with no value (bare return) don't produce gremlins
@@ -86,8 +94,7 @@ def do_nothing():
     return
 """
         # Use only comparison operator - it won't produce gremlins for bare return
-        operators = [ComparisonOperator()]
-        gremlins, _tree = transform_source(source, 'test.py', operators=operators)
+        gremlins, _tree = transform_source(source, 'test.py', operators=comparison_only)
 
         # No gremlins should be produced from bare return with comparison operator
         assert len(gremlins) == 0
@@ -103,9 +110,7 @@ class TestMutationSwitchingTransformerPrivateMethods:
         This is a wrapper method that's used internally. We call it directly
         to ensure coverage.
         """
-        source = 'x >= 10'
-        tree = ast.parse(source, mode='eval')
-        compare_node = tree.body
+        compare_node = _COMPARE_GE_10
         assert isinstance(compare_node, ast.Compare)
 
         transformer = MutationSwitchingTransformer('test.py')
@@ -0,0 +1,25 @@
+"""Shared fixtures for operator tests.
+
+Operators deep-copy a node before changing it, so tests can share a single
+parsed node per source string instead of parsing it again in every test.
+"""
+
+from __future__ import annotations
+
+import ast
+
+import pytest
+
+
+class _ParsedExpressions(dict[str, ast.expr]):
+    """Expression nodes keyed by source, parsed on first lookup."""
+
+    def __missing__(self, source: str) -> ast.expr:
+        node = self[source] = ast.parse(source, mode='eval').body
+        return node
+
+
+@pytest.fixture(scope='session')
+def parsed_exprs() -> dict[str, ast.expr]:
+    """Parsed expression nodes shared by every operator test."""
+    return _ParsedExpressions()
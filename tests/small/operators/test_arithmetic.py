@@ -10,76 +10,73 @@ from pytest_gremlins.operators.arithmetic import ArithmeticOperator
 from pytest_gremlins.operators.protocol import GremlinOperator
 
 
+# Operator nodes have no fields, so the symbol tests reuse one of each.
+_SYMBOLS = (
+    (ast.Add(), '+'),
+    (ast.Sub(), '-'),
+    (ast.Mult(), '*'),
+    (ast.Div(), '/'),
+    (ast.FloorDiv(), '//'),
+    (ast.Mod(), '%'),
+    (ast.Pow(), '**'),
+)
+_UNSUPPORTED_OP = ast.BitAnd()
+
+
+@pytest.fixture(scope='module')
+def operator():
+    """One ArithmeticOperator shared by every test in this module."""
+    return ArithmeticOperator()
+
+
 class TestArithmeticOperatorProtocol:
     """Test that ArithmeticOperator implements the GremlinOperator protocol."""
 
-    def test_implements_gremlin_operator_protocol(self):
-        operator = ArithmeticOperator()
+    def test_implements_gremlin_operator_protocol(self, operator):
         assert isinstance(operator, GremlinOperator)
 
-    def test_name_is_arithmetic(self):
-        operator = ArithmeticOperator()
+    def test_name_is_arithmetic(self, operator):
         assert operator.name == 'arithmetic'
 
-    def test_description_describes_the_operator(self):
-        operator = ArithmeticOperator()
+    def test_description_describes_the_operator(self, operator):
         assert 'arithmetic' in operator.description.lower()
 
 
 class TestArithmeticOperatorCanMutate:
     """Test the can_mutate method."""
 
-    def test_returns_true_for_binop_add(self):
-        operator = ArithmeticOperator()
-        node = ast.parse('x + 10', mode='eval').body
-
-        assert operator.can_mutate(node) is True
-
     @pytest.mark.parametrize(
-        'source',
+        ('source', 'expected'),
         [
-            'x + y',
-            'x - y',
-            'x * y',
-            'x / y',
-            'x // y',
-            'x % y',
-            'x ** y',
+            ('x + y', True),
+            ('x - y', True),
+            ('x * y', True),
+            ('x / y', True),
+            ('x // y', True),
+            ('x % y', True),
+            ('x ** y', True),
+            ('x + 10', True),
+            ('x < 10', False),
+            # Bitwise operators are BinOps but not arithmetic
+            ('x & y', False),
         ],
     )
-    def test_returns_true_for_all_supported_operations(self, source):
-        operator = ArithmeticOperator()
-        node = ast.parse(source, mode='eval').body
-
-        assert operator.can_mutate(node) is True
-
-    def test_returns_false_for_comparison_node(self):
-        operator = ArithmeticOperator()
-        node = ast.parse('x < 10', mode='eval').body
-
-        assert operator.can_mutate(node) is False
-
-    def test_returns_false_for_bitwise_operations(self):
-        operator = ArithmeticOperator()
-        node = ast.parse('x & y', mode='eval').body
-
-        assert operator.can_mutate(node) is False
+    def test_can_mutate(self, operator, parsed_exprs, source, expected):
+        assert operator.can_mutate(parsed_exprs[source]) is expected
 
 
 class TestArithmeticOperatorMutate:
     """Test the mutate method."""
 
-    def test_add_generates_one_mutation(self):
-        operator = ArithmeticOperator()
-        node = ast.parse('x + 10', mode='eval').body
+    def test_add_generates_one_mutation(self, operator, parsed_exprs):
+        node = parsed_exprs['x + 10']
 
         mutations = operator.mutate(node)
 
         assert len(mutations) == 1
 
-    def test_add_mutates_to_subtract(self):
-        operator = ArithmeticOperator()
-        node = ast.parse('x + 10', mode='eval').body
+    def test_add_mutates_to_subtract(self, operator, parsed_exprs):
+        node = parsed_exprs['x + 10']
 
         mutations = operator.mutate(node)
 
@@ -99,9 +96,8 @@ class TestArithmeticOperatorMutate:
             ('x ** y', [ast.Mult]),
         ],
     )
-    def test_all_arithmetic_mutations(self, source, expected_ops):
-        operator = ArithmeticOperator()
-        node = ast.parse(source, mode='eval').body
+    def test_all_arithmetic_mutations(self, operator, parsed_exprs, source, expected_ops):
+        node = parsed_exprs[source]
 
         mutations = operator.mutate(node)
 
@@ -111,8 +107,7 @@ class TestArithmeticOperatorMutate:
             actual_ops.append(type(m.op))
         assert actual_ops == expected_ops
 
-    def test_original_node_is_not_modified(self):
-        operator = ArithmeticOperator()
+    def test_original_node_is_not_modified(self, operator):
         node = ast.parse('x + 10', mode='eval').body
         assert isinstance(node, ast.BinOp)
         original_op_type = type(node.op)
@@ -121,18 +116,16 @@ class TestArithmeticOperatorMutate:
 
         assert isinstance(node.op, original_op_type)
 
-    def test_returns_empty_list_for_unsupported_node(self):
-        operator = ArithmeticOperator()
-        node = ast.parse('x < 10', mode='eval').body
+    def test_returns_empty_list_for_unsupported_node(self, operator, parsed_exprs):
+        node = parsed_exprs['x < 10']
 
         mutations = operator.mutate(node)
 
         assert mutations == []
 
-    def test_returns_empty_list_for_binop_with_unsupported_operator(self):
-        operator = ArithmeticOperator()
+    def test_returns_empty_list_for_binop_with_unsupported_operator(self, operator, parsed_exprs):
         # BitAnd (&) is a BinOp but not an arithmetic operator we mutate
-        node = ast.parse('x & y', mode='eval').body
+        node = parsed_exprs['x & y']
         assert isinstance(node, ast.BinOp)
         assert isinstance(node.op, ast.BitAnd)
 
@@ -144,18 +137,9 @@ class TestArithmeticOperatorMutate:
 class TestArithmeticOperatorSymbols:
     """Test the operator symbol mapping."""
 
-    def test_get_symbol_for_all_supported_ops(self):
-        operator = ArithmeticOperator()
-
-        assert operator.get_symbol(ast.Add()) == '+'
-        assert operator.get_symbol(ast.Sub()) == '-'
-        assert operator.get_symbol(ast.Mult()) == '*'
-        assert operator.get_symbol(ast.Div()) == '/'
-        assert operator.get_symbol(ast.FloorDiv()) == '//'
-        assert operator.get_symbol(ast.Mod()) == '%'
-        assert operator.get_symbol(ast.Pow()) == '**'
-
-    def test_get_symbol_returns_question_mark_for_unknown_op(self):
-        operator = ArithmeticOperator()
+    def test_get_symbol_for_all_supported_ops(self, operator):
+        for op, symbol in _SYMBOLS:
+            assert operator.get_symbol(op) == symbol
 
-        assert operator.get_symbol(ast.BitAnd()) == '?'
+    def test_get_symbol_returns_question_mark_for_unknown_op(self, operator):
+        assert operator.get_symbol(_UNSUPPORTED_OP) == '?'
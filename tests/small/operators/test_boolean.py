@@ -4,90 +4,57 @@ from __future__ import annotations
 
 import ast
 
+import pytest
+
 from pytest_gremlins.operators.boolean import BooleanOperator
 from pytest_gremlins.operators.protocol import GremlinOperator
 
 
+@pytest.fixture(scope='module')
+def operator():
+    """One BooleanOperator shared by every test in this module."""
+    return BooleanOperator()
+
+
 class TestBooleanOperatorProtocol:
     """Test that BooleanOperator implements the GremlinOperator protocol."""
 
-    def test_implements_gremlin_operator_protocol(self):
-        operator = BooleanOperator()
+    def test_implements_gremlin_operator_protocol(self, operator):
         assert isinstance(operator, GremlinOperator)
 
-    def test_name_is_boolean(self):
-        operator = BooleanOperator()
+    def test_name_is_boolean(self, operator):
         assert operator.name == 'boolean'
 
-    def test_description_describes_the_operator(self):
-        operator = BooleanOperator()
+    def test_description_describes_the_operator(self, operator):
         assert 'boolean' in operator.description.lower()
 
 
 class TestBooleanOperatorCanMutate:
     """Test the can_mutate method."""
 
-    def test_returns_true_for_boolop_and(self):
-        operator = BooleanOperator()
-        node = ast.parse('x and y', mode='eval').body
-
-        assert operator.can_mutate(node) is True
-
-    def test_returns_true_for_boolop_or(self):
-        operator = BooleanOperator()
-        node = ast.parse('x or y', mode='eval').body
-
-        assert operator.can_mutate(node) is True
-
-    def test_returns_true_for_unaryop_not(self):
-        operator = BooleanOperator()
-        node = ast.parse('not x', mode='eval').body
-
-        assert operator.can_mutate(node) is True
-
-    def test_returns_true_for_constant_true(self):
-        operator = BooleanOperator()
-        node = ast.parse('True', mode='eval').body
-
-        assert operator.can_mutate(node) is True
-
-    def test_returns_true_for_constant_false(self):
-        operator = BooleanOperator()
-        node = ast.parse('False', mode='eval').body
-
-        assert operator.can_mutate(node) is True
-
-    def test_returns_false_for_comparison_node(self):
-        operator = BooleanOperator()
-        node = ast.parse('x < 10', mode='eval').body
-
-        assert operator.can_mutate(node) is False
-
-    def test_returns_false_for_arithmetic_node(self):
-        operator = BooleanOperator()
-        node = ast.parse('x + 10', mode='eval').body
-
-        assert operator.can_mutate(node) is False
-
-    def test_returns_false_for_unaryop_negative(self):
-        operator = BooleanOperator()
-        node = ast.parse('-x', mode='eval').body
-
-        assert operator.can_mutate(node) is False
-
-    def test_returns_false_for_non_boolean_constant(self):
-        operator = BooleanOperator()
-        node = ast.parse('42', mode='eval').body
-
-        assert operator.can_mutate(node) is False
+    @pytest.mark.parametrize(
+        ('source', 'expected'),
+        [
+            ('x and y', True),
+            ('x or y', True),
+            ('not x', True),
+            ('True', True),
+            ('False', True),
+            ('x < 10', False),
+            ('x + 10', False),
+            ('-x', False),
+            ('42', False),
+        ],
+    )
+    def test_can_mutate(self, operator, parsed_exprs, source, expected):
+        assert operator.can_mutate(parsed_exprs[source]) is expected
 
 
 class TestBooleanOperatorMutate:
     """Test the mutate method."""
 
-    def test_and_mutates_to_or(self):
-        operator = BooleanOperator()
-        node = ast.parse('x and y', mode='eval').body
+    def test_and_mutates_to_or(self, operator, parsed_exprs):
+        node = parsed_exprs['x and y']
 
         mutations = operator.mutate(node)
 
@@ -96,9 +63,8 @@ class TestBooleanOperatorMutate:
         assert isinstance(mutation, ast.BoolOp)
         assert isinstance(mutation.op, ast.Or)
 
-    def test_or_mutates_to_and(self):
-        operator = BooleanOperator()
-        node = ast.parse('x or y', mode='eval').body
+    def test_or_mutates_to_and(self, operator, parsed_exprs):
+        node = parsed_exprs['x or y']
 
         mutations = operator.mutate(node)
 
@@ -107,9 +73,8 @@ class TestBooleanOperatorMutate:
         assert isinstance(mutation, ast.BoolOp)
         assert isinstance(mutation.op, ast.And)
 
-    def test_not_x_mutates_to_x(self):
-        operator = BooleanOperator()
-        node = ast.parse('not x', mode='eval').body
+    def test_not_x_mutates_to_x(self, operator, parsed_exprs):
+        node = parsed_exprs['not x']
 
         mutations = operator.mutate(node)
 
@@ -117,9 +82,8 @@ class TestBooleanOperatorMutate:
         assert isinstance(mutations[0], ast.Name)
         assert mutations[0].id == 'x'
 
-    def test_true_mutates_to_false(self):
-        operator = BooleanOperator()
-        node = ast.parse('True', mode='eval').body
+    def test_true_mutates_to_false(self, operator, parsed_exprs):
+        node = parsed_exprs['True']
 
         mutations = operator.mutate(node)
 
@@ -127,9 +91,8 @@ class TestBooleanOperatorMutate:
         assert isinstance(mutations[0], ast.Constant)
         assert mutations[0].value is False
 
-    def test_false_mutates_to_true(self):
-        operator = BooleanOperator()
-        node = ast.parse('False', mode='eval').body
+    def test_false_mutates_to_true(self, operator, parsed_exprs):
+        node = parsed_exprs['False']
 
         mutations = operator.mutate(node)
 
@@ -137,8 +100,7 @@ class TestBooleanOperatorMutate:
         assert isinstance(mutations[0], ast.Constant)
         assert mutations[0].value is True
 
-    def test_original_node_is_not_modified(self):
-        operator = BooleanOperator()
+    def test_original_node_is_not_modified(self, operator):
         node = ast.parse('x and y', mode='eval').body
         assert isinstance(node, ast.BoolOp)
         original_op_type = type(node.op)
@@ -147,9 +109,8 @@ class TestBooleanOperatorMutate:
 
         assert isinstance(node.op, original_op_type)
 
-    def test_returns_empty_list_for_unsupported_node(self):
-        operator = BooleanOperator()
-        node = ast.parse('x < 10', mode='eval').body
+    def test_returns_empty_list_for_unsupported_node(self, operator, parsed_exprs):
+        node = parsed_exprs['x < 10']
 
         mutations = operator.mutate(node)
 
@@ -4,100 +4,65 @@ from __future__ import annotations
 
 import ast
 
+import pytest
+
 from pytest_gremlins.operators.boundary import BoundaryOperator
 from pytest_gremlins.operators.protocol import GremlinOperator
 
 
+@pytest.fixture(scope='module')
+def operator():
+    """One BoundaryOperator shared by every test in this module."""
+    return BoundaryOperator()
+
+
 class TestBoundaryOperatorProtocol:
     """Test that BoundaryOperator implements the GremlinOperator protocol."""
 
-    def test_implements_gremlin_operator_protocol(self):
-        operator = BoundaryOperator()
+    def test_implements_gremlin_operator_protocol(self, operator):
         assert isinstance(operator, GremlinOperator)
 
-    def test_name_is_boundary(self):
-        operator = BoundaryOperator()
+    def test_name_is_boundary(self, operator):
         assert operator.name == 'boundary'
 
-    def test_description_describes_the_operator(self):
-        operator = BoundaryOperator()
+    def test_description_describes_the_operator(self, operator):
         assert 'boundary' in operator.description.lower()
 
 
 class TestBoundaryOperatorCanMutate:
     """Test the can_mutate method."""
 
-    def test_returns_true_for_comparison_with_integer_literal(self):
-        operator = BoundaryOperator()
-        node = ast.parse('x >= 18', mode='eval').body
-
-        assert operator.can_mutate(node) is True
-
-    def test_returns_true_for_comparison_with_zero(self):
-        operator = BoundaryOperator()
-        node = ast.parse('len(s) > 0', mode='eval').body
-
-        assert operator.can_mutate(node) is True
-
-    def test_returns_false_for_comparison_with_non_integer(self):
-        operator = BoundaryOperator()
-        node = ast.parse('x < "hello"', mode='eval').body
-
-        assert operator.can_mutate(node) is False
-
-    def test_returns_false_for_comparison_without_constant(self):
-        operator = BoundaryOperator()
-        node = ast.parse('x < y', mode='eval').body
-
-        assert operator.can_mutate(node) is False
-
-    def test_returns_false_for_arithmetic_node(self):
-        operator = BoundaryOperator()
-        node = ast.parse('x + 10', mode='eval').body
-
-        assert operator.can_mutate(node) is False
-
-    def test_returns_false_for_float_constant(self):
-        operator = BoundaryOperator()
-        node = ast.parse('x < 3.14', mode='eval').body
-
-        assert operator.can_mutate(node) is False
-
-    def test_returns_true_for_integer_constant_on_left_side(self):
-        operator = BoundaryOperator()
-        node = ast.parse('18 <= x', mode='eval').body
-
-        assert operator.can_mutate(node) is True
-
-    def test_returns_false_for_boolean_true_on_left_side(self):
-        operator = BoundaryOperator()
-        # True is technically an int subclass but should not be mutated
-        node = ast.parse('True < x', mode='eval').body
-
-        assert operator.can_mutate(node) is False
-
-    def test_returns_false_for_boolean_false_in_comparators(self):
-        operator = BoundaryOperator()
-        # False is technically an int subclass but should not be mutated
-        node = ast.parse('x < False', mode='eval').body
-
-        assert operator.can_mutate(node) is False
+    @pytest.mark.parametrize(
+        ('source', 'expected'),
+        [
+            ('x >= 18', True),
+            ('len(s) > 0', True),
+            ('18 <= x', True),
+            ('x < "hello"', False),
+            ('x < y', False),
+            ('x + 10', False),
+            ('x < 3.14', False),
+            # True and False are int subclasses but should not be mutated
+            ('True < x', False),
+            ('x < False', False),
+        ],
+    )
+    def test_can_mutate(self, operator, parsed_exprs, source, expected):
+        assert operator.can_mutate(parsed_exprs[source]) is expected
 
 
 class TestBoundaryOperatorMutate:
     """Test the mutate method."""
 
-    def test_integer_generates_two_mutations(self):
-        operator = BoundaryOperator()
-        node = ast.parse('x >= 18', mode='eval').body
+    def test_integer_generates_two_mutations(self, operator, parsed_exprs):
+        node = parsed_exprs['x >= 18']
 
         mutations = operator.mutate(node)
 
         assert len(mutations) == 2
 
-    def test_mutates_to_plus_one_and_minus_one(self):
-        operator = BoundaryOperator()
-        node = ast.parse('x >= 18', mode='eval').body
+    def test_mutates_to_plus_one_and_minus_one(self, operator, parsed_exprs):
+        node = parsed_exprs['x >= 18']
 
         mutations = operator.mutate(node)
 
@@ -110,9 +75,8 @@ class TestBoundaryOperatorMutate:
         assert 17 in values
         assert 19 in values
 
-    def test_mutates_zero_to_minus_one_and_one(self):
-        operator = BoundaryOperator()
-        node = ast.parse('x > 0', mode='eval').body
+    def test_mutates_zero_to_minus_one_and_one(self, operator, parsed_exprs):
+        node = parsed_exprs['x > 0']
 
         mutations = operator.mutate(node)
 
@@ -125,8 +89,7 @@ class TestBoundaryOperatorMutate:
         assert -1 in values
         assert 1 in values
 
-    def test_original_node_is_not_modified(self):
-        operator = BoundaryOperator()
+    def test_original_node_is_not_modified(self, operator):
         node = ast.parse('x >= 18', mode='eval').body
         assert isinstance(node, ast.Compare)
         comparator = node.comparators[0]
@@ -138,17 +101,15 @@ class TestBoundaryOperatorMutate:
         assert isinstance(node.comparators[0], ast.Constant)
         assert node.comparators[0].value == original_value
 
-    def test_returns_empty_list_for_unsupported_node(self):
-        operator = BoundaryOperator()
-        node = ast.parse('x + 10', mode='eval').body
+    def test_returns_empty_list_for_unsupported_node(self, operator, parsed_exprs):
+        node = parsed_exprs['x + 10']
 
         mutations = operator.mutate(node)
 
         assert mutations == []
 
-    def test_mutates_left_side_integer_constant(self):
-        operator = BoundaryOperator()
-        node = ast.parse('18 <= x', mode='eval').body
+    def test_mutates_left_side_integer_constant(self, operator, parsed_exprs):
+        node = parsed_exprs['18 <= x']
 
         mutations = operator.mutate(node)
 
@@ -162,19 +123,17 @@ class TestBoundaryOperatorMutate:
         assert 17 in values
         assert 19 in values
 
-    def test_mutates_chained_comparison_with_multiple_integer_constants(self):
-        operator = BoundaryOperator()
-        node = ast.parse('0 < x < 10', mode='eval').body
+    def test_mutates_chained_comparison_with_multiple_integer_constants(self, operator, parsed_exprs):
+        node = parsed_exprs['0 < x < 10']
 
         mutations = operator.mutate(node)
 
         # Should have 4 mutations: 0->-1, 0->1, 10->9, 10->11
         assert len(mutations) == 4
 
-    def test_mutate_chained_comparison_with_non_integer_comparator(self):
-        operator = BoundaryOperator()
+    def test_mutate_chained_comparison_with_non_integer_comparator(self, operator, parsed_exprs):
         # 10 < x < y - only left side integer constant
-        node = ast.parse('10 < x < y', mode='eval').body
+        node = parsed_exprs['10 < x < y']
 
         mutations = operator.mutate(node)
 
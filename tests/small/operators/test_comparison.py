@@ -10,81 +10,70 @@ from pytest_gremlins.operators.comparison import ComparisonOperator
 from pytest_gremlins.operators.protocol import GremlinOperator
 
 
+# Operator nodes have no fields, so the symbol tests reuse one of each.
+_SYMBOLS = (
+    (ast.Lt(), '<'),
+    (ast.LtE(), '<='),
+    (ast.Gt(), '>'),
+    (ast.GtE(), '>='),
+    (ast.Eq(), '=='),
+    (ast.NotEq(), '!='),
+)
+_UNSUPPORTED_OP = ast.Is()
+
+
+@pytest.fixture(scope='module')
+def operator():
+    """One ComparisonOperator shared by every test in this module."""
+    return ComparisonOperator()
+
+
 class TestComparisonOperatorProtocol:
     """Test that ComparisonOperator implements the GremlinOperator protocol."""
 
-    def test_implements_gremlin_operator_protocol(self):
-        operator = ComparisonOperator()
+    def test_implements_gremlin_operator_protocol(self, operator):
         assert isinstance(operator, GremlinOperator)
 
-    def test_name_is_comparison(self):
-        operator = ComparisonOperator()
+    def test_name_is_comparison(self, operator):
         assert operator.name == 'comparison'
 
-    def test_description_describes_the_operator(self):
-        operator = ComparisonOperator()
+    def test_description_describes_the_operator(self, operator):
         assert 'comparison' in operator.description.lower()
 
 
 class TestComparisonOperatorCanMutate:
     """Test the can_mutate method."""
 
-    def test_returns_true_for_compare_node_with_less_than(self):
-        operator = ComparisonOperator()
-        node = ast.parse('x < 10', mode='eval').body
-
-        assert operator.can_mutate(node) is True
-
     @pytest.mark.parametrize(
-        'source',
+        ('source', 'expected'),
         [
-            'x < 10',
-            'x <= 10',
-            'x > 10',
-            'x >= 10',
-            'x == 10',
-            'x != 10',
+            ('x < 10', True),
+            ('x <= 10', True),
+            ('x > 10', True),
+            ('x >= 10', True),
+            ('x == 10', True),
+            ('x != 10', True),
+            ('x + 10', False),
+            ('x is None', False),
+            ('x in items', False),
         ],
     )
-    def test_returns_true_for_all_supported_comparisons(self, source):
-        operator = ComparisonOperator()
-        node = ast.parse(source, mode='eval').body
-
-        assert operator.can_mutate(node) is True
-
-    def test_returns_false_for_non_compare_node(self):
-        operator = ComparisonOperator()
-        node = ast.parse('x + 10', mode='eval').body
-
-        assert operator.can_mutate(node) is False
-
-    def test_returns_false_for_unsupported_comparison_is(self):
-        operator = ComparisonOperator()
-        node = ast.parse('x is None', mode='eval').body
-
-        assert operator.can_mutate(node) is False
-
-    def test_returns_false_for_unsupported_comparison_in(self):
-        operator = ComparisonOperator()
-        node = ast.parse('x in items', mode='eval').body
-
-        assert operator.can_mutate(node) is False
+    def test_can_mutate(self, operator, parsed_exprs, source, expected):
+        assert operator.can_mutate(parsed_exprs[source]) is expected
 
 
 class TestComparisonOperatorMutate:
     """Test the mutate method."""
 
-    def test_less_than_generates_two_mutations(self):
-        operator = ComparisonOperator()
-        node = ast.parse('x < 10', mode='eval').body
+    def test_less_than_generates_two_mutations(self, operator, parsed_exprs):
+        node = parsed_exprs['x < 10']
 
         mutations = operator.mutate(node)
 
         assert len(mutations) == 2
 
-    def test_less_than_mutates_to_less_than_or_equal_and_greater_than(self):
-        operator = ComparisonOperator()
-        node = ast.parse('x < 10', mode='eval').body
+    def test_less_than_mutates_to_less_than_or_equal_and_greater_than(self, operator, parsed_exprs):
+        node = parsed_exprs['x < 10']
 
         mutations = operator.mutate(node)
 
@@ -98,17 +87,16 @@ class TestComparisonOperatorMutate:
     @pytest.mark.parametrize(
         ('source', 'expected_ops'),
         [
-            ('x < 10', ['LtE', 'Gt']),
-            ('x <= 10', ['Lt', 'Gt']),
-            ('x > 10', ['GtE', 'Lt']),
-            ('x >= 10', ['Gt', 'Lt']),
-            ('x == 10', ['NotEq']),
-            ('x != 10', ['Eq']),
+            ('x < 10', ('LtE', 'Gt')),
+            ('x <= 10', ('Lt', 'Gt')),
+            ('x > 10', ('GtE', 'Lt')),
+            ('x >= 10', ('Gt', 'Lt')),
+            ('x == 10', ('NotEq',)),
+            ('x != 10', ('Eq',)),
         ],
     )
-    def test_all_comparison_mutations(self, source, expected_ops):
-        operator = ComparisonOperator()
-        node = ast.parse(source, mode='eval').body
+    def test_all_comparison_mutations(self, operator, parsed_exprs, source, expected_ops):
+        node = parsed_exprs[source]
 
         mutations = operator.mutate(node)
 
@@ -118,8 +106,7 @@ class TestComparisonOperatorMutate:
             actual_ops.append(m.ops[0].__class__.__name__)
         assert sorted(actual_ops) == sorted(expected_ops)
 
-    def test_original_node_is_not_modified(self):
-        operator = ComparisonOperator()
+    def test_original_node_is_not_modified(self, operator):
         node = ast.parse('x < 10', mode='eval').body
         assert isinstance(node, ast.Compare)
         original_op_type = type(node.ops[0])
@@ -128,24 +115,21 @@ class TestComparisonOperatorMutate:
 
         assert isinstance(node.ops[0], original_op_type)
 
-    def test_returns_empty_list_for_unsupported_node(self):
-        operator = ComparisonOperator()
-        node = ast.parse('x + 10', mode='eval').body
+    def test_returns_empty_list_for_unsupported_node(self, operator, parsed_exprs):
+        node = parsed_exprs['x + 10']
 
         mutations = operator.mutate(node)
 
         assert mutations == []
 
-    def test_chained_comparison_generates_mutations_for_each_operator(self):
-        operator = ComparisonOperator()
-        node = ast.parse('0 < x < 10', mode='eval').body
+    def test_chained_comparison_generates_mutations_for_each_operator(self, operator, parsed_exprs):
+        node = parsed_exprs['0 < x < 10']
 
         mutations = operator.mutate(node)
 
         assert len(mutations) == 4
 
-    def test_mutate_skips_unsupported_operators_in_chain(self):
-        operator = ComparisonOperator()
+    def test_mutate_skips_unsupported_operators_in_chain(self, operator):
         # x is None has an Is operator which we don't mutate
         # But we construct a chained comparison with both < and is
         # by manually creating the AST
@@ -168,17 +152,9 @@ class TestComparisonOperatorMutate:
 class TestComparisonOperatorSymbols:
     """Test the operator symbol mapping."""
 
-    def test_get_symbol_for_all_supported_ops(self):
-        operator = ComparisonOperator()
-
-        assert operator.get_symbol(ast.Lt()) == '<'
-        assert operator.get_symbol(ast.LtE()) == '<='
-        assert operator.get_symbol(ast.Gt()) == '>'
-        assert operator.get_symbol(ast.GtE()) == '>='
-        assert operator.get_symbol(ast.Eq()) == '=='
-        assert operator.get_symbol(ast.NotEq()) == '!='
-
-    def test_get_symbol_returns_question_mark_for_unknown_op(self):
-        operator = ComparisonOperator()
+    def test_get_symbol_for_all_supported_ops(self, operator):
+        for op, symbol in _SYMBOLS:
+            assert operator.get_symbol(op) == symbol
 
-        assert operator.get_symbol(ast.Is()) == '?'
+    def test_get_symbol_returns_question_mark_for_unknown_op(self, operator):
+        assert operator.get_symbol(_UNSUPPORTED_OP) == '?'
@@ -4,31 +4,35 @@ from __future__ import annotations
 
 import ast
 
+import pytest
+
 from pytest_gremlins.operators.protocol import GremlinOperator
 from pytest_gremlins.operators.return_value import ReturnOperator
 
 
+@pytest.fixture(scope='module')
+def operator():
+    """One ReturnOperator shared by every test in this module."""
+    return ReturnOperator()
+
+
 class TestReturnOperatorProtocol:
     """Test that ReturnOperator implements the GremlinOperator protocol."""
 
-    def test_implements_gremlin_operator_protocol(self):
-        operator = ReturnOperator()
+    def test_implements_gremlin_operator_protocol(self, operator):
         assert isinstance(operator, GremlinOperator)
 
-    def test_name_is_return(self):
-        operator = ReturnOperator()
+    def test_name_is_return(self, operator):
         assert operator.name == 'return'
 
-    def test_description_describes_the_operator(self):
-        operator = ReturnOperator()
+    def test_description_describes_the_operator(self, operator):
         assert 'return' in operator.description.lower()
 
 
 class TestReturnOperatorCanMutate:
     """Test the can_mutate method."""
 
-    def test_returns_true_for_return_with_value(self):
-        operator = ReturnOperator()
+    def test_returns_true_for_return_with_value(self, operator):
         source = """
 def foo():
     return 42
@@ -40,8 +44,7 @@ def foo():
 
         assert operator.can_mutate(return_node) is True
 
-    def test_returns_true_for_return_with_expression(self):
-        operator = ReturnOperator()
+    def test_returns_true_for_return_with_expression(self, operator):
         source = """
 def foo():
     return x + y
@@ -53,8 +56,7 @@ def foo():
 
         assert operator.can_mutate(return_node) is True
 
-    def test_returns_false_for_bare_return(self):
-        operator = ReturnOperator()
+    def test_returns_false_for_bare_return(self, operator):
         source = """
 def foo():
     return
@@ -66,8 +68,7 @@ def foo():
 
         assert operator.can_mutate(return_node) is False
 
-    def test_returns_false_for_return_none(self):
-        operator = ReturnOperator()
+    def test_returns_false_for_return_none(self, operator):
         source = """
 def foo():
     return None
@@ -79,9 +80,8 @@ def foo():
 
         assert operator.can_mutate(return_node) is False
 
-    def test_returns_false_for_non_return_node(self):
-        operator = ReturnOperator()
-        node = ast.parse('x + 10', mode='eval').body
+    def test_returns_false_for_non_return_node(self, operator, parsed_exprs):
+        node = parsed_exprs['x + 10']
 
         assert operator.can_mutate(node) is False
 
@@ -89,8 +89,7 @@ def foo():
 class TestReturnOperatorMutate:
     """Test the mutate method."""
 
-    def test_return_value_mutates_to_none(self):
-        operator = ReturnOperator()
+    def test_return_value_mutates_to_none(self, operator):
         source = """
 def foo():
     return 42
@@ -106,8 +105,7 @@ def foo():
         assert isinstance(mutations[0], ast.Return)
         assert mutations[0].value is None
 
-    def test_return_true_mutates_to_false(self):
-        operator = ReturnOperator()
+    def test_return_true_mutates_to_false(self, operator):
         source = """
 def foo():
     return True
@@ -131,8 +129,7 @@ def foo():
         assert None in mutation_values
         assert False in mutation_values
 
-    def test_return_false_mutates_to_true(self):
-        operator = ReturnOperator()
+    def test_return_false_mutates_to_true(self, operator):
         source = """
 def foo():
     return False
@@ -155,8 +152,7 @@ def foo():
         assert None in mutation_values
         assert True in mutation_values
 
-    def test_original_node_is_not_modified(self):
-        operator = ReturnOperator()
+    def test_original_node_is_not_modified(self, operator):
         source = """
 def foo():
     return 42
@@ -174,16 +170,14 @@ def foo():
         assert isinstance(return_node.value, ast.Constant)
         assert return_node.value.value == original_value
 
-    def test_returns_empty_list_for_unsupported_node(self):
-        operator = ReturnOperator()
-        node = ast.parse('x + 10', mode='eval').body
+    def test_returns_empty_list_for_unsupported_node(self, operator, parsed_exprs):
+        node = parsed_exprs['x + 10']
 
         mutations = operator.mutate(node)
 
         assert mutations == []
 
-    def test_returns_empty_list_for_bare_return(self):
-        operator = ReturnOperator()
+    def test_returns_empty_list_for_bare_return(self, operator):
         source = """
 def foo():
     return
@@ -197,8 +191,7 @@ def foo():
 
         assert mutations == []
 
-    def test_returns_empty_list_for_return_none(self):
-        operator = ReturnOperator()
+    def test_returns_empty_list_for_return_none(self, operator):
         source = """
 def foo():
     return None
@@ -212,8 +205,7 @@ def foo():
 
         assert mutations == []
 
-    def test_return_empty_list_mutates_to_list_with_none(self):
-        operator = ReturnOperator()
+    def test_return_empty_list_mutates_to_list_with_none(self, operator):
         source = """
 def foo():
     return []
@@ -10,8 +10,12 @@ from pathlib import Path
 import pytest
 
 from pytest_gremlins.plugin import (
+    GremlinSession,
     _add_source_file,
     _build_test_command,
+    _build_test_hashes_for_gremlin,
+    _get_frozen_test_hashes,
+    _get_test_file_hash,
     _make_node_ids_relative,
     _path_to_module_name,
     _should_include_file,
@@ -208,3 +212,111 @@ class TestBuildTestCommand:
         assert 'pytest' in result
         assert '-x' in result
         assert '--tb=no' in result
+
+
+@pytest.mark.small
+class TestLazyTestFileHashing:
+    """Tests for lazy test file hashing in _get_test_file_hash."""
+
+    def test_hashes_file_on_first_use_and_memoizes(self, tmp_path: Path) -> None:
+        """The first call hashes the file and stores the hash in the session."""
+        test_file = tmp_path / 'test_a.py'
+        test_file.write_text('def test_a(): pass\n')
+        session = GremlinSession(test_files=[test_file])
+
+        file_hash = _get_test_file_hash(test_file, session)
+
+        assert file_hash is not None
+        assert session.test_hashes == {str(test_file): file_hash}
+
+    def test_returns_memoized_hash_without_rereading(self, tmp_path: Path) -> None:
+        """A memoized hash is returned even after the file disappears."""
+        test_file = tmp_path / 'test_a.py'
+        test_file.write_text('def test_a(): pass\n')
+        session = GremlinSession(test_files=[test_file])
+        file_hash = _get_test_file_hash(test_file, session)
+        test_file.unlink()
+
+        assert _get_test_file_hash(test_file, session) == file_hash
+
+    def test_returns_none_for_missing_file(self, tmp_path: Path) -> None:
+        """A missing test file yields no hash."""
+        session = GremlinSession()
+
+        assert _get_test_file_hash(tmp_path / 'gone.py', session) is None
+
+    def test_only_files_of_selected_tests_are_hashed(self, tmp_path: Path) -> None:
+        """Building test hashes for a gremlin hashes only the files it needs."""
+        test_a = tmp_path / 'test_a.py'
+        test_b = tmp_path / 'test_b.py'
+        test_a.write_text('def test_a(): pass\n')
+        test_b.write_text('def test_b(): pass\n')
+        session = GremlinSession(
+            test_files=[test_a, test_b],
+            test_node_ids={'test_a': 'test_a.py::test_a', 'test_b': 'test_b.py::test_b'},
+        )
+
+        test_hashes = _build_test_hashes_for_gremlin(['test_a'], session)
+
+        assert list(test_hashes) == ['test_a']
+        assert list(session.test_hashes) == [str(test_a)]
+
+    def test_missing_first_match_falls_through_to_next_file(self, tmp_path: Path) -> None:
+        """A matching test file that no longer exists does not end the search."""
+        missing = tmp_path / 'old' / 'test_a.py'
+        present = tmp_path / 'new' / 'test_a.py'
+        present.parent.mkdir()
+        present.write_text('def test_a(): pass\n')
+        session = GremlinSession(test_files=[missing, present], test_node_ids={'test_a': 'test_a.py::test_a'})
+
+        test_hashes = _build_test_hashes_for_gremlin(['test_a'], session)
+
+        assert test_hashes == {'test_a': session.test_hashes[str(present)]}
+
+    def test_reuses_one_hasher_without_cache(self, tmp_path: Path) -> None:
+        """Without the incremental cache, one ContentHasher serves the whole session."""
+        test_a = tmp_path / 'test_a.py'
+        test_b = tmp_path / 'test_b.py'
+        test_a.write_text('def test_a(): pass\n')
+        test_b.write_text('def test_b(): pass\n')
+        session = GremlinSession(test_files=[test_a, test_b])
+
+        _get_test_file_hash(test_a, session)
+        hasher = session.hasher
+        _get_test_file_hash(test_b, session)
+
+        assert hasher is not None
+        assert session.hasher is hasher
+
+
+@pytest.mark.small
+class TestFrozenTestHashesReuse:
+    """Tests for sharing test hash snapshots across gremlins."""
+
+    def test_same_tests_share_one_snapshot(self, tmp_path: Path) -> None:
+        """Gremlins covered by the same tests get the same snapshot instance."""
+        test_a = tmp_path / 'test_a.py'
+        test_a.write_text('def test_a(): pass\n')
+        session = GremlinSession(test_files=[test_a], test_node_ids={'test_a': 'test_a.py::test_a'})
+
+        first = _get_frozen_test_hashes(['test_a'], session)
+        second = _get_frozen_test_hashes(['test_a'], session)
+
+        assert first is second
+        assert first.names == ('test_a',)
+
+    def test_different_tests_get_different_snapshots(self, tmp_path: Path) -> None:
+        """Distinct test sets are snapshotted separately."""
+        test_a = tmp_path / 'test_a.py'
+        test_b = tmp_path / 'test_b.py'
+        test_a.write_text('def test_a(): pass\n')
+        test_b.write_text('def test_b(): pass\n')
+        session = GremlinSession(
+            test_files=[test_a, test_b],
+            test_node_ids={'test_a': 'test_a.py::test_a', 'test_b': 'test_b.py::test_b'},
+        )
+
+        only_a = _get_frozen_test_hashes(['test_a'], session)
+        both = _get_frozen_test_hashes(['test_a', 'test_b'], session)
+
+        assert only_a.combined != both.combined